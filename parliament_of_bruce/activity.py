@@ -0,0 +1,184 @@
+"""Per-day session counts and streaks, kept up to date as sessions are recorded.
+
+An ActivityCalendar stores one counter per calendar day (local time) in a
+compact array starting at the first active day, together with the current
+run of consecutive active days and the longest run seen. Recording a
+session updates both in constant time, so streaks and yearly heatmaps never
+rescan the journal. An ActivityLog holds the overall calendar plus one per
+Bruce and is saved next to the data file.
+"""
+from array import array
+from datetime import date
+from typing import Dict, List, Optional, Sequence
+from .timeutil import local_day
+
+
+FORMAT_VERSION = 1
+
+MAX_DAY_COUNT = 0xFFFF
+
+
+class ActivityCalendar:
+    """Session counts per day with incrementally maintained streaks."""
+
+    def __init__(self):
+        self.origin: Optional[int] = None  # ordinal of counts[0]
+        self.counts = array("H")
+        self.run_end: Optional[int] = None  # ordinal of the latest active day
+        self.run_length = 0
+        self.longest = 0
+        self.longest_end: Optional[int] = None
+
+    def record(self, day: date) -> None:
+        """Count one session on `day`."""
+        ordinal = day.toordinal()
+        if self.origin is None:
+            self.origin = ordinal
+        elif ordinal < self.origin:
+            self.counts[0:0] = array("H", [0] * (self.origin - ordinal))
+            self.origin = ordinal
+
+        index = ordinal - self.origin
+        if index >= len(self.counts):
+            self.counts.extend([0] * (index + 1 - len(self.counts)))
+        first_today = self.counts[index] == 0
+        self.counts[index] = min(self.counts[index] + 1, MAX_DAY_COUNT)
+        if not first_today:
+            return
+
+        if self.run_end is None or ordinal > self.run_end + 1:
+            self.run_end, self.run_length = ordinal, 1
+        elif ordinal == self.run_end + 1:
+            self.run_end, self.run_length = ordinal, self.run_length + 1
+        else:
+            # A backdated session can join runs anywhere; rescan once
+            self._rescan()
+            return
+        if self.run_length > self.longest:
+            self.longest, self.longest_end = self.run_length, self.run_end
+
+    def _rescan(self) -> None:
+        """Recompute runs from the counters."""
+        self.run_end, self.run_length = None, 0
+        self.longest, self.longest_end = 0, None
+        run = 0
+        for index, count in enumerate(self.counts):
+            run = run + 1 if count else 0
+            if run:
+                self.run_end, self.run_length = self.origin + index, run
+                if run > self.longest:
+                    self.longest, self.longest_end = run, self.origin + index
+
+    def count(self, day: date) -> int:
+        """Sessions recorded on `day`."""
+        if self.origin is None:
+            return 0
+        index = day.toordinal() - self.origin
+        return self.counts[index] if 0 <= index < len(self.counts) else 0
+
+    def counts_between(self, first: date, last: date) -> List[int]:
+        """Per-day counts from `first` to `last` inclusive."""
+        start, end = first.toordinal(), last.toordinal() + 1
+        if self.origin is None:
+            return [0] * (end - start)
+        lo, hi = max(start, self.origin), min(end, self.origin + len(self.counts))
+        if lo >= hi:
+            return [0] * (end - start)
+        return [0] * (lo - start) + self.counts[lo - self.origin:hi - self.origin].tolist() + [0] * (end - hi)
+
+    @property
+    def active_days(self) -> int:
+        return sum(1 for count in self.counts if count)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+
+    def current_streak(self, today: Optional[date] = None) -> int:
+        """Consecutive active days ending today (0 if there is no session today)."""
+        today = today or date.today()
+        return self.run_length if self.run_end == today.toordinal() else 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "origin": self.origin,
+            "counts": self.counts.tolist(),
+            "run": [self.run_end, self.run_length],
+            "longest": [self.longest_end, self.longest],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ActivityCalendar":
+        calendar = cls()
+        calendar.origin = data["origin"]
+        calendar.counts = array("H", data["counts"])
+        calendar.run_end, calendar.run_length = data["run"]
+        calendar.longest_end, calendar.longest = data["longest"]
+        return calendar
+
+
+class ActivityLog:
+    """The overall activity calendar plus one per Bruce ID."""
+
+    def __init__(self):
+        self.overall = ActivityCalendar()
+        self.bruces: Dict[str, ActivityCalendar] = {}
+        self.entry_count = 0
+        self.last_id: Optional[str] = None
+
+    @classmethod
+    def from_entries(cls, entries) -> "ActivityLog":
+        log = cls()
+        for entry in entries:
+            log.add_entry(entry)
+        return log
+
+    def add_entry(self, entry) -> None:
+        """Count a journal entry on its local calendar day."""
+        day = local_day(entry.epoch)
+        self.overall.record(day)
+        if entry.reigning_bruce_id is not None:
+            calendar = self.bruces.get(entry.reigning_bruce_id)
+            if calendar is None:
+                calendar = self.bruces[entry.reigning_bruce_id] = ActivityCalendar()
+            calendar.record(day)
+        self.entry_count += 1
+        self.last_id = entry.id
+
+    def for_bruce(self, bruce_id: Optional[str]) -> ActivityCalendar:
+        """A Bruce's calendar (empty if it has no sessions)."""
+        return self.bruces.get(bruce_id) or ActivityCalendar()
+
+    def catch_up(self, entries: Sequence) -> bool:
+        """Count entries written since this log was saved.
+
+        Returns False when the log does not describe a prefix of the journal
+        and must be rebuilt.
+        """
+        count = self.entry_count
+        if count > len(entries) or (count and entries[count - 1].id != self.last_id):
+            return False
+        for entry in entries[count:]:
+            self.add_entry(entry)
+        return True
+
+    def to_dict(self) -> Dict:
+        return {
+            "format": FORMAT_VERSION,
+            "entry_count": self.entry_count,
+            "last_id": self.last_id,
+            "overall": self.overall.to_dict(),
+            "bruces": {bruce_id: calendar.to_dict() for bruce_id, calendar in self.bruces.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> Optional["ActivityLog"]:
+        """Rebuild a log from to_dict() output, or None if it is unusable."""
+        if data.get("format") != FORMAT_VERSION:
+            return None
+        log = cls()
+        log.entry_count = data["entry_count"]
+        log.last_id = data["last_id"]
+        log.overall = ActivityCalendar.from_dict(data["overall"])
+        log.bruces = {bruce_id: ActivityCalendar.from_dict(item) for bruce_id, item in data["bruces"].items()}
+        return log
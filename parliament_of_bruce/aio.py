@@ -0,0 +1,108 @@
+"""Asyncio front end for ParliamentService, for embedding in async applications.
+
+Every method that writes to disk runs the synchronous service call in a
+worker thread (``asyncio.to_thread``), so file I/O never blocks the event
+loop. Calls that touch the shared state are serialized by an asyncio lock,
+which keeps one writer at a time without holding up tasks that are only
+waiting on their own callbacks. Collecting a session's responses does not
+touch stored state, so any number of sessions can be collected concurrently
+and recorded as each one finishes::
+
+    service = await AsyncParliamentService.open()
+
+    async def ask(seat_key, seat_name, prompt, round_num, is_first_round):
+        return await chat.ask(seat_name, prompt) if is_first_round else None
+
+    permanent, temporary = await service.collect_rotating_session_responses("daily", ask)
+    entry = await service.create_session("daily", permanent, temporary)
+"""
+import asyncio
+import inspect
+from typing import Dict, List, Optional, Tuple
+from .models import Decision, JournalEntry, ReigningBruce, TemporaryBruce
+from .services import ParliamentService
+from .storage import Storage
+
+
+class AsyncParliamentService:
+    """Async wrapper around a ParliamentService."""
+
+    def __init__(self, service: ParliamentService):
+        self.service = service
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def open(cls, storage: Optional[Storage] = None) -> "AsyncParliamentService":
+        """Load the parliament state off the event loop."""
+        service = await asyncio.to_thread(ParliamentService, storage or Storage())
+        return cls(service)
+
+    @property
+    def state(self):
+        return self.service.state
+
+    async def _write(self, method, *args, **kwargs):
+        """Run a state-changing service call in a worker thread, one at a time."""
+        async with self._lock:
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+    async def _read(self, method, *args, **kwargs):
+        """Run an in-memory service call without racing a write in progress."""
+        async with self._lock:
+            return method(*args, **kwargs)
+
+    async def collect_rotating_session_responses(self, session_type: str, collect_callback) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Collect responses with a rotating discussion, awaiting the callback for each seat.
+
+        collect_callback takes the same keyword arguments as the synchronous
+        version and may be a coroutine function or a plain function.
+        """
+        rotation = self.service.rotate_session(session_type)
+        try:
+            async with self._lock:
+                prompt = next(rotation)  # reads the current seats
+            while True:
+                response = collect_callback(**prompt)
+                if inspect.isawaitable(response):
+                    response = await response
+                prompt = rotation.send(response)
+        except StopIteration as done:
+            return done.value
+
+    async def create_session(self, session_type: str, responses: Dict[str, str], temp_bruce_responses: Optional[Dict[str, str]] = None) -> JournalEntry:
+        return await self._write(self.service.create_session, session_type, responses, temp_bruce_responses)
+
+    async def vote_on_decision(self, topic: str, options: List[str], votes: Dict[str, str], entry_id: Optional[str] = None) -> Decision:
+        return await self._write(self.service.vote_on_decision, topic, options, votes, entry_id)
+
+    async def decide_batch(self, items: List[Tuple[str, List[str], Dict[str, str]]], entry_id: Optional[str] = None) -> List[Decision]:
+        return await self._write(self.service.decide_batch, items, entry_id)
+
+    async def create_reigning_bruce(self, name: str, reason: str) -> ReigningBruce:
+        return await self._write(self.service.create_reigning_bruce, name, reason)
+
+    async def end_reigning_bruce(self, exit_report: str) -> None:
+        return await self._write(self.service.end_reigning_bruce, exit_report)
+
+    async def add_temporary_bruce(self, name: str, description: str, ttl_days: Optional[float] = None,
+                                  max_sessions: Optional[int] = None) -> TemporaryBruce:
+        return await self._write(self.service.add_temporary_bruce, name, description, ttl_days, max_sessions)
+
+    async def dismiss_temporary_bruce(self, temp_id: str) -> bool:
+        return await self._write(self.service.dismiss_temporary_bruce, temp_id)
+
+    async def update_temporary_bruce_statement(self, temp_id: str, statement: str) -> bool:
+        return await self._write(self.service.update_temporary_bruce_statement, temp_id, statement)
+
+    async def generate_warnings(self, days: int = 7) -> List[str]:
+        # May read warning_rules.json on first use
+        return await self._write(self.service.generate_warnings, days)
+
+    async def get_recent_entries(self, count: int = 3) -> List[JournalEntry]:
+        return await self._read(self.service.get_recent_entries, count)
+
+    async def get_entry(self, entry_id: str) -> Optional[JournalEntry]:
+        return await self._read(self.service.get_entry, entry_id)
+
+    async def get_active_temporary_bruces(self) -> List[Tuple[str, TemporaryBruce]]:
+        return await self._read(self.service.get_active_temporary_bruces)
@@ -0,0 +1,154 @@
+"""Seat-dominance analytics over calendar windows.
+
+Queries read the journal's columnar store (epochs, Bruce codes and seat
+response lengths), so dominance for any number of windows is answered from
+one set of prefix sums instead of re-reading entries. NumPy is used when it
+is installed; otherwise the same computations run on plain lists.
+"""
+from bisect import bisect_left
+import time
+from typing import Dict, List, Optional, Sequence
+from .columns import SEAT_FIELDS, JournalColumns
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional speedup
+    np = None
+
+
+# A seat "spoke up" in an entry when its response is longer than this
+ACTIVE_LENGTH = 50
+
+WINDOWS = {"7d": 7, "30d": 30, "365d": 365}
+
+DAY_SECONDS = 86400
+
+
+class SeatActivity:
+    """Seat-dominance queries over a journal's columnar store."""
+
+    def __init__(self, columns: Optional[JournalColumns] = None):
+        self.columns = columns if columns is not None else JournalColumns()
+        self._cache = None
+        self._cached_len = -1
+
+    @classmethod
+    def from_entries(cls, entries) -> "SeatActivity":
+        """Build activity from journal entries in chronological order."""
+        return cls(JournalColumns.from_entries(entries))
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    @property
+    def timestamps(self):
+        return self.columns.epochs
+
+    def append(self, entry) -> None:
+        """Record a newly written journal entry."""
+        self.columns.append(entry)
+
+    def _prefix(self):
+        """Cumulative active-response counts per seat, with a leading zero row.
+
+        Rebuilt whenever the columns have grown, whether through append() or
+        by the service writing to the shared store.
+        """
+        if self._cache is None or self._cached_len != len(self):
+            columns = self.columns.columns
+            if np is not None:
+                active = np.empty((len(self), len(SEAT_FIELDS)), dtype=bool)
+                for i, field in enumerate(SEAT_FIELDS):
+                    active[:, i] = np.asarray(columns[field]) > ACTIVE_LENGTH
+                prefix = np.zeros((len(self) + 1, len(SEAT_FIELDS)), dtype=np.int64)
+                np.cumsum(active, axis=0, out=prefix[1:])
+                self._cache = (np.array(self.timestamps, dtype=np.int64), active, prefix)
+            else:
+                active = [tuple(int(n > ACTIVE_LENGTH) for n in row) for row in zip(*(columns[f] for f in SEAT_FIELDS))]
+                running = [0] * len(SEAT_FIELDS)
+                prefix = [tuple(running)]
+                for row in active:
+                    running = [a + b for a, b in zip(running, row)]
+                    prefix.append(tuple(running))
+                self._cache = (self.timestamps, active, prefix)
+            self._cached_len = len(self)
+        return self._cache
+
+    def _counts(self, start: int, end: int) -> Dict[str, int]:
+        _, _, prefix = self._prefix()
+        return {field: int(prefix[end][i] - prefix[start][i]) for i, field in enumerate(SEAT_FIELDS)}
+
+    def _window_start(self, days: int, now: Optional[float]) -> int:
+        cutoff = (time.time() if now is None else now) - days * DAY_SECONDS
+        return bisect_left(self.timestamps, cutoff)
+
+    def dominance(self, days: int = 7, now: Optional[float] = None) -> Dict[str, int]:
+        """Count entries in the last `days` calendar days where each seat spoke up."""
+        return self._counts(self._window_start(days, now), len(self))
+
+    def window_counts(self, days: Sequence[int], now: Optional[float] = None) -> List[List[int]]:
+        """Active-response counts per seat for several windows, one row per window."""
+        _, _, prefix = self._prefix()
+        end = prefix[len(self)]
+        rows = []
+        for window in days:
+            start = prefix[self._window_start(window, now)]
+            rows.append([int(end[i] - start[i]) for i in range(len(SEAT_FIELDS))])
+        return rows
+
+    def window_dominance(self, windows: Optional[Dict[str, int]] = None, now: Optional[float] = None) -> Dict[str, Dict[str, int]]:
+        """Dominance for several windows at once, keyed by window label."""
+        windows = windows or WINDOWS
+        return {label: self.dominance(days, now) for label, days in windows.items()}
+
+    def rolling_ratios(self, days: int = 7) -> List[Dict[str, float]]:
+        """Each seat's share of active responses in the `days` up to every entry."""
+        timestamps, _, prefix = self._prefix()
+        if np is not None:
+            starts = np.searchsorted(timestamps, timestamps - days * DAY_SECONDS, side="left")
+            counts = prefix[1:] - prefix[starts]
+            totals = counts.sum(axis=1, keepdims=True)
+            ratios = counts / np.maximum(totals, 1)
+            return [dict(zip(SEAT_FIELDS, row)) for row in ratios.tolist()]
+
+        ratios = []
+        for i, ts in enumerate(timestamps):
+            start = bisect_left(timestamps, ts - days * DAY_SECONDS)
+            counts = [prefix[i + 1][s] - prefix[start][s] for s in range(len(SEAT_FIELDS))]
+            total = max(sum(counts), 1)
+            ratios.append({field: count / total for field, count in zip(SEAT_FIELDS, counts)})
+        return ratios
+
+    def _bruce_totals(self) -> List[List[int]]:
+        """Active-response counts per seat for each Bruce code."""
+        _, active, _ = self._prefix()
+        bruce_codes = self.columns.columns["bruce_codes"]
+        if np is not None:
+            totals = np.zeros((len(self.columns.bruces), len(SEAT_FIELDS)), dtype=np.int64)
+            np.add.at(totals, np.asarray(bruce_codes, dtype=np.int64), active)
+            return totals.tolist()
+
+        rows = [[0] * len(SEAT_FIELDS) for _ in self.columns.bruces]
+        for code, row in zip(bruce_codes, active):
+            target = rows[code]
+            for s, flag in enumerate(row):
+                target[s] += flag
+        return rows
+
+    def by_bruce(self) -> Dict[str, Dict[str, int]]:
+        """Dominance over each reigning Bruce's whole reign, keyed by name."""
+        result: Dict[str, Dict[str, int]] = {}
+        for (_, name), row in zip(self.columns.bruces, self._bruce_totals()):
+            totals = result.setdefault(name, dict.fromkeys(SEAT_FIELDS, 0))
+            for field, count in zip(SEAT_FIELDS, row):
+                totals[field] += count
+        return result
+
+    def by_bruce_id(self) -> Dict[Optional[str], Dict[str, int]]:
+        """Dominance over each reign keyed by Bruce ID (None for no Bruce)."""
+        result: Dict[Optional[str], Dict[str, int]] = {}
+        for (bruce_id, _), row in zip(self.columns.bruces, self._bruce_totals()):
+            totals = result.setdefault(bruce_id, dict.fromkeys(SEAT_FIELDS, 0))
+            for field, count in zip(SEAT_FIELDS, row):
+                totals[field] += count
+        return result
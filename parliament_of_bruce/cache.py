@@ -0,0 +1,106 @@
+"""Process-wide cache of loaded parliament states.
+
+When one process serves several profiles, reloading a profile's data file
+for every request repeats the most expensive work in the program. StateCache
+keeps recently used states in memory, keyed by data file, and returns one
+only while the file on disk is unchanged (same size and modification time),
+so edits from another process are picked up. Each state is stamped with
+the file as it was before the state was read, so a write that lands during
+the read makes the entry stale rather than passing it off as current.
+Storage keeps snapshots here and hands each load a copy
+(ParliamentState.clone), so services never share a state object. Only
+long-running processes that load the same profile repeatedly (the shell and
+the HTTP server) use the cache; one-shot commands read the file once and
+skip it, and the copying it costs.
+
+The cache is bounded by an estimate of memory rather than a count of
+profiles: each state is charged its data file's size times
+``BYTES_PER_FILE_BYTE``, and least recently used states are evicted once the
+total passes ``max_bytes``.
+"""
+from collections import OrderedDict
+import os
+from pathlib import Path
+import threading
+from typing import Optional, Tuple
+
+# Loaded objects take a few times the space of their JSON text
+BYTES_PER_FILE_BYTE = 4
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """(size, mtime_ns) of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class StateCache:
+    """LRU cache of ParliamentState objects with a memory budget."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self._items: "OrderedDict[Path, Tuple[object, Tuple[int, int], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, path: Path) -> bool:
+        return path in self._items
+
+    def get(self, path: Path):
+        """The cached state for a data file, or None if missing or stale."""
+        with self._lock:
+            item = self._items.get(path)
+            if item is None:
+                return None
+            state, stamp, _ = item
+            if stamp != file_stamp(path):
+                self._remove(path)
+                return None
+            self._items.move_to_end(path)
+            return state
+
+    def put(self, path: Path, state, stamp: Optional[Tuple[int, int]] = None) -> None:
+        """Cache a state read from (or written to) its data file when it had `stamp`.
+
+        Without a stamp the file's current one is used, which is only right if
+        nothing can have written the file since the state was read.
+        """
+        stamp = stamp or file_stamp(path)
+        if stamp is None:
+            return
+        cost = stamp[0] * BYTES_PER_FILE_BYTE
+        with self._lock:
+            self._remove(path)
+            if cost > self.max_bytes:
+                return
+            self._items[path] = (state, stamp, cost)
+            self.used_bytes += cost
+            while self.used_bytes > self.max_bytes:
+                self._remove(next(iter(self._items)))
+
+    def discard(self, path: Path) -> None:
+        """Forget a data file's state, e.g. after in-memory changes were abandoned."""
+        with self._lock:
+            self._remove(path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.used_bytes = 0
+
+    def _remove(self, path: Path) -> None:
+        item = self._items.pop(path, None)
+        if item is not None:
+            self.used_bytes -= item[2]
+
+
+# Shared by every Storage opened for a profile in this process
+STATE_CACHE = StateCache()
@@ -1,34 +1,88 @@
+import contextlib
+import itertools
+import os
+import re
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from datetime import datetime, timedelta
-from .storage import Storage
+from rich.table import Table
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+from .storage import DEFAULT_PROFILE, Storage, default_root
 from .services import ParliamentService
+from .scripting import ScriptError, load_script, load_votes, prepare_votes, run_script
+from .analytics import WINDOWS
+from .cache import STATE_CACHE
+from .drafts import SessionDraft
+from .events import EVENT_TYPES, Event
+from .exporting import EXPORT_FORMATS, export_file
+from .follow import JournalFollower, make_watcher
+from .models import JournalEntry
+from .profiles import aggregate_stats, export_profile, map_profiles, profile_stats
+from .query import QueryError
+from .server import DEFAULT_HOST, DEFAULT_PORT, make_server
+from .shell import ParliamentShell
+from .timeutil import DATETIME_FORMAT, format_epoch, period_bounds
 
 app = typer.Typer(help="Parliament of Bruce - Psychological journaling and decision-making system")
 console = Console()
 
+# Set by the --profile option for the command being run
+current_profile = {"name": None}
+
+# Set by pob shell to the service its commands share
+warm_service = {"service": None}
+
+
+@app.callback()
+def main(profile: str = typer.Option(None, "--profile", envvar="POB_PROFILE", help="Profile to use (default: your main parliament)")):
+    """Parliament of Bruce - Psychological journaling and decision-making system"""
+    if profile is not None:
+        try:
+            Storage.for_profile(profile)
+        except ValueError as e:
+            console.print(f"[red]✗ {e}[/red]")
+            raise typer.Exit(code=1)
+    current_profile["name"] = profile
+
 
 def get_service() -> ParliamentService:
-    """Get parliament service instance."""
-    storage = Storage()
+    """Get parliament service instance for the selected profile."""
+    if warm_service["service"] is not None:
+        return warm_service["service"]
+    storage = Storage.for_profile(current_profile["name"])
     return ParliamentService(storage)
 
 
+def run_script_input(service: ParliamentService, source: str, session_type: str = "daily", sessions: bool = True, votes: bool = True):
+    """Run a script document non-interactively and report what was recorded."""
+    try:
+        result = run_script(service, load_script(source), default_type=session_type, sessions=sessions, votes=votes)
+    except ScriptError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        raise typer.Exit(code=1)
+    
+    for entry in result.entries:
+        date = format_epoch(entry.epoch, DATETIME_FORMAT)
+        console.print(f"[green]✓[/green] {date} - {entry.session_type} session recorded")
+    for decision in result.decisions:
+        outcome = "[green]PASSED[/green]" if decision.passed else "[red]FAILED[/red]"
+        console.print(f"[green]✓[/green] Vote: {decision.topic}: {outcome}")
+    
+    console.print(f"\n[dim]Recorded {len(result.entries)} sessions and {len(result.decisions)} decisions[/dim]")
+
+
 @app.command()
 def init():
     """Initialize the Parliament of Bruce system."""
     service = get_service()
     
+    permanent = service.seats.permanent
     console.print(Panel.fit(
         "[bold cyan]Parliament of Bruce Initialized[/bold cyan]\n\n"
-        "Five permanent seats established:\n"
-        "  • Short-Term Bruce (1 vote)\n"
-        "  • Mid-Term Bruce (2 votes)\n"
-        "  • Long-Term Bruce (3 votes)\n"
-        "  • Purpose Bruce (4 votes)\n"
-        "  • Ultimate Bruce (5 votes)\n\n"
-        "[yellow]No Reigning Bruce yet. Create one with:[/yellow]\n"
+        f"{len(permanent)} permanent seats established:\n" +
+        "".join(f"  • {seat.short_name} ({seat.weight} vote{'s' if seat.weight != 1 else ''})\n" for seat in permanent) +
+        "\n[yellow]No Reigning Bruce yet. Create one with:[/yellow]\n"
         "  pob reign new",
         title="🏛️  Parliament Established"
     ))
@@ -37,10 +91,15 @@ def init():
 
 
 @app.command()
-def status():
+def status(window: str = typer.Option("7d", help="Analysis window: 7d, 30d or 365d")):
     """Show current parliament status."""
     service = get_service()
     
+    if window not in WINDOWS:
+        console.print(f"[red]✗ Invalid window: '{window}'[/red]")
+        console.print(f"[yellow]Valid windows: {', '.join(WINDOWS)}[/yellow]")
+        return
+    
     if not service.state.reigning_bruce:
         console.print("[yellow]⚠️  No Reigning Bruce currently active[/yellow]")
         console.print("Create one with: [cyan]pob reign new[/cyan]")
@@ -65,19 +124,22 @@ def status():
     if recent:
         console.print("\n[bold]Recent Sessions:[/bold]")
         for entry in recent:
-            date = datetime.fromisoformat(entry.date).strftime('%Y-%m-%d')
+            date = format_epoch(entry.epoch)
             console.print(f"  • {date} - {entry.session_type}")
     
     # Warnings
-    warnings = service.generate_warnings()
-    console.print("\n[bold]Psychological Analysis:[/bold]")
+    warnings = service.generate_warnings(WINDOWS[window])
+    console.print(f"\n[bold]Psychological Analysis ({window}):[/bold]")
     for warning in warnings:
         console.print(f"  {warning}")
 
 
 @app.command()
 def session(
-    session_type: str = typer.Argument("daily", help="Session type: daily, weekly, monthly")
+    session_type: str = typer.Argument("daily", help="Session type: daily, weekly, monthly"),
+    input: str = typer.Option(None, "--input", help="Run scripted sessions from a JSON file ('-' for stdin)"),
+    resume: bool = typer.Option(False, "--resume", help="Resume an unfinished session from its autosaved draft"),
+    hints: bool = typer.Option(False, "--hints", help="Before the synthesis, show past entries similar to today's responses")
 ):
     """Conduct a parliament session with rotating discussion."""
     service = get_service()
@@ -87,6 +149,31 @@ def session(
         console.print("  pob reign new")
         return
     
+    if input:
+        run_script_input(service, input, session_type=session_type, votes=False)
+        return
+    
+    draft = SessionDraft.load(service.storage.draft_file)
+    if draft is not None and (draft.is_empty or service.get_entry(draft.entry_id) is not None):
+        # Nothing was answered, or it was recorded and only the cleanup was missed
+        draft.discard()
+        draft = None
+    
+    if resume:
+        if draft is None:
+            console.print("[yellow]No unfinished session to resume[/yellow]")
+            return
+        session_type = draft.session_type
+        console.print(f"[green]✓ Resuming {session_type} session started {draft.started[:16].replace('T', ' ')} (round {draft.round_num})[/green]")
+    else:
+        if draft is not None:
+            console.print(f"[yellow]⚠️  An unfinished {draft.session_type} session from {draft.started[:16].replace('T', ' ')} was autosaved.[/yellow]")
+            console.print("Resume it with: [cyan]pob session --resume[/cyan]")
+            if not typer.confirm("Discard it and start a new session?", default=False):
+                return
+            draft.discard()
+        draft = SessionDraft.start(service.storage.draft_file, session_type)
+    
     console.print(Panel.fit(
         f"[bold cyan]{session_type.upper()} PARLIAMENT SESSION[/bold cyan]\n"
         f"Reigning Bruce: {service.state.reigning_bruce.name}\n"
@@ -97,125 +184,154 @@ def session(
         title="🏛️  Parliament Convenes"
     ))
     
-    permanent_responses = {}
-    temporary_responses = {}
-    round_num = 1
-    stop_rotation = False
-    
     # Get seat order with full descriptions
-    permanent_order = [
-        ("short_term", "🟥 Short-Term Bruce — The Rebel / The Animal", "Time: now, today, tonight\nBody over mind. Nerves over plans.\n'I want relief, not reasons. Pain feels urgent. Boredom is death. Discipline feels like a cage. I don't care about later. I speak in cravings, anger, fear. If ignored, I sabotage.'\n\nActivation: What hurts right now, and what would make it stop?"),
-        ("mid_term", "🟨 Mid-Term Bruce — The Operator", "Time: this week, this month\nExecution over emotion.\n'I care about momentum. Small wins beat grand visions. Systems beat willpower. Burnout is my enemy. Chaos wastes energy. I translate emotion into tasks. Consistency is power.'\n\nActivation: What's the minimum action that moves this forward?"),
-        ("long_term", "🟦 Long-Term Bruce — The Architect", "Time: years ahead\nStructure over impulse.\n'I think in systems and leverage. Compounding is sacred. Short-term pleasure is expensive. I care about trajectory, not mood. Emotions are data. I design environments. Waste of potential is the real sin.'\n\nActivation: Does this scale, compound, or rot?"),
-        ("purpose", "🟪 Purpose Bruce — The Dharma Bearer", "Time: lifetime\nMeaning over success.\n'I guard the story of your life. Power without meaning is hollow. Pain must become purpose. I ask why before how. Betraying values costs more than failure. I see patterns across incarnations of you. I speak softly but halt everything.'\n\nActivation: Is this worthy of the story we're living?"),
-        ("ultimate", "⚫ Ultimate Bruce — The Judge", "Time: deathbed\nLegacy over everything.\n'I am immune to excuses. I don't care how it felt, only what it became. Regret is my metric. I veto actions you'll live with forever. Comfort now can mean shame later. I see your life as one object.'\n\nActivation: When this is over… will we respect this choice?"),
-    ]
+    permanent_order = [(seat.field, seat.title, seat.prompt) for seat in service.seats.permanent]
     
     temp_bruces = service.get_active_temporary_bruces()
     
-    while not stop_rotation:
-        console.print(f"\n[bold magenta]━━━ ROUND {round_num} ━━━[/bold magenta]")
-        round_had_responses = False
+    try:
+        run_session_rotation(service, draft, permanent_order, temp_bruces, hints)
+    except (KeyboardInterrupt, typer.Abort):
+        draft.close()
+        if draft.is_empty:
+            draft.discard()
+            raise typer.Exit(code=1)
+        console.print("\n[yellow]Session interrupted. Your answers are saved as a draft.[/yellow]")
+        console.print("Resume with: [cyan]pob session --resume[/cyan]")
+        raise typer.Exit(code=1)
+    
+    permanent_responses = dict(draft.permanent)
+    temporary_responses = dict(draft.temporary)
+    entry = service.create_session(draft.session_type, permanent_responses, temporary_responses, entry_id=draft.entry_id)
+    draft.discard()
+    
+    console.print("\n[green]✓ Session recorded successfully[/green]")
+    console.print(f"[dim]Entry saved: {format_epoch(entry.epoch, DATETIME_FORMAT)}[/dim]")
+    if temporary_responses:
+        console.print(f"[dim]Temporary Bruces contributed: {len(temporary_responses)}[/dim]")
+
+
+def run_session_rotation(service: ParliamentService, draft: SessionDraft, permanent_order, temp_bruces, hints: bool = False):
+    """Prompt each seat in rotating rounds, then for the synthesis and policy.
+    
+    Every answer goes to the draft before the next prompt. Seats that have
+    already spoken in the draft's current round are skipped, so a resumed
+    draft picks up where it stopped. With hints, past entries similar to the
+    responses so far are shown once the rotation ends.
+    """
+    reigning_bruce = service.state.reigning_bruce
+    reigning = service.seats.reigning
+    
+    while not draft.rotation_ended:
+        resumed = " (resumed)" if draft.answered else ""
+        console.print(f"\n[bold magenta]━━━ ROUND {draft.round_num}{resumed} ━━━[/bold magenta]")
+        stop_rotation = False
         
         # Permanent seats + Reigning Bruce
         seats_to_speak = permanent_order + [
-              ("reigning", f"👑 Reigning Bruce ({service.state.reigning_bruce.name})", f"Synthesize the parliament's wisdom and set direction for the realm.\nReason Born: {service.state.reigning_bruce.reason_born}")
+              (reigning.field, f"{reigning.title} ({reigning_bruce.name})", f"{reigning.prompt}.\nReason Born: {reigning_bruce.reason_born}")
         ]
         
         for key, name, prompt in seats_to_speak:
+            if key in draft.answered:
+                continue
             console.print(f"\n[bold cyan]{name}[/bold cyan]")
             try:
-                response = typer.prompt(prompt)
-                
-                if round_num == 1:
-                    permanent_responses[key] = response
-                else:
-                    if permanent_responses.get(key):
-                        permanent_responses[key] += f"\n\n[Round {round_num}] {response}"
-                    else:
-                        permanent_responses[key] = response
-                round_had_responses = True
+                draft.answer(key, typer.prompt(prompt))
             except EOFError:
                 # Handle Ctrl+D - gracefully end rotation
                 stop_rotation = True
-                console.print("\n[dim]Rotation ended.[/dim]")
                 break
         
-        if stop_rotation:
-            break
-        
         # Temporary bruces
-        for temp_id, temp_bruce in temp_bruces:
-            console.print(f"\n[bold yellow]{temp_bruce.name}[/bold yellow]")
-            console.print(f"[dim][{temp_bruce.description}][/dim]")
-            try:
-                response = typer.prompt(f"{temp_bruce.name} — {temp_bruce.description}\nYour response:")
-                
-                if temp_id not in temporary_responses:
-                    temporary_responses[temp_id] = response
-                else:
-                    temporary_responses[temp_id] += f"\n\n[Round {round_num}] {response}"
-                round_had_responses = True
-            except EOFError:
-                # Handle Ctrl+D - gracefully end rotation
-                stop_rotation = True
-                console.print("\n[dim]Rotation ended.[/dim]")
-                break
+        if not stop_rotation:
+            for temp_id, temp_bruce in temp_bruces:
+                if temp_id in draft.answered:
+                    continue
+                console.print(f"\n[bold yellow]{temp_bruce.name}[/bold yellow]")
+                console.print(f"[dim][{temp_bruce.description}][/dim]")
+                try:
+                    draft.answer(temp_id, typer.prompt(f"{temp_bruce.name} — {temp_bruce.description}\nYour response:"), temporary=True)
+                except EOFError:
+                    # Handle Ctrl+D - gracefully end rotation
+                    stop_rotation = True
+                    break
         
         if stop_rotation:
+            console.print("\n[dim]Rotation ended.[/dim]")
+            draft.end_rotation()
             break
         
         # Ask if user wants to continue discussion
-        if round_had_responses:
-            console.print(f"\n[dim]All seats have spoken in Round {round_num}.[/dim]")
-            try:
-                continue_discussion = typer.confirm("Continue discussion for another round?", default=False)
-                if not continue_discussion:
-                    stop_rotation = True
-                else:
-                    round_num += 1
-            except EOFError:
-                # Handle Ctrl+D during the continue prompt
-                stop_rotation = True
-                console.print("\n[dim]Rotation ended.[/dim]")
+        console.print(f"\n[dim]All seats have spoken in Round {draft.round_num}.[/dim]")
+        try:
+            continue_discussion = typer.confirm("Continue discussion for another round?", default=False)
+        except EOFError:
+            # Handle Ctrl+D during the continue prompt
+            continue_discussion = False
+            console.print("\n[dim]Rotation ended.[/dim]")
+        if continue_discussion:
+            draft.next_round()
         else:
-            stop_rotation = True
+            draft.end_rotation()
+    
+    if hints and "final_policy" not in draft.permanent:
+        matches = service.related_entries("\n".join(draft.permanent.values()), count=3)
+        if matches:
+            console.print("\n[bold]💡 Past sessions that sounded like this one:[/bold]")
+            print_related(matches)
     
     # Get Final Reigning Bruce synthesis (if not already given during rotation)
-    if "reigning" not in permanent_responses or not permanent_responses["reigning"]:
-        console.print(f"\n[bold green]Reigning Bruce ({service.state.reigning_bruce.name}) — Final Synthesis[/bold green]")
+    if not draft.permanent.get("reigning"):
+        console.print(f"\n[bold green]Reigning Bruce ({reigning_bruce.name}) — Final Synthesis[/bold green]")
         try:
             reigning_response = typer.prompt("Synthesize the parliament's wisdom")
-            permanent_responses["reigning"] = reigning_response
         except EOFError:
-            permanent_responses["reigning"] = "[Synthesis skipped]"
+            reigning_response = "[Synthesis skipped]"
+        draft.set_field("reigning", reigning_response)
     
     # Final policy
-    console.print(f"\n[bold green]Final Policy[/bold green]")
-    try:
-        final_policy = typer.prompt("What is today's governing policy?")
-    except EOFError:
-        final_policy = "[Policy skipped]"
-    
-    permanent_responses["final_policy"] = final_policy
-    
-    entry = service.create_session(session_type, permanent_responses, temporary_responses)
-    
-    console.print("\n[green]✓ Session recorded successfully[/green]")
-    console.print(f"[dim]Entry saved: {datetime.fromisoformat(entry.date).strftime('%Y-%m-%d %H:%M')}[/dim]")
-    if temporary_responses:
-        console.print(f"[dim]Temporary Bruces contributed: {len(temporary_responses)}[/dim]")
+    if "final_policy" not in draft.permanent:
+        console.print(f"\n[bold green]Final Policy[/bold green]")
+        try:
+            final_policy = typer.prompt("What is today's governing policy?")
+        except EOFError:
+            final_policy = "[Policy skipped]"
+        draft.set_field("final_policy", final_policy)
 
 
 @app.command()
-def vote(topic: str = typer.Argument(..., help="Topic to vote on")):
+def vote(
+    topic: str = typer.Argument(None, help="Topic to vote on, or 'simulate' for what-if analysis"),
+    input: str = typer.Option(None, "--input", help="Run scripted votes from a JSON file ('-' for stdin)"),
+    batch: str = typer.Option(None, "--batch", help="Decide many topics from a JSON file ('-' for stdin) and save once"),
+    vectors: str = typer.Option(None, "--vectors", help="simulate: JSON file of hypothetical votes ('-' for stdin)"),
+    sweep: str = typer.Option(None, "--sweep", help="simulate: JSON file of weight/threshold configurations"),
+    table: bool = typer.Option(False, "--table", help="simulate: show every yes/no combination")
+):
     """Vote on a decision through parliament."""
     service = get_service()
     
+    if topic == "simulate":
+        simulate_votes(service, vectors, sweep, table)
+        return
+    
     if not service.state.reigning_bruce:
         console.print("[yellow]⚠️  No Reigning Bruce active[/yellow]")
         return
     
+    if input:
+        run_script_input(service, input, sessions=False)
+        return
+    
+    if batch:
+        decide_batch(service, batch)
+        return
+    
+    if topic is None:
+        console.print("[red]✗ Provide a topic, --input FILE or --batch FILE[/red]")
+        return
+    
     console.print(Panel.fit(
         f"[bold cyan]VOTING SESSION[/bold cyan]\n\n"
         f"Topic: {topic}\n\n"
@@ -225,12 +341,8 @@ def vote(topic: str = typer.Argument(..., help="Topic to vote on")):
     
     votes = {}
     seats = [
-        ("ShortTerm", "Short-Term Bruce", 1),
-        ("MidTerm", "Mid-Term Bruce", 2),
-        ("LongTerm", "Long-Term Bruce", 3),
-        ("Purpose", "Purpose Bruce", 4),
-        ("Ultimate", "Ultimate Bruce", 5),
-        ("Reigning", f"Reigning Bruce ({service.state.reigning_bruce.name})", 3),
+        (seat.key, f"{seat.short_name} ({service.state.reigning_bruce.name})" if seat.reigning else seat.short_name, seat.weight)
+        for seat in service.seats
     ]
     
     for key, name, weight in seats:
@@ -242,7 +354,7 @@ def vote(topic: str = typer.Argument(..., help="Topic to vote on")):
     decision = service.vote_on_decision(topic, ["Yes", "No"], votes)
     
     # Display results
-    yes_score = sum(service.VOTE_WEIGHTS[k] for k, v in votes.items() if v in ["yes", "y", "1"])
+    yes_score, _ = service.outcome_table().outcome(votes)
     no_score = service.MAX_SCORE - yes_score
     
     console.print("\n" + "="*60)
@@ -259,6 +371,118 @@ def vote(topic: str = typer.Argument(..., help="Topic to vote on")):
     console.print("\n" + "="*60)
 
 
+def decide_batch(service: ParliamentService, source: str):
+    """Decide every topic in a votes file and print a summary table."""
+    try:
+        items = [(v.topic, v.options, prepare_votes(service, v)) for v in load_votes(source)]
+    except ScriptError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        raise typer.Exit(code=1)
+    
+    decisions = service.decide_batch(items)
+    outcomes = service.outcome_table()
+    
+    summary = Table(title=f"Batch Decisions ({len(decisions)})")
+    summary.add_column("#", justify="right")
+    summary.add_column("Topic")
+    summary.add_column("Yes", justify="right")
+    summary.add_column("No", justify="right")
+    summary.add_column("Result")
+    for i, decision in enumerate(decisions, 1):
+        yes_score, _ = outcomes.outcome(decision.votes)
+        result = "[green]PASSED[/green]" if decision.passed else "[red]FAILED[/red]"
+        summary.add_row(str(i), decision.topic, str(yes_score), str(service.MAX_SCORE - yes_score), result)
+    console.print(summary)
+    
+    passed = sum(1 for d in decisions if d.passed)
+    console.print(f"\n[bold]{passed} passed, {len(decisions) - passed} failed[/bold] (threshold {service.PASSING_THRESHOLD}/{service.MAX_SCORE})")
+
+
+def read_json_source(source: str):
+    """Read JSON from a file path, or from stdin when source is '-'."""
+    import json
+    import sys
+    try:
+        if source == "-":
+            return json.load(sys.stdin)
+        with open(source, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]✗ Could not read '{source}': {e}[/red]")
+        raise typer.Exit(code=1)
+
+
+def simulate_votes(service: ParliamentService, vectors: str = None, sweep: str = None, table: bool = False):
+    """Show power indices and evaluate hypothetical votes without recording them."""
+    outcomes = service.outcome_table()
+    
+    power = service.vote_power()
+    power_table = Table(title=f"Seat Power (threshold {outcomes.threshold}/{outcomes.max_score})")
+    power_table.add_column("Seat")
+    power_table.add_column("Weight", justify="right")
+    power_table.add_column("Banzhaf", justify="right")
+    power_table.add_column("Shapley", justify="right")
+    for seat, weight in zip(outcomes.seats, outcomes.weights):
+        power_table.add_row(seat, str(weight), f"{power['banzhaf'][seat]:.3f}", f"{power['shapley'][seat]:.3f}")
+    console.print(power_table)
+    
+    passing = sum(outcomes.passes)
+    console.print(f"\n[dim]{passing} of {len(outcomes)} yes/no combinations pass[/dim]")
+    
+    if table:
+        combos = Table(title="Outcome Table")
+        combos.add_column("Votes (" + " ".join(outcomes.seats) + ")")
+        combos.add_column("Yes", justify="right")
+        combos.add_column("Result")
+        for mask in range(len(outcomes)):
+            pattern = "".join("y" if mask & (1 << i) else "n" for i in range(len(outcomes.seats)))
+            combos.add_row(pattern, str(outcomes.scores[mask]), "PASS" if outcomes.passes[mask] else "FAIL")
+        console.print(combos)
+    
+    if vectors:
+        data = read_json_source(vectors)
+        try:
+            results = service.simulate_votes(data)
+        except (KeyError, TypeError, ValueError) as e:
+            console.print(f"[red]✗ Invalid vote vector: {e}[/red]")
+            raise typer.Exit(code=1)
+        
+        sims = Table(title=f"Simulated Votes ({len(results)})")
+        sims.add_column("Votes")
+        sims.add_column("Yes", justify="right")
+        sims.add_column("Result")
+        sims.add_column("Pivotal Seats")
+        for mask, score, passed in results:
+            pattern = "".join("y" if mask & (1 << i) else "n" for i in range(len(outcomes.seats)))
+            sims.add_row(pattern, f"{score}/{outcomes.max_score}", "PASS" if passed else "FAIL", ", ".join(outcomes.pivotal_seats(mask)))
+        console.print(sims)
+    
+    if sweep:
+        data = read_json_source(sweep)
+        try:
+            configs = []
+            for config in data:
+                weights = config["weights"]
+                if not isinstance(weights, dict) or not all(type(weight) is int for weight in weights.values()):
+                    raise TypeError(f"'weights' must map seats to whole numbers, got {weights!r}")
+                unknown = [seat for seat in weights if seat not in service.VOTE_WEIGHTS]
+                if unknown:
+                    raise ValueError(f"Unknown seat '{unknown[0]}' in 'weights': use {', '.join(service.VOTE_WEIGHTS)}")
+                configs.append((weights, int(config["threshold"])))
+        except (KeyError, TypeError, ValueError) as e:
+            console.print(f"[red]✗ Invalid sweep configuration: {e}[/red]")
+            raise typer.Exit(code=1)
+        
+        sweep_table = Table(title=f"Banzhaf Power Sweep ({len(configs)} configurations)")
+        sweep_table.add_column("#", justify="right")
+        sweep_table.add_column("Threshold", justify="right")
+        for seat in outcomes.seats:
+            sweep_table.add_column(seat, justify="right")
+        for i, ((_, threshold), result) in enumerate(zip(configs, service.sweep_vote_power(configs)), 1):
+            sweep_table.add_row(str(i), str(threshold), *(f"{result['banzhaf'][seat]:.3f}" for seat in outcomes.seats))
+        console.print(sweep_table)
+
+
 @app.command()
 def rebirth():
     """Trigger a Bruce rebirth (identity death and renewal)."""
@@ -342,7 +566,9 @@ def reign(action: str = typer.Argument("new", help="Action: new")):
 @app.command()
 def add_voice(
     name: str = typer.Argument(..., help="Name of the temporary Bruce"),
-    description: str = typer.Option(..., "--description", "-d", help="Description of this voice")
+    description: str = typer.Option(..., "--description", "-d", help="Description of this voice"),
+    ttl: float = typer.Option(None, "--ttl", help="Dismiss the voice automatically after this many days"),
+    max_sessions: int = typer.Option(None, "--max-sessions", help="Dismiss the voice automatically after this many sessions")
 ):
     """Add a temporary Bruce voice to parliament (discussion only, no voting)."""
     service = get_service()
@@ -352,28 +578,44 @@ def add_voice(
         console.print("  pob reign new")
         return
     
-    temp_bruce = service.add_temporary_bruce(name, description)
+    try:
+        temp_bruce = service.add_temporary_bruce(name, description, ttl_days=ttl, max_sessions=max_sessions)
+    except ValueError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        raise typer.Exit(1)
     
     console.print(Panel.fit(
         f"[bold cyan]{name}[/bold cyan]\n\n"
         f"[dim]{description}[/dim]\n\n"
         f"[green]✓ Added to parliament[/green]\n"
-        f"[dim]ID: {temp_bruce.id}[/dim]",
+        f"[dim]ID: {temp_bruce.id}[/dim]"
+        + "".join(f"\n[dim]{line}[/dim]" for line in voice_expiry(service, temp_bruce)),
         title="🗣️  New Voice"
     ))
 
 
+def voice_expiry(service: ParliamentService, voice) -> list:
+    """Lines describing when a voice will be dismissed automatically."""
+    lines = []
+    if voice.expires_at is not None:
+        lines.append(f"Expires: {format_epoch(voice.expires_at, DATETIME_FORMAT)}")
+    sessions_left = service.sessions_left(voice)
+    if sessions_left is not None:
+        lines.append(f"Sessions left: {sessions_left}")
+    return lines
+
+
 @app.command()
 def remove_voice(voice_id: str = typer.Argument(..., help="ID of the temporary Bruce to remove")):
     """Remove a temporary Bruce voice from parliament."""
     service = get_service()
     
     # Find the voice
-    if voice_id not in service.state.temporary_bruces:
+    voice = service.state.temporary_bruces.get(voice_id)
+    if voice is None or not voice.active:
         console.print(f"[red]✗ Voice '{voice_id}' not found[/red]")
         return
     
-    voice = service.state.temporary_bruces[voice_id]
     confirm = typer.confirm(f"Remove '{voice.name}' from parliament?")
     
     if confirm:
@@ -384,10 +626,21 @@ def remove_voice(voice_id: str = typer.Argument(..., help="ID of the temporary B
 
 
 @app.command()
-def voices():
+def voices(
+    history: str = typer.Option(None, "--history", help="Show the latest statements of the voice with this ID"),
+    count: int = typer.Option(10, help="Number of statements to show with --history")
+):
     """List all active temporary Bruce voices in parliament."""
+    if count < 1:
+        console.print("[red]✗ --count must be at least 1[/red]")
+        raise typer.Exit(code=1)
+    
     service = get_service()
     
+    if history is not None:
+        show_voice_history(service, history, count)
+        return
+    
     temp_bruces = service.get_active_temporary_bruces()
     
     if not temp_bruces:
@@ -404,14 +657,42 @@ def voices():
         console.print(f"\n[bold]{temp_bruce.name}[/bold]")
         console.print(f"  ID: {temp_id}")
         console.print(f"  Description: {temp_bruce.description}")
+        for line in voice_expiry(service, temp_bruce):
+            console.print(f"  {line}")
         if temp_bruce.last_statement:
             statement_preview = temp_bruce.last_statement[:100] + "..." if len(temp_bruce.last_statement) > 100 else temp_bruce.last_statement
             console.print(f"  Last: {statement_preview}")
 
 
+def show_voice_history(service: ParliamentService, voice_id: str, count: int):
+    """Print a voice's latest statements, newest first."""
+    voice = service.state.temporary_bruces.get(voice_id)
+    statements = service.voice_history(voice_id, count)
+    if voice is None and not statements:
+        console.print(f"[red]✗ Voice '{voice_id}' not found[/red]")
+        return
+    
+    name = voice.name if voice is not None else f"Unknown voice {voice_id}"
+    status = "" if voice is not None and voice.active else " [dim](dismissed)[/dim]"
+    total = service.voice_index().count(voice_id)
+    console.print(Panel.fit(
+        f"[bold cyan]{name}[/bold cyan]{status}\n"
+        f"[dim]Spoke in {total} session(s); showing the latest {len(statements)}[/dim]",
+        title="🗣️  Voice History"
+    ))
+    
+    if not statements:
+        console.print("[yellow]This voice has not spoken in a session yet[/yellow]")
+        return
+    
+    for entry, response in statements:
+        console.print(f"\n[bold]{format_epoch(entry.epoch, DATETIME_FORMAT)}[/bold] [dim]{entry.session_type} · {entry.id}[/dim]")
+        console.print(response)
+
+
 
 @app.command()
-def timeline():
+def timeline(detail: bool = typer.Option(False, help="Show each reign's sessions, session types and decisions")):
     """Show timeline of all Bruce identities."""
     service = get_service()
     
@@ -421,11 +702,7 @@ def timeline():
     
     console.print(Panel.fit("[bold cyan]Timeline of Bruce Identities[/bold cyan]", title="📜 History"))
     
-    all_bruces = service.state.bruce_history.copy()
-    if service.state.reigning_bruce:
-        all_bruces.append(service.state.reigning_bruce)
-    
-    for i, bruce in enumerate(all_bruces, 1):
+    for i, bruce in enumerate(service.all_bruces(), 1):
         start = datetime.fromisoformat(bruce.start_date).strftime('%Y-%m-%d')
         
         if bruce.end_date:
@@ -441,27 +718,132 @@ def timeline():
         
         if bruce.exit_report:
             console.print(f"   Exit: {bruce.exit_report}")
+        
+        if detail:
+            summary = service.bruce_summary(bruce)
+            if summary.entry_count:
+                first = format_epoch(summary.first_epoch)
+                last = format_epoch(summary.last_epoch)
+                types = ", ".join(f"{k}: {v}" for k, v in summary.session_types.items())
+                console.print(f"   Journal: {summary.entry_count} entries ({first} → {last}) - {types}")
+            else:
+                console.print("   Journal: [dim]no entries[/dim]")
+            if summary.decision_count:
+                console.print(f"   Decisions: {summary.passed_count} passed, {summary.decision_count - summary.passed_count} failed")
+            entries = service.entries_for_bruce(bruce)
+            if entries and entries[-1].final_policy:
+                console.print(f"   Last Policy: {entries[-1].final_policy}")
+
+
+def print_entry(service: ParliamentService, entry, number: int, full: bool):
+    """Render one journal entry, in full or as a summary."""
+    date_str = format_epoch(entry.epoch, DATETIME_FORMAT)
+    
+    if not full:
+        console.print(f"\n[bold]{date_str}[/bold] - {entry.session_type}")
+        console.print(f"  Bruce: {entry.reigning_bruce_name}")
+        console.print(f"  Policy: {entry.final_policy[:80]}{'...' if len(entry.final_policy) > 80 else ''}")
+        return
+    
+    console.print("\n" + "="*70)
+    console.print(Panel.fit(
+        f"[bold cyan]{entry.session_type.upper()} SESSION[/bold cyan]\n"
+        f"Date: {date_str}\n"
+        f"Reigning Bruce: {entry.reigning_bruce_name}",
+        title=f"📔 Entry {number}"
+    ))
+    
+    for seat in service.seats.permanent:
+        console.print(f"\n[bold cyan]{seat.short_name}:[/bold cyan]")
+        console.print(getattr(entry, seat.field))
+    
+    console.print(f"\n[bold green]Reigning Bruce ({entry.reigning_bruce_name}):[/bold green]")
+    console.print(entry.reigning)
+    
+    console.print(f"\n[bold yellow]Final Policy:[/bold yellow]")
+    console.print(entry.final_policy)
+    
+    # Show temporary Bruce responses if any
+    if entry.temporary_bruce_entries:
+        console.print(f"\n[bold yellow]Temporary Voices:[/bold yellow]")
+        for temp_id, response in entry.temporary_bruce_entries.items():
+            temp_bruce = service.state.temporary_bruces.get(temp_id)
+            # Voices deleted before dismissal kept them have no record left
+            name = temp_bruce.name if temp_bruce is not None else f"Unknown voice {temp_id}"
+            console.print(f"\n[yellow]{name}:[/yellow]")
+            console.print(response)
+    
+    decisions = service.decisions_for_entry(entry)
+    if decisions:
+        console.print(f"\n[bold]Decisions Voted:[/bold]")
+        for dec in decisions:
+            console.print(f"  • {dec.topic}: {'PASSED' if dec.passed else 'FAILED'}")
+
+
+def follow_journal(service: ParliamentService, count: int, full: bool):
+    """Print the latest entries, then each new one as any process saves it."""
+    path = service.storage.journal_file
+    watcher = make_watcher(path)  # before catching up, so no write is missed
+    try:
+        service.sync_journal_log()
+        journal = service.state.journal_entries
+        for position in range(max(0, len(journal) - count), len(journal)):
+            print_entry(service, journal[position], position + 1, full)
+        console.print("\n[dim]Following new entries (Ctrl+C to stop)...[/dim]")
+        
+        follower = JournalFollower.from_end(path, len(journal) - 1)
+        for record in follower.follow(watcher):
+            entry = JournalEntry.parse_obj(record)
+            voices = service.state.temporary_bruces
+            if entry.decision_ids or any(voice_id not in voices for voice_id in entry.temporary_bruce_entries):
+                # Names of new voices and decisions are only in the data file
+                service = ParliamentService(service.storage)
+            print_entry(service, entry, record["n"] + 1, full)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
 
 
 @app.command()
 def read(
-    date: str = typer.Option(None, help="Specific date (YYYY-MM-DD) or 'latest'"),
-    count: int = typer.Option(10, help="Number of recent entries to show"),
-    full: bool = typer.Option(False, help="Show full entries (default shows summaries)")
+    date: str = typer.Option(None, help="Specific date (YYYY-MM-DD), month (YYYY-MM) or 'latest'"),
+    count: int = typer.Option(10, help="Number of entries per page"),
+    full: bool = typer.Option(False, help="Show full entries (default shows summaries)"),
+    page: int = typer.Option(None, help="Page to show, counting back from the newest (1 = latest)"),
+    after: str = typer.Option(None, help="Show the page of entries just after this entry ID"),
+    before: str = typer.Option(None, help="Show the page of entries just before this entry ID"),
+    pager: bool = typer.Option(None, "--pager/--no-pager", help="Show output in a pager (default: with --full on a terminal)"),
+    follow: bool = typer.Option(False, "--follow", "-f", help="Show the latest entries, then each new one as it is saved (Ctrl+C to stop)")
 ):
-    """Read journal entries."""
+    """Read journal entries, a page at a time."""
     service = get_service()
     
+    if follow:
+        if any(option is not None for option in (date, page, after, before)):
+            console.print("[red]✗ --follow cannot be combined with --date, --page, --after or --before[/red]")
+            return
+        follow_journal(service, count, full)
+        return
+    
     if not service.state.journal_entries:
         console.print("[yellow]No journal entries yet. Create one with 'pob session daily'[/yellow]")
         return
     
-    entries = []
+    if sum(option is not None for option in (page, after, before)) > 1:
+        console.print("[red]✗ Use only one of --page, --after and --before[/red]")
+        return
+    if count < 1 or (page is not None and page < 1):
+        console.print("[red]✗ --count and --page must be at least 1[/red]")
+        return
+    
+    journal = service.state.journal_entries
+    span = (0, len(journal))
     
     # Filter by date if specified
     if date:
         if date.lower() == "latest":
-            entries = [service.state.journal_entries[-1]]
+            span = (len(journal) - 1, len(journal))
         else:
             # Validate date format
             if not (len(date) in [10, 7] and date.replace('-', '').isdigit()):
@@ -469,153 +851,96 @@ def read(
                 console.print("[yellow]Use format: YYYY-MM-DD or YYYY-MM[/yellow]")
                 return
             
-            # Parse date and find matching entries
-            target_date = date
-            entries = [e for e in service.state.journal_entries 
-                      if e.date.startswith(target_date)]
+            # Find matching entries by epoch range
+            try:
+                start, end = period_bounds(date)
+            except ValueError:
+                console.print(f"[red]✗ Invalid date: '{date}'[/red]")
+                console.print("[yellow]Use format: YYYY-MM-DD or YYYY-MM[/yellow]")
+                return
+            span = service.journal_span(start, end)
             
-            if not entries:
+            if span[0] == span[1]:
                 console.print(f"[yellow]No entries found for {date}[/yellow]")
                 return
-    else:
-        # Show most recent entries
-        entries = service.state.journal_entries[-count:]
     
-    # Display entries
-    for i, entry in enumerate(entries):
-        date_obj = datetime.fromisoformat(entry.date)
-        date_str = date_obj.strftime('%Y-%m-%d %H:%M')
-        
-        if full:
-            # Full detailed view
-            console.print("\n" + "="*70)
-            console.print(Panel.fit(
-                f"[bold cyan]{entry.session_type.upper()} SESSION[/bold cyan]\n"
-                f"Date: {date_str}\n"
-                f"Reigning Bruce: {entry.reigning_bruce_name}",
-                title=f"📔 Entry {len(service.state.journal_entries) - len(entries) + i + 1}"
-            ))
-            
-            console.print(f"\n[bold cyan]Short-Term Bruce:[/bold cyan]")
-            console.print(entry.short_term)
-            
-            console.print(f"\n[bold cyan]Mid-Term Bruce:[/bold cyan]")
-            console.print(entry.mid_term)
-            
-            console.print(f"\n[bold cyan]Long-Term Bruce:[/bold cyan]")
-            console.print(entry.long_term)
-            
-            console.print(f"\n[bold cyan]Purpose Bruce:[/bold cyan]")
-            console.print(entry.purpose)
-            
-            console.print(f"\n[bold cyan]Ultimate Bruce:[/bold cyan]")
-            console.print(entry.ultimate)
-            
-            console.print(f"\n[bold green]Reigning Bruce ({entry.reigning_bruce_name}):[/bold green]")
-            console.print(entry.reigning)
-            
-            console.print(f"\n[bold yellow]Final Policy:[/bold yellow]")
-            console.print(entry.final_policy)
-            
-            # Show temporary Bruce responses if any
-            if entry.temporary_bruce_entries:
-                console.print(f"\n[bold yellow]Temporary Voices:[/bold yellow]")
-                for temp_id, response in entry.temporary_bruce_entries.items():
-                    if temp_id in service.state.temporary_bruces:
-                        temp_bruce = service.state.temporary_bruces[temp_id]
-                        console.print(f"\n[yellow]{temp_bruce.name}:[/yellow]")
-                        console.print(response)
-            
-            if entry.decisions_voted_on:
-                console.print(f"\n[bold]Decisions Voted:[/bold]")
-                for dec in entry.decisions_voted_on:
-                    console.print(f"  • {dec.topic}: {'PASSED' if dec.passed else 'FAILED'}")
-        else:
-            # Summary view
-            console.print(f"\n[bold]{date_str}[/bold] - {entry.session_type}")
-            console.print(f"  Bruce: {entry.reigning_bruce_name}")
-            console.print(f"  Policy: {entry.final_policy[:80]}{'...' if len(entry.final_policy) > 80 else ''}")
+    try:
+        first, last = service.entry_page(count, page or 1, after, before, span)
+    except ValueError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        return
     
-    # Show usage tip if in summary mode
-    if not full and entries:
-        console.print(f"\n[dim]Showing {len(entries)} entries (summaries). Use --full flag for complete entries.[/dim]")
-        console.print(f"[dim]Examples:[/dim]")
-        console.print(f"[dim]  pob read --date 2025-12-14 --full[/dim]")
-        console.print(f"[dim]  pob read --date latest --full[/dim]")
-        console.print(f"[dim]  pob read --count 20[/dim]")
+    if first == last:
+        console.print("[yellow]No entries on this page[/yellow]")
+        return
+    
+    # Only the visible page is rendered
+    if pager is None:
+        pager = full and console.is_terminal
+    with console.pager(styles=True) if pager else contextlib.nullcontext():
+        for position in range(first, last):
+            print_entry(service, journal[position], position + 1, full)
+        
+        total = span[1] - span[0]
+        pages = (total + count - 1) // count
+        current = (span[1] - last) // count + 1
+        console.print(f"\n[dim]Showing entries {first + 1}-{last} of {len(journal)} (page {current} of {pages}).[/dim]")
+        args = (f" --date {date}" if date else "") + (f" --count {count}" if count != 10 else "") + (" --full" if full else "")
+        if first > span[0]:
+            console.print(f"[dim]  Older: pob read{args} --before {journal[first].id}[/dim]")
+        if last < span[1]:
+            console.print(f"[dim]  Newer: pob read{args} --after {journal[last - 1].id}[/dim]")
+        
+        # Show usage tip if in summary mode
+        if not full:
+            console.print(f"[dim]Showing {last - first} entries (summaries). Use --full flag for complete entries.[/dim]")
+            console.print(f"[dim]Examples:[/dim]")
+            console.print(f"[dim]  pob read --date 2025-12-14 --full[/dim]")
+            console.print(f"[dim]  pob read --date latest --full[/dim]")
+            console.print(f"[dim]  pob read --count 20 --page 2[/dim]")
 
 
 @app.command()
 def search(
-    query: str = typer.Argument(..., help="Search term to find in entries"),
-    seat: str = typer.Option(None, help="Search specific seat: short_term, mid_term, long_term, purpose, ultimate, reigning, policy")
+    query: str = typer.Argument(..., help="Words, \"phrases\" and filters: seat:, bruce:, type:, after:, before:, -excluded"),
+    seat: str = typer.Option(None, help="Search specific seat: short_term, mid_term, long_term, purpose, ultimate, reigning, policy"),
+    explain: bool = typer.Option(False, "--explain", help="Show which indexes the search used"),
+    regex: bool = typer.Option(False, "--regex", help="Treat the query as a regular expression and scan every entry"),
+    case_sensitive: bool = typer.Option(False, "--case-sensitive", help="--regex: match case exactly"),
+    workers: int = typer.Option(None, "--workers", help="--regex: processes to scan with (default: one per CPU)")
 ):
-    """Search journal entries for specific content."""
+    """Search journal entries for specific content.
+    
+    Example: pob search 'coffee "bad sleep" seat:purpose bruce:Phoenix type:weekly after:2025-01 -excuses'
+    """
     service = get_service()
     
     # Validate seat parameter first
-    valid_seats = ["short_term", "mid_term", "long_term", "purpose", "ultimate", "reigning", "policy"]
-    if seat and seat not in valid_seats:
+    if seat and seat not in service.SEARCH_FIELDS:
         console.print(f"[red]✗ Invalid seat: '{seat}'[/red]")
-        console.print(f"[yellow]Valid seats: {', '.join(valid_seats)}[/yellow]")
+        console.print(f"[yellow]Valid seats: {', '.join(service.SEARCH_FIELDS)}[/yellow]")
         return
     
     if not service.state.journal_entries:
         console.print("[yellow]No journal entries to search[/yellow]")
         return
     
-    query_lower = query.lower()
-    matches = []
+    if regex:
+        regex_search(service, query, seat, not case_sensitive, workers)
+        return
     
-    for entry in service.state.journal_entries:
-        fields_to_search = {}
-        
-        if seat:
-            # Search specific seat
-            if seat == "short_term":
-                fields_to_search = {"Short-Term": entry.short_term}
-            elif seat == "mid_term":
-                fields_to_search = {"Mid-Term": entry.mid_term}
-            elif seat == "long_term":
-                fields_to_search = {"Long-Term": entry.long_term}
-            elif seat == "purpose":
-                fields_to_search = {"Purpose": entry.purpose}
-            elif seat == "ultimate":
-                fields_to_search = {"Ultimate": entry.ultimate}
-            elif seat == "reigning":
-                fields_to_search = {"Reigning": entry.reigning}
-            elif seat == "policy":
-                fields_to_search = {"Policy": entry.final_policy}
-        else:
-            # Search all fields
-            fields_to_search = {
-                "Short-Term": entry.short_term,
-                "Mid-Term": entry.mid_term,
-                "Long-Term": entry.long_term,
-                "Purpose": entry.purpose,
-                "Ultimate": entry.ultimate,
-                "Reigning": entry.reigning,
-                "Policy": entry.final_policy
-            }
-        
-        # Check for matches
-        found_in = []
-        for field_name, field_content in fields_to_search.items():
-            if query_lower in field_content.lower():
-                # Get context around match
-                index = field_content.lower().index(query_lower)
-                start = max(0, index - 40)
-                end = min(len(field_content), index + len(query) + 40)
-                context = field_content[start:end]
-                if start > 0:
-                    context = "..." + context
-                if end < len(field_content):
-                    context = context + "..."
-                
-                found_in.append((field_name, context))
-        
-        if found_in:
-            matches.append((entry, found_in))
+    try:
+        matches, plan = service.search_with_plan(query, seat)
+    except QueryError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        raise typer.Exit(1)
+    
+    if explain:
+        console.print("[bold]Plan:[/bold]")
+        for name, estimate, how in plan:
+            size = f"≤{estimate} entries" if estimate is not None else "no index"
+            console.print(f"  {how:<5} {name} [dim]({size})[/dim]")
+        console.print()
     
     # Display results
     if not matches:
@@ -625,13 +950,71 @@ def search(
     console.print(f"\n[bold]Found {len(matches)} entries containing '{query}':[/bold]\n")
     
     for entry, found_in in matches:
-        date_obj = datetime.fromisoformat(entry.date)
-        date_str = date_obj.strftime('%Y-%m-%d')
-        
-        console.print(f"[cyan]{date_str}[/cyan] - {entry.session_type} - {entry.reigning_bruce_name}")
-        for field_name, context in found_in:
-            console.print(f"  [{field_name}] {context}")
-        console.print()
+        print_match(entry, found_in)
+
+
+def print_match(entry, found_in):
+    """One search result: the entry's date, type and Bruce, then each matching field."""
+    date_str = format_epoch(entry.epoch)
+    
+    console.print(f"[cyan]{date_str}[/cyan] - {entry.session_type} - {entry.reigning_bruce_name}")
+    for field_name, context in found_in:
+        console.print(f"  [{field_name}] {context}")
+    console.print()
+
+
+def regex_search(service: ParliamentService, pattern: str, seat: Optional[str], ignore_case: bool, workers: Optional[int]):
+    """Print entries matching a regular expression as the scan finds them."""
+    try:
+        matches = service.regex_search(pattern, seat, ignore_case, workers)
+        first = next(matches, None)
+    except re.error as e:
+        console.print(f"[red]✗ Invalid regular expression: {e}[/red]")
+        raise typer.Exit(1)
+    
+    if first is None:
+        console.print(f"[yellow]No matches found for /{pattern}/[/yellow]")
+        return
+    
+    console.print(f"\n[bold]Entries matching /{pattern}/:[/bold]\n")
+    count = 0
+    for entry, found_in in itertools.chain([first], matches):
+        print_match(entry, found_in)
+        count += 1
+    console.print(f"[dim]{count} matching entries[/dim]")
+
+
+@app.command()
+def related(
+    query: str = typer.Argument(..., help="Entry ID, or text to find similar entries for"),
+    count: int = typer.Option(5, help="Number of related entries to show")
+):
+    """Show past entries whose responses are most similar to an entry or text."""
+    service = get_service()
+    
+    if not service.state.journal_entries:
+        console.print("[yellow]No journal entries yet[/yellow]")
+        return
+    
+    matches = service.related_entries(query, count)
+    if not matches:
+        console.print(f"[yellow]No related entries found for '{query}'[/yellow]")
+        return
+    
+    source = service.get_entry(query)
+    subject = f"entry {query} ({format_epoch(source.epoch)})" if source is not None else f"'{query}'"
+    console.print(f"\n[bold]Entries related to {subject}:[/bold]\n")
+    print_related(matches)
+
+
+def print_related(matches):
+    """One line per related entry with its similarity, plus a policy preview."""
+    for entry, score in matches:
+        console.print(f"[cyan]{format_epoch(entry.epoch)}[/cyan] - {entry.session_type} - {entry.reigning_bruce_name} "
+                      f"[dim]({score:.0%} similar, ID {entry.id})[/dim]")
+        if entry.final_policy:
+            preview = entry.final_policy[:80] + "..." if len(entry.final_policy) > 80 else entry.final_policy
+            console.print(f"  Policy: {preview}")
 
 
 @app.command()
@@ -639,55 +1022,30 @@ def stats():
     """Show statistics about your parliament usage."""
     service = get_service()
     
-    total_entries = len(service.state.journal_entries)
-    total_decisions = len(service.state.decisions)
-    total_bruces = len(service.state.bruce_history) + (1 if service.state.reigning_bruce else 0)
-    
-    if total_entries == 0:
+    summary = service.summary_stats()
+    if summary["sessions"] == 0:
         console.print("[yellow]No data yet. Start with 'pob session daily'[/yellow]")
         return
     
-    # Calculate date range
-    first_entry = service.state.journal_entries[0]
-    last_entry = service.state.journal_entries[-1]
-    first_date = datetime.fromisoformat(first_entry.date)
-    last_date = datetime.fromisoformat(last_entry.date)
-    days_active = (last_date - first_date).days + 1
-    
-    # Session type breakdown
-    session_types = {}
-    for entry in service.state.journal_entries:
-        session_types[entry.session_type] = session_types.get(entry.session_type, 0) + 1
-    
-    # Decision success rate
-    passed = sum(1 for d in service.state.decisions if d.passed)
-    failed = total_decisions - passed
-    
-    # Current streak (consecutive days with entries)
-    streak = 0
-    current_date = datetime.now().date()
-    for entry in reversed(service.state.journal_entries):
-        entry_date = datetime.fromisoformat(entry.date).date()
-        if entry_date == current_date:
-            streak += 1
-            current_date -= timedelta(days=1)
-        elif entry_date < current_date:
-            break
+    total_decisions = summary["decisions"]
+    passed = summary["passed"]
     
     # Display stats
     console.print(Panel.fit(
         f"[bold cyan]Parliament Statistics[/bold cyan]\n\n"
         f"📊 Overall:\n"
-        f"  • Total Sessions: {total_entries}\n"
+        f"  • Total Sessions: {summary['sessions']}\n"
         f"  • Total Decisions: {total_decisions}\n"
-        f"  • Identity Versions: {total_bruces}\n"
-        f"  • Days Active: {days_active}\n"
-        f"  • Current Streak: {streak} days\n\n"
+        f"  • Identity Versions: {summary['identities']}\n"
+        f"  • Days Active: {summary['days_active']}\n"
+        f"  • Current Streak: {summary['current_streak']} days\n"
+        f"  • Longest Streak: {summary['longest_streak']} days\n\n"
         f"📝 Session Types:\n" +
-        "\n".join(f"  • {k}: {v}" for k, v in session_types.items()) +
+        "\n".join(f"  • {k}: {v}" for k, v in summary["session_types"].items()) +
         f"\n\n🗳️  Decision Record:\n"
         f"  • Passed: {passed}\n"
-        f"  • Failed: {failed}\n"
+        f"  • Failed: {summary['failed']}\n"
+        f"  • Sessions With Decisions: {summary['sessions_with_decisions']}\n"
         f"  • Success Rate: {(passed/total_decisions*100) if total_decisions > 0 else 0:.1f}%",
         title="📈 Your Journey"
     ))
@@ -697,76 +1055,283 @@ def stats():
         most_sessions = max(service.state.bruce_history, key=lambda b: b.session_count)
         console.print(f"\n[bold]Most Productive Bruce:[/bold] {most_sessions.name} ({most_sessions.session_count} sessions)")
     
+    # Per-Bruce breakdown
+    bruces = service.all_bruces()
+    if bruces:
+        per_bruce = Table(title="Per-Bruce Record")
+        per_bruce.add_column("Bruce")
+        per_bruce.add_column("Sessions", justify="right")
+        per_bruce.add_column("Decisions", justify="right")
+        per_bruce.add_column("Passed", justify="right")
+        per_bruce.add_column("Best Streak", justify="right")
+        for bruce in bruces:
+            record = service.bruce_summary(bruce)
+            rate = f"{record.passed_count / record.decision_count * 100:.0f}%" if record.decision_count else "-"
+            best = service.activity_calendar(bruce).longest
+            per_bruce.add_row(bruce.name, str(record.entry_count), str(record.decision_count), rate, f"{best}d")
+        console.print()
+        console.print(per_bruce)
+    
     # Recent activity
-    if total_entries >= 7:
+    if summary["sessions"] >= 7:
         recent_7 = service.state.journal_entries[-7:]
         console.print(f"\n[bold]Last 7 Days Activity:[/bold]")
         for entry in recent_7:
-            date = datetime.fromisoformat(entry.date).strftime('%Y-%m-%d')
+            date = format_epoch(entry.epoch)
             console.print(f"  {date}: {entry.session_type}")
 
 
+@app.command()
+def profiles(
+    action: str = typer.Argument("list", help="Action: list, stats or export"),
+    format: str = typer.Option("markdown", help="Export format: markdown or json"),
+    workers: int = typer.Option(None, help="Worker processes (default: one per CPU, up to one per profile)")
+):
+    """List profiles, or show stats or export across all of them."""
+    root = default_root()
+    names = Storage.list_profiles(root)
+    
+    if action not in ["list", "stats", "export"]:
+        console.print(f"[red]✗ Unknown action: '{action}'[/red]")
+        console.print("[yellow]Valid actions: list, stats, export[/yellow]")
+        return
+    
+    if not names:
+        console.print("[yellow]No profiles with data yet. Use 'pob --profile NAME session'[/yellow]")
+        return
+    
+    if action == "list":
+        table = Table(title=f"Profiles ({len(names)})")
+        table.add_column("Profile")
+        table.add_column("Size", justify="right")
+        table.add_column("Last Saved")
+        for name in names:
+            data_file = Storage.for_profile(name, root).data_file
+            stat = data_file.stat()
+            table.add_row(name, f"{stat.st_size / 1024:.1f} KB", format_epoch(int(stat.st_mtime), DATETIME_FORMAT))
+        console.print(table)
+    
+    elif action == "stats":
+        results = map_profiles(profile_stats, root, names, workers=workers)
+        table = Table(title="Profile Statistics")
+        table.add_column("Profile")
+        table.add_column("Sessions", justify="right")
+        table.add_column("Decisions", justify="right")
+        table.add_column("Passed", justify="right")
+        table.add_column("Identities", justify="right")
+        table.add_column("Streak", justify="right")
+        for stats in results:
+            table.add_row(stats["profile"], str(stats["sessions"]), str(stats["decisions"]),
+                          str(stats["passed"]), str(stats["identities"]), f"{stats['current_streak']}d")
+        totals = aggregate_stats(results)
+        table.add_row("[bold]Total[/bold]", str(totals["sessions"]), str(totals["decisions"]),
+                      str(totals["passed"]), str(totals["identities"]), "")
+        console.print(table)
+    
+    else:
+        if format not in EXPORT_FORMATS:
+            console.print("[red]Unknown format. Use: markdown or json[/red]")
+            return
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        paths = map_profiles(export_profile, root, names, format, os.getcwd(), stamp, workers=workers)
+        for name, path in zip(names, paths):
+            console.print(f"[green]✓ Exported {name} to {path}[/green]")
+
+
+HEATMAP_SHADES = ["green4", "green3", "green1", "bright_green"]
+
+
+@app.command()
+def calendar(
+    year: int = typer.Option(None, help="Calendar year to show (default: the last 52 weeks)"),
+    bruce: str = typer.Option(None, help="Only count sessions held under the Bruce with this name")
+):
+    """Show a GitHub-style heatmap of session activity."""
+    service = get_service()
+    
+    if year is None:
+        last = date.today()
+        first = last - timedelta(weeks=52) + timedelta(days=1)
+        period = "Last 52 Weeks"
+    else:
+        first, last = date(year, 1, 1), date(year, 12, 31)
+        period = str(year)
+    
+    selected = None
+    if bruce:
+        matches = [b for b in service.all_bruces() if b.name.lower() == bruce.lower()]
+        if not matches:
+            console.print(f"[red]✗ No Bruce named '{bruce}'[/red]")
+            return
+        selected = matches[-1]
+        period += f" - {selected.name}"
+    activity = service.activity_calendar(selected)
+    
+    # One column per week, Monday first
+    start = first - timedelta(days=first.weekday())
+    counts = activity.counts_between(start, last)
+    weeks = (len(counts) + 6) // 7
+    
+    months = [" "] * (weeks + 3)
+    for week in range(weeks):
+        monday = start + timedelta(weeks=week)
+        label = monday.strftime('%b')
+        if monday.day <= 7 and all(c == " " for c in months[week:week + len(label) + 1]):
+            months[week:week + len(label)] = label
+    lines = ["    " + "".join(months).rstrip()]
+    
+    for weekday, label in enumerate(["Mon", "", "Wed", "", "Fri", "", "Sun"]):
+        cells = []
+        for week in range(weeks):
+            index = week * 7 + weekday
+            day = start + timedelta(days=index)
+            if day < first or day > last:
+                cells.append(" ")
+            elif counts[index] == 0:
+                cells.append("[grey30]■[/grey30]")
+            else:
+                shade = HEATMAP_SHADES[min(counts[index], len(HEATMAP_SHADES)) - 1]
+                cells.append(f"[{shade}]■[/{shade}]")
+        lines.append(f"{label:<4}" + "".join(cells).rstrip())
+    
+    legend = " ".join(f"[{shade}]■[/{shade}]" for shade in ["grey30"] + HEATMAP_SHADES)
+    lines.append(f"\n    Less {legend} More")
+    
+    in_period = counts[(first - start).days:]
+    active_days = sum(1 for count in in_period if count)
+    console.print(Panel.fit("\n".join(lines), title=f"📅 Activity - {period}"))
+    console.print(
+        f"{sum(in_period)} sessions on {active_days} days · "
+        f"current streak {activity.current_streak()} days · longest {activity.longest} days"
+    )
+
+
 @app.command()
 def export(format: str = typer.Option("markdown", help="Export format: markdown or json")):
     """Export all parliament data."""
     service = get_service()
     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
-    if format == "json":
-        filename = f"parliament_export_{timestamp}.json"
-        import json
-        import os
-        with open(filename, 'w') as f:
-            json.dump(service.state.dict(), f, indent=2)
-        abs_path = os.path.abspath(filename)
-        console.print(f"[green]✓ Exported to {abs_path}[/green]")
-    
-    elif format == "markdown":
-        filename = f"parliament_export_{timestamp}.md"
-        
-        with open(filename, 'w') as f:
-            f.write("# Parliament of Bruce - Complete Export\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            # Bruce timeline
-            f.write("## Bruce Identity Timeline\n\n")
-            all_bruces = service.state.bruce_history.copy()
-            if service.state.reigning_bruce:
-                all_bruces.append(service.state.reigning_bruce)
-            
-            for bruce in all_bruces:
-                f.write(f"### {bruce.name}\n")
-                f.write(f"- Start: {bruce.start_date}\n")
-                if bruce.end_date:
-                    f.write(f"- End: {bruce.end_date}\n")
-                f.write(f"- Reason: {bruce.reason_born}\n")
-                f.write(f"- Sessions: {bruce.session_count}\n")
-                if bruce.exit_report:
-                    f.write(f"- Exit: {bruce.exit_report}\n")
-                f.write("\n")
-            
-            # Journal entries
-            f.write("## Journal Entries\n\n")
-            for entry in service.state.journal_entries:
-                date = datetime.fromisoformat(entry.date).strftime('%Y-%m-%d')
-                f.write(f"### {date} - {entry.session_type}\n")
-                f.write(f"**Bruce:** {entry.reigning_bruce_name}\n\n")
-                f.write(f"**Short-Term:** {entry.short_term}\n\n")
-                f.write(f"**Mid-Term:** {entry.mid_term}\n\n")
-                f.write(f"**Long-Term:** {entry.long_term}\n\n")
-                f.write(f"**Purpose:** {entry.purpose}\n\n")
-                f.write(f"**Ultimate:** {entry.ultimate}\n\n")
-                f.write(f"**Reigning:** {entry.reigning}\n\n")
-                f.write(f"**Policy:** {entry.final_policy}\n\n")
-                f.write("---\n\n")
-        
-        import os
-        abs_path = os.path.abspath(filename)
-        console.print(f"[green]✓ Exported to {abs_path}[/green]")
+    if format not in EXPORT_FORMATS:
+        console.print("[red]Unknown format. Use: markdown or json[/red]")
+        return
     
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = f"parliament_export_{timestamp}.{EXPORT_FORMATS[format]}"
+    export_file(service, format, filename)
+    abs_path = os.path.abspath(filename)
+    console.print(f"[green]✓ Exported to {abs_path}[/green]")
+
+
+def event_summary(event: Event) -> str:
+    """One-line description of a change feed event."""
+    data = event.data
+    if "entry" in data:
+        entry = data["entry"]
+        policy = entry.get("final_policy", "")
+        return f"{entry.get('session_type')} session {entry.get('id')}: {policy[:60]}{'...' if len(policy) > 60 else ''}"
+    if "decision" in data:
+        decision = data["decision"]
+        return f"{decision.get('topic')}: {'PASSED' if decision.get('passed') else 'FAILED'}"
+    record = data.get("bruce") or data.get("voice") or {}
+    return f"{record.get('name')} ({record.get('id')})"
+
+
+def print_event(event: Event, as_json: bool):
+    if as_json:
+        typer.echo(event.json())
     else:
-        console.print("[red]Unknown format. Use: markdown or json[/red]")
+        console.print(f"[dim]#{event.seq}[/dim] {format_epoch(event.time, DATETIME_FORMAT)} "
+                      f"[cyan]{event.type}[/cyan] {event_summary(event)}", highlight=False)
+
+
+@app.command()
+def events(
+    after: int = typer.Option(0, help="Show events after this sequence number"),
+    limit: int = typer.Option(None, help="Show at most this many events"),
+    types: List[str] = typer.Option(None, "--type", help="Only events of this type (repeatable)"),
+    as_json: bool = typer.Option(False, "--json", help="Print one JSON object per line, for scripts"),
+    follow: bool = typer.Option(False, "--follow", "-f", help="Keep printing events as they are saved (Ctrl+C to stop)")
+):
+    """Show the change feed: saved sessions, decisions, rebirths and voice changes, in order."""
+    unknown = [t for t in types or [] if t not in EVENT_TYPES]
+    if unknown:
+        console.print(f"[red]✗ Unknown event type '{unknown[0]}': use {', '.join(EVENT_TYPES)}[/red]")
+        raise typer.Exit(code=1)
+    if after < 0 or (limit is not None and limit < 1):
+        console.print("[red]✗ --after must be at least 0 and --limit at least 1[/red]")
+        raise typer.Exit(code=1)
+    
+    storage = Storage.for_profile(current_profile["name"])
+    log = storage.event_log()
+    watcher = make_watcher(storage.events_index_file) if follow else None
+    shown = 0
+    try:
+        while True:
+            # Filtered reads can't stop at the limit, since skipped events don't count
+            batch = log.read(after, None if types else limit)
+            for event in batch:
+                after = event.seq
+                if types and event.type not in types:
+                    continue
+                print_event(event, as_json)
+                shown += 1
+                if limit is not None and shown >= limit:
+                    return
+            if watcher is None or not watcher.wait():
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if watcher is not None:
+            watcher.close()
+    
+    if not as_json and not follow:
+        if shown:
+            console.print(f"\n[dim]Resume with: pob events --after {after}[/dim]")
+        else:
+            console.print(f"[yellow]No events after #{after}[/yellow]")
+
+
+@app.command()
+def serve(
+    host: str = typer.Option(DEFAULT_HOST, help="Address to listen on"),
+    port: int = typer.Option(DEFAULT_PORT, help="Port to listen on (0 picks a free port)"),
+    verbose: bool = typer.Option(False, help="Log every request")
+):
+    """Serve the parliament as a local HTTP/JSON API."""
+    storage = Storage.for_profile(current_profile["name"], cache=STATE_CACHE)
+    try:
+        server = make_server(storage, host, port, verbose)
+    except OSError as e:
+        console.print(f"[red]✗ Could not listen on {host}:{port}: {e}[/red]")
+        raise typer.Exit(code=1)
+    
+    console.print(f"[green]✓ Serving on http://{host}:{server.server_port}[/green]")
+    console.print("[dim]Endpoints: GET /status /read /search /stats /timeline, POST /session /vote. Ctrl+C to stop.[/dim]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Server stopped[/yellow]")
+    finally:
+        server.server_close()
+
+
+@app.command()
+def shell():
+    """Interactive prompt that keeps the parliament loaded between commands."""
+    prompt = ParliamentShell(typer.main.get_command(app), current_profile["name"], warm_service, echo=console.print)
+    intro = prompt.intro
+    try:
+        while True:
+            try:
+                prompt.cmdloop(intro)
+                break
+            except KeyboardInterrupt:
+                # Ctrl+C abandons the current line, not the shell
+                console.print("^C")
+                intro = ""
+    finally:
+        prompt.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,143 @@
+"""Columnar side store of the journal fields analytics read.
+
+Analytics only ever look at when an entry was written, its session type,
+its Bruce and how long each seat's response was. Those values are kept as
+typed arrays, one per field, appended to as sessions are recorded and saved
+next to the data file, so queries scan compact integer columns instead of
+materializing entries or re-reading response text.
+
+Session types and Bruces are dictionary-encoded: each column stores a small
+integer code indexing ``session_types`` or ``bruces``.
+"""
+from array import array
+import base64
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+from .seats import DEFAULT_SEATS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional speedup
+    np = None
+
+
+SEAT_FIELDS = DEFAULT_SEATS.permanent_fields
+
+FORMAT_VERSION = 1
+
+# Column name -> array typecode
+COLUMN_TYPES = {
+    "epochs": "q",
+    "type_codes": "H",
+    "bruce_codes": "i",
+    **{field: "i" for field in SEAT_FIELDS},
+}
+
+
+class JournalColumns:
+    """Per-entry epochs, session type codes, Bruce codes and seat response lengths."""
+
+    def __init__(self):
+        self.columns: Dict[str, array] = {name: array(code) for name, code in COLUMN_TYPES.items()}
+        self.session_types: List[str] = []
+        self.bruces: List[Tuple[Optional[str], str]] = []  # (bruce id, name)
+        self.last_id: Optional[str] = None
+        self._type_codes: Dict[str, int] = {}
+        self._bruce_codes: Dict[Tuple[Optional[str], str], int] = {}
+
+    @classmethod
+    def from_entries(cls, entries) -> "JournalColumns":
+        """Build columns from journal entries in chronological order."""
+        columns = cls()
+        columns.extend(entries)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.columns["epochs"])
+
+    @property
+    def epochs(self) -> array:
+        return self.columns["epochs"]
+
+    def append(self, entry) -> None:
+        """Record a newly written journal entry."""
+        type_code = self._type_codes.get(entry.session_type)
+        if type_code is None:
+            type_code = self._type_codes[entry.session_type] = len(self.session_types)
+            self.session_types.append(entry.session_type)
+
+        bruce = (entry.reigning_bruce_id, entry.reigning_bruce_name)
+        bruce_code = self._bruce_codes.get(bruce)
+        if bruce_code is None:
+            bruce_code = self._bruce_codes[bruce] = len(self.bruces)
+            self.bruces.append(bruce)
+
+        columns = self.columns
+        columns["epochs"].append(entry.epoch)
+        columns["type_codes"].append(type_code)
+        columns["bruce_codes"].append(bruce_code)
+        for field in SEAT_FIELDS:
+            columns[field].append(len(getattr(entry, field)))
+        self.last_id = entry.id
+
+    def extend(self, entries) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def catch_up(self, entries: Sequence) -> bool:
+        """Append entries written since these columns were saved.
+
+        Returns False when the columns do not describe a prefix of the
+        journal and must be rebuilt.
+        """
+        count = len(self)
+        if count > len(entries) or (count and entries[count - 1].id != self.last_id):
+            return False
+        self.extend(entries[count:])
+        return True
+
+    def array(self, name: str, dtype=None):
+        """A column as a NumPy array (a copy, so the column can keep growing)."""
+        return np.array(self.columns[name], dtype=dtype or np.int64)
+
+    def session_type_counts(self) -> Dict[str, int]:
+        """Number of entries of each session type, in first-seen order."""
+        if np is not None and len(self):
+            counts = np.bincount(self.array("type_codes"), minlength=len(self.session_types)).tolist()
+        else:
+            counts = [0] * len(self.session_types)
+            for code in self.columns["type_codes"]:
+                counts[code] += 1
+        return dict(zip(self.session_types, counts))
+
+    def to_dict(self) -> Dict:
+        """Serializable form: metadata plus base64-encoded column bytes."""
+        return {
+            "format": FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "count": len(self),
+            "last_id": self.last_id,
+            "session_types": self.session_types,
+            "bruces": [list(bruce) for bruce in self.bruces],
+            "columns": {name: base64.b64encode(column.tobytes()).decode("ascii") for name, column in self.columns.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> Optional["JournalColumns"]:
+        """Rebuild columns from to_dict() output, or None if it is unusable."""
+        if data.get("format") != FORMAT_VERSION or data.get("byteorder") != sys.byteorder:
+            return None
+
+        columns = cls()
+        for name, code in COLUMN_TYPES.items():
+            column = array(code)
+            column.frombytes(base64.b64decode(data["columns"][name]))
+            if len(column) != data["count"]:
+                return None
+            columns.columns[name] = column
+        columns.session_types = list(data["session_types"])
+        columns.bruces = [tuple(bruce) for bruce in data["bruces"]]
+        columns.last_id = data["last_id"]
+        columns._type_codes = {name: code for code, name in enumerate(columns.session_types)}
+        columns._bruce_codes = {bruce: code for code, bruce in enumerate(columns.bruces)}
+        return columns
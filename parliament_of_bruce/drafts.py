@@ -0,0 +1,135 @@
+"""Crash-safe drafts of interactive sessions.
+
+While a session is being typed, every answer is appended to a small
+JSON-lines log next to the data file and fsynced before the next prompt, so
+a crash, dropped connection or Ctrl+C loses at most the answer being typed.
+Replaying the log rebuilds the responses, the current round and which seats
+have already spoken in it, which is what ``pob session --resume`` needs.
+
+A draft carries the ID its journal entry will be recorded under. Committing
+saves the entry (the data file is replaced atomically) and then deletes the
+draft; if the process dies in between, the entry already exists on resume
+and the draft is simply discarded, so a session is never recorded twice.
+"""
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Set
+from .models import new_record_id
+
+
+class SessionDraft:
+    """An in-progress session, mirrored to an append-only log."""
+
+    def __init__(self, path: Path, session_type: str, entry_id: str, started: str):
+        self.path = path
+        self.session_type = session_type
+        self.entry_id = entry_id
+        self.started = started
+        self.permanent: Dict[str, str] = {}
+        self.temporary: Dict[str, str] = {}
+        self.round_num = 1
+        self.answered: Set[str] = set()  # seats that have spoken this round
+        self.rotation_ended = False
+        self._file = None
+
+    @classmethod
+    def start(cls, path: Path, session_type: str) -> "SessionDraft":
+        """Begin a new draft, replacing any previous one."""
+        draft = cls(path, session_type, new_record_id(), datetime.now().isoformat())
+        draft._file = open(path, "w", encoding="utf-8")
+        draft._append({"kind": "start", "session_type": session_type, "entry_id": draft.entry_id, "started": draft.started})
+        return draft
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["SessionDraft"]:
+        """Replay a saved draft, or None if there is none.
+
+        A torn final line (the process died while writing it) is ignored.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.read().split("\n")
+        except FileNotFoundError:
+            return None
+
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break
+        if not records or records[0].get("kind") != "start":
+            return None
+
+        header = records[0]
+        draft = cls(path, header["session_type"], header["entry_id"], header["started"])
+        for record in records[1:]:
+            draft._apply(record)
+        return draft
+
+    @property
+    def is_empty(self) -> bool:
+        """True until some seat has answered."""
+        return not self.permanent and not self.temporary
+
+    def _append(self, record: Dict) -> None:
+        """Write one record and make it durable before returning."""
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _record(self, record: Dict) -> None:
+        self._append(record)
+        self._apply(record)
+
+    def _apply(self, record: Dict) -> None:
+        kind = record["kind"]
+        if kind == "answer":
+            responses = self.temporary if record.get("temporary") else self.permanent
+            seat, text = record["seat"], record["text"]
+            if not responses.get(seat):
+                responses[seat] = text
+            elif text:
+                # Only a non-empty earlier answer gets a round marker, as in rotate_session
+                responses[seat] += f"\n\n[Round {self.round_num}] {text}"
+            self.answered.add(seat)
+        elif kind == "round":
+            self.round_num += 1
+            self.answered = set()
+        elif kind == "end":
+            self.rotation_ended = True
+        elif kind == "set":
+            self.permanent[record["field"]] = record["text"]
+
+    def answer(self, seat: str, text: str, temporary: bool = False) -> None:
+        """Record a seat's response in the current round."""
+        self._record({"kind": "answer", "seat": seat, "text": text, "temporary": temporary})
+
+    def next_round(self) -> None:
+        """Start another round of discussion."""
+        self._record({"kind": "round"})
+
+    def end_rotation(self) -> None:
+        """Finish the rotating discussion."""
+        self._record({"kind": "end"})
+
+    def set_field(self, field: str, text: str) -> None:
+        """Record a closing response such as the synthesis or final policy."""
+        self._record({"kind": "set", "field": field, "text": text})
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self) -> None:
+        """Delete the draft once its session is recorded (or abandoned)."""
+        self.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,254 @@
+"""The change feed: a durable, numbered log of saved changes, and hooks on it.
+
+Every change a ParliamentService saves is also recorded as an Event in
+``events.jsonl`` next to the data file, one JSON object per line, numbered
+from 1 in the order the changes were saved. ``events.idx`` holds each
+event's byte offset in the log as a fixed-width 8-byte integer, so the
+events after sequence number N start at the offset stored at byte 8*N of
+the index: a consumer resuming from N reads only the new events, however
+long the log has grown. Appends hold an exclusive lock on the index (where
+the platform has one), so processes saving at once still get distinct,
+ordered sequence numbers.
+
+Events are written after the state they describe, so no event describes a
+change that was not saved. An event written but not indexed when a process
+died is indexed by the next append, and a torn last line is cut off.
+
+In-process hooks receive the same events on a worker thread fed by a bounded
+queue (HookRunner), so a slow hook never holds up a command. Events that
+arrive while the queue is full are not passed to the hooks; they remain in
+the log for consumers to catch up from. Packages can register hooks through
+the ``parliament_of_bruce.hooks`` entry point group: each entry point names
+a function that is called with the HookRunner and registers its hooks.
+"""
+import atexit
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+from importlib import metadata
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
+from pydantic import BaseModel, Field
+from .timeutil import now_epoch
+
+try:
+    import fcntl
+except ImportError:  # Windows has no fcntl; appends there are not locked
+    fcntl = None
+
+
+# Event types, with the record each carries in its data
+SESSION_CREATED = "session.created"  # entry, position
+DECISION_RECORDED = "decision.recorded"  # decision
+BRUCE_BORN = "bruce.born"  # bruce, previous_id
+BRUCE_ENDED = "bruce.ended"  # bruce
+VOICE_ADDED = "voice.added"  # voice
+VOICE_UPDATED = "voice.updated"  # voice
+VOICE_DISMISSED = "voice.dismissed"  # voice
+VOICE_EXPIRED = "voice.expired"  # voice
+
+EVENT_TYPES = (
+    SESSION_CREATED, DECISION_RECORDED, BRUCE_BORN, BRUCE_ENDED,
+    VOICE_ADDED, VOICE_UPDATED, VOICE_DISMISSED, VOICE_EXPIRED,
+)
+
+HOOK_ENTRY_POINTS = "parliament_of_bruce.hooks"
+
+# Events waiting for the hooks before new ones are dropped
+HOOK_QUEUE_SIZE = 1000
+
+# Seconds a process waits at exit for the hooks to finish queued events
+HOOK_EXIT_TIMEOUT = 2.0
+
+OFFSET = struct.Struct("<Q")
+
+
+class Event(BaseModel):
+    """One saved change to the parliament."""
+    seq: int = 0  # assigned when the event is written to the log
+    type: str
+    time: int = Field(default_factory=now_epoch)  # epoch seconds
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+
+class EventLog:
+    """The append-only event log and its offset index."""
+
+    def __init__(self, path: Path, index_path: Path):
+        self.path = path
+        self.index_path = index_path
+
+    def __len__(self) -> int:
+        """Sequence number of the last indexed event."""
+        try:
+            return os.path.getsize(self.index_path) // OFFSET.size
+        except OSError:
+            return 0
+
+    def append(self, events: List[Event]) -> None:
+        """Number the events and write them to the log, durably."""
+        if not events:
+            return
+        with open(self.index_path, 'a+b') as index:
+            if fcntl is not None:
+                fcntl.flock(index.fileno(), fcntl.LOCK_EX)
+            try:
+                count, offset = self._recover(index)
+                lines = []
+                offsets = []
+                for event in events:
+                    count += 1
+                    event.seq = count
+                    line = (event.json() + "\n").encode("utf-8")
+                    offsets.append(offset)
+                    offset += len(line)
+                    lines.append(line)
+                with open(self.path, 'ab') as log:
+                    log.write(b"".join(lines))
+                    log.flush()
+                    os.fsync(log.fileno())
+                index.write(b"".join(OFFSET.pack(o) for o in offsets))
+                index.flush()
+                os.fsync(index.fileno())
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(index.fileno(), fcntl.LOCK_UN)
+
+    def _recover(self, index: BinaryIO) -> Tuple[int, int]:
+        """(events indexed, end of the last one in the log), first indexing
+        any events a crashed append wrote but did not index.
+        """
+        size = index.seek(0, os.SEEK_END)
+        count = size // OFFSET.size
+        if size % OFFSET.size:
+            index.truncate(count * OFFSET.size)
+        try:
+            log = open(self.path, 'r+b')
+        except FileNotFoundError:
+            index.truncate(0)
+            return 0, 0
+        with log:
+            end = 0
+            if count:
+                index.seek((count - 1) * OFFSET.size)
+                log.seek(OFFSET.unpack(index.read(OFFSET.size))[0])
+                line = log.readline()
+                if not line.endswith(b"\n"):
+                    # The log lost events the index has; index it again from the start
+                    count = 0
+                    index.truncate(0)
+                else:
+                    end = log.tell()
+            log.seek(end)
+            unindexed = []
+            for line in log:
+                if not line.endswith(b"\n"):
+                    break
+                unindexed.append(end)
+                end += len(line)
+            log.truncate(end)  # drop a torn last line
+        index.seek(0, os.SEEK_END)
+        if unindexed:
+            index.write(b"".join(OFFSET.pack(o) for o in unindexed))
+        return count + len(unindexed), end
+
+    def read(self, after: int = 0, limit: Optional[int] = None) -> List[Event]:
+        """Events with sequence numbers above `after`, oldest first, at most `limit`."""
+        count = len(self) - max(after, 0)
+        if limit is not None:
+            count = min(count, limit)
+        if count <= 0:
+            return []
+        with open(self.index_path, 'rb') as index:
+            index.seek(max(after, 0) * OFFSET.size)
+            start = OFFSET.unpack(index.read(OFFSET.size))[0]
+        events = []
+        with open(self.path, 'rb') as log:
+            log.seek(start)
+            for line in log:
+                events.append(Event.parse_raw(line))
+                if len(events) == count:
+                    break
+        return events
+
+
+class HookRunner:
+    """Passes events to registered hooks on a worker thread."""
+
+    def __init__(self, maxsize: int = HOOK_QUEUE_SIZE):
+        self.hooks: List[Tuple[Callable[[Event], Any], Optional[frozenset]]] = []
+        self.dropped = 0  # events not passed to the hooks because the queue was full
+        self.failures = 0  # hook calls that raised
+        self._queue: "queue.Queue[Event]" = queue.Queue(maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._plugins_loaded = False
+        self._lock = threading.Lock()
+
+    def register(self, hook: Callable[[Event], Any], types: Optional[Iterable[str]] = None) -> None:
+        """Call `hook(event)` for every event, or only for events of the given types."""
+        self.hooks.append((hook, frozenset(types) if types is not None else None))
+
+    def load_plugins(self) -> None:
+        """Let installed plugins register their hooks (once per process)."""
+        if self._plugins_loaded:
+            return
+        self._plugins_loaded = True
+        for entry_point in metadata.entry_points(group=HOOK_ENTRY_POINTS):
+            try:
+                entry_point.load()(self)
+            except Exception as e:
+                print(f"pob: hook plugin '{entry_point.name}' failed to load: {e}", file=sys.stderr)
+
+    def publish(self, events: List[Event]) -> None:
+        """Queue events for the hooks without waiting for them."""
+        self.load_plugins()
+        if not self.hooks:
+            return
+        self._start()
+        for event in events:
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                self.dropped += 1
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the hooks have handled every queued event; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                left = None if deadline is None else deadline - time.monotonic()
+                if left is not None and left <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(left)
+        return True
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                # A daemon thread, so a stuck hook cannot keep the process alive
+                self._thread = threading.Thread(target=self._work, name="pob-hooks", daemon=True)
+                self._thread.start()
+                atexit.register(self.drain, HOOK_EXIT_TIMEOUT)
+
+    def _work(self) -> None:
+        while True:
+            event = self._queue.get()
+            try:
+                for hook, types in list(self.hooks):
+                    if types is not None and event.type not in types:
+                        continue
+                    try:
+                        hook(event)
+                    except Exception as e:
+                        self.failures += 1
+                        print(f"pob: hook {getattr(hook, '__name__', hook)!r} failed on event {event.seq}: {e}",
+                              file=sys.stderr)
+            finally:
+                self._queue.task_done()
+
+
+# Hooks of every service in this process
+HOOKS = HookRunner()
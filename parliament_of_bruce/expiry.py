@@ -0,0 +1,70 @@
+"""Automatic dismissal of temporary voices.
+
+A voice can be added with a time limit, a session limit or both. Its
+deadlines are pushed onto two min-heaps, one keyed by epoch seconds and one
+by journal length, so a sweep only pops the voices that are actually due:
+O(log n) per expired voice, and a single comparison when nothing is.
+Dismissing a voice by hand leaves its heap items behind; they are skipped
+when popped.
+
+The heaps live in memory only. The state records the earliest deadline of
+each kind, so a service that starts with nothing due never builds them.
+"""
+import heapq
+from typing import Dict, List, Optional, Tuple
+from .models import TemporaryBruce
+
+
+class VoiceSweeper:
+    """Deadline heaps over the temporary voices that can expire."""
+
+    def __init__(self):
+        self._by_time: List[Tuple[int, str]] = []
+        self._by_session: List[Tuple[int, str]] = []
+
+    @classmethod
+    def build(cls, voices: Dict[str, TemporaryBruce]) -> "VoiceSweeper":
+        """Heap the deadlines of every active voice."""
+        sweeper = cls()
+        for voice in voices.values():
+            if voice.active:
+                sweeper._push(voice)
+        heapq.heapify(sweeper._by_time)
+        heapq.heapify(sweeper._by_session)
+        return sweeper
+
+    def _push(self, voice: TemporaryBruce) -> None:
+        if voice.expires_at is not None:
+            self._by_time.append((voice.expires_at, voice.id))
+        if voice.expires_at_session is not None:
+            self._by_session.append((voice.expires_at_session, voice.id))
+
+    def add(self, voice: TemporaryBruce) -> None:
+        """Track a newly added voice's deadlines."""
+        if voice.expires_at is not None:
+            heapq.heappush(self._by_time, (voice.expires_at, voice.id))
+        if voice.expires_at_session is not None:
+            heapq.heappush(self._by_session, (voice.expires_at_session, voice.id))
+
+    def __len__(self) -> int:
+        return len(self._by_time) + len(self._by_session)
+
+    def next_deadlines(self) -> Tuple[Optional[int], Optional[int]]:
+        """Earliest (epoch, journal length) deadline, or None for an empty heap."""
+        return (self._by_time[0][0] if self._by_time else None,
+                self._by_session[0][0] if self._by_session else None)
+
+    def sweep(self, voices: Dict[str, TemporaryBruce], now: int, sessions: int) -> List[TemporaryBruce]:
+        """Deactivate voices whose deadline is at or before `now` or `sessions`.
+
+        Returns the voices dismissed by this sweep.
+        """
+        expired = []
+        for heap, limit, attr in ((self._by_time, now, "expires_at"), (self._by_session, sessions, "expires_at_session")):
+            while heap and heap[0][0] <= limit:
+                deadline, voice_id = heapq.heappop(heap)
+                voice = voices.get(voice_id)
+                if voice is not None and voice.active and getattr(voice, attr) == deadline:
+                    voice.active = False
+                    expired.append(voice)
+        return expired
@@ -0,0 +1,74 @@
+"""Export a parliament as JSON or Markdown.
+
+Kept separate from the CLI so the same export can be written for one
+profile from the command line or for many profiles by worker processes.
+"""
+from datetime import datetime
+import json
+from typing import TextIO
+from .timeutil import SECONDS_FORMAT, format_epoch
+
+
+# Export format -> file extension
+EXPORT_FORMATS = {"json": "json", "markdown": "md"}
+
+
+def write_json(service, f: TextIO) -> None:
+    """Write the complete state as JSON."""
+    json.dump(service.state.dict(), f, indent=2)
+
+
+def write_markdown(service, f: TextIO) -> None:
+    """Write the Bruce timeline, journal and decisions as Markdown."""
+    f.write("# Parliament of Bruce - Complete Export\n\n")
+    f.write(f"Generated: {datetime.now().strftime(SECONDS_FORMAT)}\n\n")
+    
+    # Bruce timeline
+    f.write("## Bruce Identity Timeline\n\n")
+    for bruce in service.all_bruces():
+        f.write(f"### {bruce.name}\n")
+        f.write(f"- Start: {bruce.start_date}\n")
+        if bruce.end_date:
+            f.write(f"- End: {bruce.end_date}\n")
+        f.write(f"- Reason: {bruce.reason_born}\n")
+        f.write(f"- Sessions: {bruce.session_count}\n")
+        if bruce.exit_report:
+            f.write(f"- Exit: {bruce.exit_report}\n")
+        f.write("\n")
+    
+    # Journal entries
+    f.write("## Journal Entries\n\n")
+    for entry in service.state.journal_entries:
+        date = format_epoch(entry.epoch)
+        f.write(f"### {date} - {entry.session_type}\n")
+        f.write(f"**Bruce:** {entry.reigning_bruce_name}\n\n")
+        for seat in service.seats:
+            f.write(f"**{seat.label}:** {getattr(entry, seat.field)}\n\n")
+        f.write(f"**Policy:** {entry.final_policy}\n\n")
+        decisions = service.decisions_for_entry(entry)
+        if decisions:
+            f.write("**Decisions:**\n")
+            for dec in decisions:
+                f.write(f"- {dec.topic}: {'PASSED' if dec.passed else 'FAILED'}\n")
+            f.write("\n")
+        f.write("---\n\n")
+    
+    # Decisions not voted during a session
+    unlinked = [d for d in service.state.decisions if service.entry_for_decision(d) is None]
+    if unlinked:
+        f.write("## Other Decisions\n\n")
+        for dec in unlinked:
+            date = format_epoch(dec.epoch)
+            f.write(f"- {date} - {dec.topic}: {'PASSED' if dec.passed else 'FAILED'}\n")
+        f.write("\n")
+
+
+def export_file(service, format: str, path) -> None:
+    """Write an export in `format` ('json' or 'markdown') to `path`."""
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{format}'")
+    with open(path, 'w') as f:
+        if format == "json":
+            write_json(service, f)
+        else:
+            write_markdown(service, f)
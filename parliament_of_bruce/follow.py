@@ -0,0 +1,204 @@
+"""Following the journal as other processes write to it.
+
+``pob read --follow`` tails the journal log (``journal.jsonl``, see scan.py),
+which every save keeps caught up once it exists. Only the bytes appended
+since the follower last read are parsed, from the offset it has reached, so
+a new entry costs one short read instead of reloading the data file. A line
+is consumed only once its newline has been written. If the log is replaced
+(it is rewritten when it no longer matches the journal), it is read again
+from the start and records at journal positions already seen are skipped.
+
+Changes are waited for with inotify on Linux, called through ctypes so no
+extra package is needed. The log's directory is watched rather than the
+file, so a replaced log is still seen. Where inotify is unavailable, the
+log's size and mtime are polled instead.
+"""
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from .cache import file_stamp
+
+# Seconds between stat polls when inotify is unavailable
+POLL_INTERVAL = 0.5
+
+# Bytes before the end of the log a follower starts reading from; records
+# at positions it has already seen are skipped
+TAIL_BYTES = 1 << 16
+
+# From <sys/inotify.h>
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# struct inotify_event: wd, mask, cookie, len, then len bytes of name
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until a time.monotonic() deadline, or None for no deadline."""
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+class StatWatcher:
+    """Waits for a file to change by polling its size and mtime."""
+
+    def __init__(self, path: Path, interval: float = POLL_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.stamp = file_stamp(path)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the file changes; False if `timeout` seconds pass first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            stamp = file_stamp(self.path)
+            if stamp != self.stamp:
+                self.stamp = stamp
+                return True
+            left = remaining(deadline)
+            if left == 0:
+                return False
+            time.sleep(self.interval if left is None else min(self.interval, left))
+
+    def close(self) -> None:
+        pass
+
+
+def event_names(data: bytes) -> Iterator[str]:
+    """File names in a buffer of inotify events."""
+    offset = 0
+    while offset + EVENT_HEADER.size <= len(data):
+        _, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+        offset += EVENT_HEADER.size
+        yield os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+        offset += length
+
+
+class InotifyWatcher:
+    """Waits for a file to change using inotify on its directory (Linux only).
+
+    Raises OSError if inotify is unavailable.
+    """
+
+    def __init__(self, path: Path):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            init, add_watch = libc.inotify_init1, libc.inotify_add_watch
+        except (OSError, AttributeError) as e:
+            raise OSError(f"inotify is unavailable: {e}")
+        self.path = path
+        self._fd = init(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        if add_watch(self._fd, os.fsencode(str(path.parent)), mask) < 0:
+            error = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(error, os.strerror(error))
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the file changes; False if `timeout` seconds pass first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            ready, _, _ = select.select([self._fd], [], [], remaining(deadline))
+            if not ready:
+                return False
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                continue
+            if self.path.name in event_names(data):
+                return True
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def make_watcher(path: Path):
+    """An InotifyWatcher for the file where possible, otherwise a StatWatcher."""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(path)
+        except OSError:
+            pass
+    return StatWatcher(path)
+
+
+class JournalFollower:
+    """Reads the records appended to the journal log since it was last read."""
+
+    def __init__(self, path: Path, offset: int = 0, last: int = -1):
+        """Start reading at byte `offset`, after the record at journal position `last`.
+
+        An offset inside a line skips to the next one.
+        """
+        self.path = path
+        self.offset = offset
+        self.last = last
+        self._inode = None
+        self._partial = offset > 0
+
+    @classmethod
+    def from_end(cls, path: Path, last: int) -> "JournalFollower":
+        """A follower for records after position `last`, starting near the end of the log."""
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        return cls(path, max(0, size - TAIL_BYTES), last)
+
+    def read_new(self) -> List[Dict]:
+        """Records written since the last read, in journal order."""
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return []
+        with f:
+            stat = os.fstat(f.fileno())
+            if self._inode is not None and (stat.st_ino != self._inode or stat.st_size < self.offset):
+                # Replaced or truncated: read it again from the start
+                self.offset = 0
+                self._partial = False
+            self._inode = stat.st_ino
+            f.seek(self.offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        start = 0
+        if self._partial and end:
+            start = data.index(b"\n") + 1
+            self._partial = False
+        self.offset += end
+
+        records = []
+        for line in data[start:end].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record.get("n"), int) and record["n"] > self.last:
+                records.append(record)
+                self.last = record["n"]
+        return records
+
+    def follow(self, watcher, timeout: Optional[float] = None) -> Iterator[Dict]:
+        """Yield records as they are written.
+
+        Runs until interrupted, or until `timeout` seconds pass without a change.
+        """
+        while True:
+            yield from self.read_new()
+            if not watcher.wait(timeout):
+                return
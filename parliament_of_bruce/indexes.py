@@ -0,0 +1,199 @@
+"""In-memory indexes over the parliament state.
+
+Indexes are built lazily from the loaded state and kept current by
+ParliamentService as records are written, so lookups never rescan the
+journal.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+from .models import Decision, JournalEntry, ParliamentState
+
+
+class RecordIndex:
+    """Lookups from entry and decision IDs, linking decisions to entries both ways."""
+
+    def __init__(self):
+        self.entry_positions: Dict[str, int] = {}
+        self.decisions: Dict[str, Decision] = {}
+
+    @classmethod
+    def build(cls, state: ParliamentState) -> "RecordIndex":
+        """Index every entry and decision in the state."""
+        index = cls()
+        for position, entry in enumerate(state.journal_entries):
+            index.add_entry(entry, position)
+        for decision in state.decisions:
+            index.add_decision(decision)
+        return index
+
+    def add_entry(self, entry: JournalEntry, position: int) -> None:
+        """Record a journal entry's position in the journal."""
+        self.entry_positions[entry.id] = position
+
+    def add_decision(self, decision: Decision) -> None:
+        """Record a decision by ID."""
+        self.decisions[decision.id] = decision
+
+    def decisions_for(self, entry: JournalEntry) -> List[Decision]:
+        """Decisions voted in an entry's session, in voting order."""
+        return [self.decisions[i] for i in entry.decision_ids if i in self.decisions]
+
+    def entry_position(self, decision: Decision) -> Optional[int]:
+        """Journal position of the entry a decision was voted in, if any."""
+        if decision.entry_id is None:
+            return None
+        return self.entry_positions.get(decision.entry_id)
+
+
+class BruceSummary:
+    """Running aggregates over one reign's entries and decisions."""
+
+    __slots__ = ("bruce_id", "first_position", "last_position", "entry_count",
+                 "first_epoch", "last_epoch", "session_types", "decision_count", "passed_count")
+
+    def __init__(self, bruce_id: Optional[str]):
+        self.bruce_id = bruce_id
+        self.first_position: Optional[int] = None
+        self.last_position: Optional[int] = None
+        self.entry_count = 0
+        self.first_epoch: Optional[int] = None
+        self.last_epoch: Optional[int] = None
+        self.session_types: Dict[str, int] = {}
+        self.decision_count = 0
+        self.passed_count = 0
+
+    @property
+    def entry_range(self) -> Optional[Tuple[int, int]]:
+        """Journal positions of the reign's first and last entries (inclusive)."""
+        if self.first_position is None:
+            return None
+        return self.first_position, self.last_position
+
+    @property
+    def contiguous(self) -> bool:
+        """Whether every entry in the range belongs to this reign."""
+        return self.first_position is None or self.last_position - self.first_position + 1 == self.entry_count
+
+
+class BruceIndex:
+    """Per-Bruce entry ranges and aggregates, keyed by Bruce ID.
+
+    Reigns follow each other, so a Bruce's entries normally form one
+    contiguous run of the journal; summaries store that run's bounds so a
+    reign's sessions can be sliced out without scanning the journal.
+    Records made with no Bruce reigning are summarized under ``None``.
+    """
+
+    def __init__(self):
+        self.summaries: Dict[Optional[str], BruceSummary] = {}
+
+    @classmethod
+    def build(cls, state: ParliamentState) -> "BruceIndex":
+        """Summarize every entry and decision in the state."""
+        index = cls()
+        for position, entry in enumerate(state.journal_entries):
+            index.add_entry(entry, position)
+        for decision in state.decisions:
+            index.add_decision(decision)
+        return index
+
+    def summary(self, bruce_id: Optional[str]) -> BruceSummary:
+        """Aggregates for a Bruce, empty if it has no records."""
+        summary = self.summaries.get(bruce_id)
+        if summary is None:
+            summary = self.summaries[bruce_id] = BruceSummary(bruce_id)
+        return summary
+
+    def add_entry(self, entry: JournalEntry, position: int) -> None:
+        """Extend a reign's range and counts with an appended entry."""
+        summary = self.summary(entry.reigning_bruce_id)
+        if summary.first_position is None:
+            summary.first_position = position
+            summary.first_epoch = entry.epoch
+        summary.last_position = position
+        summary.last_epoch = entry.epoch
+        summary.entry_count += 1
+        summary.session_types[entry.session_type] = summary.session_types.get(entry.session_type, 0) + 1
+
+    def add_decision(self, decision: Decision) -> None:
+        """Count a decision against the Bruce reigning when it was made."""
+        summary = self.summary(decision.reigning_bruce_id)
+        summary.decision_count += 1
+        if decision.passed:
+            summary.passed_count += 1
+
+    def positions_for(self, bruce_id: Optional[str], entries: List[JournalEntry]) -> Sequence[int]:
+        """Journal positions of a Bruce's entries: its range, filtered only if not contiguous."""
+        summary = self.summaries.get(bruce_id)
+        if summary is None or summary.first_position is None:
+            return []
+        run = range(summary.first_position, summary.last_position + 1)
+        if summary.contiguous:
+            return run
+        return [position for position in run if entries[position].reigning_bruce_id == bruce_id]
+
+    def entries_for(self, bruce_id: Optional[str], entries: List[JournalEntry]) -> List[JournalEntry]:
+        """A Bruce's journal entries, sliced from the journal by its range."""
+        summary = self.summaries.get(bruce_id)
+        if summary is None or summary.first_position is None:
+            return []
+        run = entries[summary.first_position:summary.last_position + 1]
+        if summary.contiguous:
+            return run
+        return [entry for entry in run if entry.reigning_bruce_id == bruce_id]
+
+
+class VoiceIndex:
+    """Journal positions of each temporary voice's statements, keyed by voice ID.
+
+    Positions are appended in journal order, so a voice's latest k
+    statements are the last k positions of its list.
+    """
+
+    def __init__(self):
+        self.positions: Dict[str, List[int]] = {}
+
+    @classmethod
+    def build(cls, state: ParliamentState) -> "VoiceIndex":
+        """Index every temporary voice response in the journal."""
+        index = cls()
+        for position, entry in enumerate(state.journal_entries):
+            index.add_entry(entry, position)
+        return index
+
+    def add_entry(self, entry: JournalEntry, position: int) -> None:
+        """Record the voices that spoke in an appended entry."""
+        for voice_id in entry.temporary_bruce_entries:
+            self.positions.setdefault(voice_id, []).append(position)
+
+    def count(self, voice_id: str) -> int:
+        """Number of entries a voice spoke in."""
+        return len(self.positions.get(voice_id, ()))
+
+    def latest(self, voice_id: str, count: int) -> List[int]:
+        """Positions of a voice's latest count entries, newest first."""
+        if count <= 0:
+            return []
+        return self.positions.get(voice_id, [])[-count:][::-1]
+
+
+class SessionTypeIndex:
+    """Journal positions of each session type's entries, keyed by lowercased type."""
+
+    def __init__(self):
+        self.positions: Dict[str, List[int]] = {}
+
+    @classmethod
+    def build(cls, state: ParliamentState) -> "SessionTypeIndex":
+        """Index every entry's session type."""
+        index = cls()
+        for position, entry in enumerate(state.journal_entries):
+            index.add_entry(entry, position)
+        return index
+
+    def add_entry(self, entry: JournalEntry, position: int) -> None:
+        """Record an appended entry under its session type."""
+        self.positions.setdefault(entry.session_type.lower(), []).append(position)
+
+    def entries_of(self, session_type: str) -> List[int]:
+        """Positions of a session type's entries, in journal order."""
+        return self.positions.get(session_type.lower(), [])
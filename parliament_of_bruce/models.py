@@ -1,6 +1,19 @@
+import copy
 from datetime import datetime
+import sys
 from typing import Optional, List, Dict
-from pydantic import BaseModel, Field
+import uuid
+from pydantic import BaseModel, Field, validator
+from .timeutil import to_epoch
+
+
+# Statements each temporary voice keeps in its own recent history
+RECENT_STATEMENTS = 10
+
+
+def new_record_id() -> str:
+    """Generate an ID for a journal entry or decision."""
+    return uuid.uuid4().hex[:12]
 
 
 class Seat(BaseModel):
@@ -19,11 +32,21 @@ class TemporaryBruce(BaseModel):
     description: str
     created_at: str = Field(default_factory=lambda: datetime.now().isoformat())
     last_statement: str = ""
-    active: bool = True
+    recent_statements: List[str] = Field(default_factory=list)  # newest last, at most RECENT_STATEMENTS
+    active: bool = True  # False once dismissed; kept so old entries still resolve its name
+    expires_at: Optional[int] = None  # epoch seconds after which the voice is dismissed
+    expires_at_session: Optional[int] = None  # dismissed once the journal holds this many entries
+    
+    def remember(self, statement: str) -> None:
+        """Make a statement the voice's latest, dropping the oldest beyond RECENT_STATEMENTS."""
+        self.last_statement = statement
+        self.recent_statements.append(statement)
+        del self.recent_statements[:-RECENT_STATEMENTS]
 
 
 class ReigningBruce(BaseModel):
     """Represents the current identity version."""
+    id: str = Field(default_factory=new_record_id)
     name: str
     start_date: str
     reason_born: str
@@ -34,6 +57,7 @@ class ReigningBruce(BaseModel):
 
 class Decision(BaseModel):
     """Represents a voted-upon decision."""
+    id: str = Field(default_factory=new_record_id)
     topic: str
     options: List[str]
     votes: Dict[str, str]
@@ -41,22 +65,115 @@ class Decision(BaseModel):
     scores_breakdown: Dict[str, int]
     passed: bool
     timestamp: str
+    epoch: Optional[int] = None  # derived from timestamp when missing
+    entry_id: Optional[str] = None  # journal entry this decision was voted in
+    reigning_bruce_id: Optional[str] = None
+    
+    @validator("epoch", always=True)
+    def _fill_epoch(cls, value, values):
+        if value is None and "timestamp" in values:
+            return to_epoch(values["timestamp"])
+        return value
+
+
+class JournalEntry:
+    """Represents a parliament session entry.
+    
+    Entries make up most of the state, so this is a slotted class rather than
+    a pydantic model: there is no per-instance __dict__ or fields-set, and
+    values repeated across entries (session type, Bruce name and ID, voice
+    IDs) are interned so the journal holds one copy of each. It validates as
+    a model field and keeps the model API used elsewhere (keyword
+    construction, attribute access, dict() and parse_obj()).
+    """
+    
+    __slots__ = (
+        "id", "date", "epoch", "session_type", "short_term", "mid_term", "long_term", "purpose",
+        "ultimate", "reigning", "final_policy", "decision_ids", "reigning_bruce_name",
+        "reigning_bruce_id", "temporary_bruce_entries",
+    )
+    
+    def __init__(
+        self,
+        date: str,
+        session_type: str,
+        short_term: str,
+        mid_term: str,
+        long_term: str,
+        purpose: str,
+        ultimate: str,
+        reigning: str,
+        final_policy: str,
+        id: Optional[str] = None,
+        epoch: Optional[int] = None,  # epoch seconds of date, computed when missing
+        decision_ids: Optional[List[str]] = None,  # ids into ParliamentState.decisions
+        reigning_bruce_name: str = "",
+        reigning_bruce_id: Optional[str] = None,  # None when no Bruce was reigning
+        temporary_bruce_entries: Optional[Dict[str, str]] = None,  # {temp_bruce_id: response}
+    ):
+        self.id = _text("id", id) if id is not None else new_record_id()
+        self.date = _text("date", date)
+        self.epoch = int(epoch) if epoch is not None else to_epoch(date)
+        self.session_type = sys.intern(_text("session_type", session_type))
+        self.short_term = _text("short_term", short_term)
+        self.mid_term = _text("mid_term", mid_term)
+        self.long_term = _text("long_term", long_term)
+        self.purpose = _text("purpose", purpose)
+        self.ultimate = _text("ultimate", ultimate)
+        self.reigning = _text("reigning", reigning)
+        self.final_policy = _text("final_policy", final_policy)
+        self.decision_ids = [_text("decision_ids", i) for i in decision_ids or ()]
+        self.reigning_bruce_name = sys.intern(_text("reigning_bruce_name", reigning_bruce_name))
+        self.reigning_bruce_id = sys.intern(_text("reigning_bruce_id", reigning_bruce_id)) if reigning_bruce_id is not None else None
+        self.temporary_bruce_entries = {
+            sys.intern(_text("temporary_bruce_entries", k)): _text("temporary_bruce_entries", v)
+            for k, v in (temporary_bruce_entries or {}).items()
+        }
+    
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.parse_obj
+    
+    @classmethod
+    def parse_obj(cls, obj) -> "JournalEntry":
+        """Build an entry from a mapping, ignoring unknown keys like a model would."""
+        if isinstance(obj, cls):
+            return obj
+        if not isinstance(obj, dict):
+            raise TypeError(f"JournalEntry expected a mapping, got {type(obj).__name__}")
+        return cls(**{k: v for k, v in obj.items() if k in cls.__slots__})
+    
+    def dict(self) -> Dict:
+        """Plain-data copy of the entry, in field order."""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["decision_ids"] = list(self.decision_ids)
+        data["temporary_bruce_entries"] = dict(self.temporary_bruce_entries)
+        return data
+    
+    def copy(self) -> "JournalEntry":
+        """Independent copy of the entry; its strings are shared, being immutable."""
+        entry = JournalEntry.__new__(JournalEntry)
+        for name in self.__slots__:
+            setattr(entry, name, getattr(self, name))
+        entry.decision_ids = list(self.decision_ids)
+        entry.temporary_bruce_entries = dict(self.temporary_bruce_entries)
+        return entry
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, JournalEntry):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"JournalEntry(id={self.id!r}, date={self.date!r}, session_type={self.session_type!r})"
 
 
-class JournalEntry(BaseModel):
-    """Represents a parliament session entry."""
-    date: str
-    session_type: str
-    short_term: str
-    mid_term: str
-    long_term: str
-    purpose: str
-    ultimate: str
-    reigning: str
-    final_policy: str
-    decisions_voted_on: List[Decision] = Field(default_factory=list)
-    reigning_bruce_name: str = ""
-    temporary_bruce_entries: Dict[str, str] = Field(default_factory=dict)  # {temp_bruce_id: response}
+def _text(field: str, value) -> str:
+    if not isinstance(value, str):
+        raise TypeError(f"{field} must be a string, got {type(value).__name__}")
+    return value
 
 
 class ParliamentState(BaseModel):
@@ -67,4 +184,23 @@ class ParliamentState(BaseModel):
     journal_entries: List[JournalEntry] = Field(default_factory=list)
     decisions: List[Decision] = Field(default_factory=list)
     temporary_bruces: Dict[str, TemporaryBruce] = Field(default_factory=dict)  # {id: TemporaryBruce}
+    next_voice_expiry: Optional[int] = None  # earliest voice expires_at, see expiry.py
+    next_voice_expiry_session: Optional[int] = None  # earliest voice expires_at_session
     created_at: str = Field(default_factory=lambda: datetime.now().isoformat())
+    
+    def clone(self) -> "ParliamentState":
+        """Independent copy of the whole state, without revalidating it.
+        
+        Much cheaper than loading or deep-copying: entries are copied slot by
+        slot and only the smaller records are deep-copied.
+        """
+        fields = {name: copy.deepcopy(value) for name, value in self.__dict__.items() if name != "journal_entries"}
+        fields["journal_entries"] = [entry.copy() for entry in self.journal_entries]
+        return self.copy(update=fields)
+    
+    def dict(self, **kwargs) -> Dict:
+        """Model dict with journal entries converted to plain data too."""
+        data = super().dict(**kwargs)
+        if "journal_entries" in data:
+            data["journal_entries"] = [entry.dict() for entry in data["journal_entries"]]
+        return data
@@ -0,0 +1,56 @@
+"""Operations that span every profile under one data root.
+
+Loading a parliament is dominated by JSON parsing, so cross-profile work is
+fanned out to a process pool: each worker loads one profile, computes its
+result and returns only that small result (or writes its export file)
+rather than shipping the state back.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+from .exporting import EXPORT_FORMATS, export_file
+from .services import ParliamentService
+from .storage import Storage
+
+
+def profile_stats(root: Path, profile: str) -> Dict:
+    """Summary statistics for one profile."""
+    service = ParliamentService(Storage.for_profile(profile, root))
+    stats = service.summary_stats()
+    stats["profile"] = profile
+    return stats
+
+
+def export_profile(root: Path, profile: str, format: str, out_dir: Path, stamp: str) -> str:
+    """Export one profile into out_dir and return the file path."""
+    service = ParliamentService(Storage.for_profile(profile, root))
+    path = Path(out_dir) / f"parliament_export_{profile}_{stamp}.{EXPORT_FORMATS[format]}"
+    export_file(service, format, path)
+    return str(path.resolve())
+
+
+def map_profiles(task: Callable, root: Path, profiles: Sequence[str], *args, workers: Optional[int] = None) -> List:
+    """Run task(root, profile, *args) for every profile, in parallel when worthwhile.
+
+    Results are returned in profile order. A single profile, or workers=1,
+    runs in this process.
+    """
+    workers = workers or min(len(profiles), os.cpu_count() or 1)
+    if workers <= 1 or len(profiles) <= 1:
+        return [task(root, profile, *args) for profile in profiles]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(task, root, profile, *args) for profile in profiles]
+        return [future.result() for future in futures]
+
+
+def aggregate_stats(results: List[Dict]) -> Dict:
+    """Totals across per-profile statistics."""
+    totals = {"profiles": len(results), "sessions": 0, "decisions": 0, "passed": 0, "identities": 0, "session_types": {}}
+    for stats in results:
+        for key in ("sessions", "decisions", "passed", "identities"):
+            totals[key] += stats[key]
+        for session_type, count in stats["session_types"].items():
+            totals["session_types"][session_type] = totals["session_types"].get(session_type, 0) + count
+    return totals
@@ -0,0 +1,244 @@
+"""The search query language and its planner.
+
+A query is a list of space-separated terms, all of which must match::
+
+    coffee "bad sleep" seat:purpose bruce:Phoenix type:weekly after:2025-01 before:2025-03 -excuses
+
+Bare words and "double-quoted" phrases match case-insensitively anywhere in the
+selected seats' text (every seat, the synthesis and the policy unless
+``seat:`` narrows it). ``after:`` and ``before:`` take a YYYY-MM-DD day or a
+YYYY-MM month and keep entries from its start, or before its start.
+Apostrophes, backslashes and an unpaired double quote are ordinary
+characters, so ``don't`` and ``I'm tired`` search for just that.
+Repeating ``seat:``, ``bruce:`` or ``type:`` allows any of the values. A
+leading ``-`` excludes entries matching a word, phrase, ``bruce:`` or
+``type:``.
+
+Each predicate knows how many entries it can match from an index alone: the
+date range from bisecting the epoch column, a Bruce from its reign summary,
+a session type from its posting list, and a word from the document
+frequencies of the TF-IDF vocabulary terms containing it. The planner
+starts from the most selective predicate's positions, intersects the next
+ones' while that is cheaper than checking candidates one by one, and only
+then reads entry text to confirm phrases, seat restrictions and exclusions.
+"""
+from bisect import bisect_left
+import re
+from typing import Callable, List, Optional, Sequence, Tuple
+from .related import STOP_WORDS, TfidfIndex
+from .timeutil import period_bounds
+
+
+class QueryError(ValueError):
+    """A search query that cannot be parsed."""
+
+
+FIELD_KEYS = ("seat", "bruce", "type", "after", "before")
+
+WORD_RUN = re.compile(r"[a-z0-9]+")
+
+# A token is a run of non-space characters and "double-quoted" stretches;
+# a double quote with no partner later on is an ordinary character
+QUERY_TOKEN = re.compile(r'(?:[^\s"]|"[^"]*"|"(?![^"]*"))+')
+QUOTED = re.compile(r'"([^"]*)"')
+
+# Stop intersecting once the candidates are this many times fewer than the
+# next predicate's matches; checking them directly is cheaper
+VERIFY_RATIO = 8
+
+
+class Query:
+    """A parsed query: text terms plus field predicates."""
+
+    def __init__(self):
+        self.terms: List[str] = []  # lowercased words and phrases that must appear
+        self.excluded: List[str] = []  # ... and that must not
+        self.seats: List[str] = []
+        self.bruces: List[str] = []
+        self.excluded_bruces: List[str] = []
+        self.types: List[str] = []
+        self.excluded_types: List[str] = []
+        self.start: Optional[int] = None
+        self.end: Optional[int] = None
+
+
+def parse_query(text: str, seat_keys: Sequence[str] = ()) -> Query:
+    """Parse a query string; raises QueryError for malformed ones.
+
+    seat_keys, if given, are the valid ``seat:`` values.
+    """
+    tokens = [QUOTED.sub(r"\1", token) for token in QUERY_TOKEN.findall(text)]
+
+    query = Query()
+    for token in filter(None, tokens):
+        negated = len(token) > 1 and token.startswith("-")
+        if negated:
+            token = token[1:]
+        key, sep, value = token.partition(":")
+        key = key.lower()
+        if not sep or key not in FIELD_KEYS:
+            (query.excluded if negated else query.terms).append(token.lower())
+            continue
+        if not value:
+            raise QueryError(f"Missing value for '{key}:'")
+        if negated and key not in ("bruce", "type"):
+            raise QueryError(f"'{key}:' cannot be negated")
+
+        if key == "seat":
+            if seat_keys and value not in seat_keys:
+                raise QueryError(f"Invalid seat '{value}': use {', '.join(seat_keys)}")
+            query.seats.append(value)
+        elif key == "bruce":
+            (query.excluded_bruces if negated else query.bruces).append(value.lower())
+        elif key == "type":
+            (query.excluded_types if negated else query.types).append(value.lower())
+        else:
+            try:
+                start, _ = period_bounds(value)
+            except ValueError:
+                raise QueryError(f"Invalid date '{value}' for '{key}:': use YYYY-MM-DD or YYYY-MM")
+            if key == "after":
+                query.start = start if query.start is None else max(query.start, start)
+            else:
+                query.end = start if query.end is None else min(query.end, start)
+    return query
+
+
+class Predicate:
+    """One condition of a query.
+
+    ``estimate`` is the number of entries an index says can match, or None
+    when no index helps and the condition can only be checked per entry.
+    ``positions()`` lists those entries in journal order, and ``exact``
+    says whether they all really match or still need ``test``.
+    """
+
+    def __init__(self, name: str, test: Callable[[int], bool], estimate: Optional[int] = None,
+                 positions: Optional[Callable[[], Sequence[int]]] = None, exact: bool = False):
+        self.name = name
+        self.test = test
+        self.estimate = estimate
+        self.positions = positions
+        self.exact = exact
+
+
+def intersect(candidates: Sequence[int], positions: Sequence[int]) -> Sequence[int]:
+    """Positions in both sorted sequences (either may be a range)."""
+    if isinstance(positions, range):
+        return [p for p in candidates if p in positions]
+    if isinstance(candidates, range):
+        return [p for p in positions if p in candidates]
+    small, large = (candidates, positions) if len(candidates) <= len(positions) else (positions, candidates)
+    result = []
+    for p in small:
+        i = bisect_left(large, p)
+        if i < len(large) and large[i] == p:
+            result.append(p)
+    return result
+
+
+def execute(predicates: List[Predicate], total: int) -> Tuple[List[int], List[Tuple[str, Optional[int], str]]]:
+    """Positions matching every predicate, in journal order, and the plan used.
+
+    The plan lists (predicate, estimate, "index" or "check") in the order
+    the predicates were applied.
+    """
+    indexed = sorted((p for p in predicates if p.estimate is not None), key=lambda p: p.estimate)
+    plan: List[Tuple[str, Optional[int], str]] = []
+    checks: List[Predicate] = []
+    candidates: Sequence[int] = range(total)
+    first = True
+    for predicate in indexed:
+        if not first and len(candidates) * VERIFY_RATIO < predicate.estimate:
+            checks.append(predicate)
+            continue
+        positions = predicate.positions()
+        candidates = positions if first else intersect(candidates, positions)
+        first = False
+        plan.append((predicate.name, predicate.estimate, "index"))
+        if not predicate.exact:
+            checks.append(predicate)
+    checks += [p for p in predicates if p.estimate is None]
+    plan += [(p.name, p.estimate, "check") for p in checks]
+    return [p for p in candidates if all(check.test(p) for check in checks)], plan
+
+
+def indexed_runs(term: str) -> List[str]:
+    """The runs of letters and digits in a term that the TF-IDF postings can find.
+
+    Each run lies inside some indexed word of an entry containing the term,
+    unless it may fall inside an unindexed one (a stop word or a single
+    character).
+    """
+    return [run for run in set(WORD_RUN.findall(term))
+            if len(run) > 1 and not any(run in stop for stop in STOP_WORDS)]
+
+
+def text_predicate(name: str, term: str, index: TfidfIndex, text_of: Callable[[int], List[str]]) -> Predicate:
+    """A predicate for a word or phrase, prefiltered by the TF-IDF postings when possible.
+
+    Entries containing the term are within the postings of the vocabulary
+    words containing each of its indexed runs.
+    """
+    run_terms = [[i for i, word in enumerate(index.vocabulary) if run in word] for run in indexed_runs(term)]
+
+    def test(position: int) -> bool:
+        return any(term in text.lower() for text in text_of(position))
+
+    def positions() -> Sequence[int]:
+        lists = sorted((index.merged_postings(terms) for terms in run_terms), key=len)
+        result: Sequence[int] = lists[0]
+        for other in lists[1:]:
+            result = intersect(result, other)
+        return result
+
+    estimate = min((sum(index.df[i] for i in terms) for terms in run_terms), default=None)
+    return Predicate(name, test, estimate, positions)
+
+
+def posting_predicate(name: str, lists: List[Sequence[int]], test: Callable[[int], bool]) -> Predicate:
+    """An exact predicate whose matches are the union of posting lists."""
+
+    def positions() -> Sequence[int]:
+        if len(lists) == 1:
+            return lists[0]
+        return sorted(set().union(*lists))
+
+    return Predicate(name, test, sum(len(positions) for positions in lists), positions, exact=True)
+
+
+def context_around(text: str, index: int, length: int) -> str:
+    """The text around a match, with ellipses where it was cut."""
+    start = max(0, index - 40)
+    end = min(len(text), index + length + 40)
+    context = text[start:end]
+    if start > 0:
+        context = "..." + context
+    if end < len(text):
+        context = context + "..."
+    return context
+
+
+def match_contexts(entry, fields: List[Tuple[str, str]], terms: List[str]) -> List[Tuple[str, str]]:
+    """(field label, context) for each field containing one of the terms."""
+    found_in = []
+    for label, attr in fields:
+        content = getattr(entry, attr)
+        lowered = content.lower()
+        for term in terms:
+            index = lowered.find(term)
+            if index >= 0:
+                found_in.append((label, context_around(content, index, len(term))))
+                break
+    return found_in
+
+
+def bruce_ids(bruces, names: List[str]) -> List[str]:
+    """IDs of the Bruces named (by name or ID, case-insensitively); raises QueryError for unknown ones."""
+    ids = []
+    for name in names:
+        matched = [bruce.id for bruce in bruces if name in (bruce.name.lower(), bruce.id.lower())]
+        if not matched:
+            raise QueryError(f"Unknown Bruce '{name}'")
+        ids += matched
+    return ids
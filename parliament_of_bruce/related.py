@@ -0,0 +1,265 @@
+"""TF-IDF vectors over journal text, for finding related entries.
+
+Each entry's seat responses, synthesis and policy are tokenized once, when
+the entry is recorded, into one row of a sparse term-weight matrix (CSR:
+row offsets, term ids and sublinear term frequencies in typed arrays),
+while the vocabulary and document frequencies grow with it. The matrix is
+saved next to the data file and caught up with new entries on load, like
+the journal columns.
+
+IDF depends on the whole corpus, so the IDF-weighted values and the row
+norms are derived lazily and cached until the next entry is added. A query
+is then one pass over the stored values (vectorized when NumPy is
+installed, over posting lists otherwise) followed by a partial sort for the
+top k.
+
+Search reads the same matrix the other way round: the posting list of a
+term (the entries containing it) comes from a one-off inversion of the
+rows, extended as entries are added.
+"""
+from array import array
+import base64
+import heapq
+import math
+import re
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+from .seats import DEFAULT_SEATS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional speedup
+    np = None
+
+
+FORMAT_VERSION = 1
+
+# Entry attributes whose text is indexed: every seat, the synthesis and the policy
+TEXT_FIELDS = tuple(field for _, field in DEFAULT_SEATS.search_fields.values())
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+STOP_WORDS = frozenset("""
+    a about after again all also am an and any are as at be because been before being but by can could
+    did do does doing for from had has have having he her here him his how i if in into is it its
+    it's i'm i've just me more most my no not now of on once only or other our out over own same she
+    should so some such than that the their them then there these they this those through to too under
+    until up very was we were what when where which while who why will with would you your
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens of a text, without stop words or single characters."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if len(token) > 1 and token not in STOP_WORDS]
+
+
+def entry_text(entry) -> str:
+    """The indexed text of a journal entry."""
+    return "\n".join(getattr(entry, field) for field in TEXT_FIELDS)
+
+
+class TfidfIndex:
+    """Sparse TF-IDF rows, one per journal entry, in journal order."""
+
+    def __init__(self):
+        self.vocabulary: List[str] = []
+        self.term_ids: Dict[str, int] = {}
+        self.df = array("i")  # entries containing each term
+        self.indptr = array("q", [0])  # row r spans indices[indptr[r]:indptr[r + 1]]
+        self.indices = array("i")
+        self.values = array("f")  # 1 + log(term count)
+        self.last_id: Optional[str] = None
+        self._cache = None  # derived weights and norms, see _weights()
+        self._inverted = None  # (term offsets, positions) of the rows inverted so far
+        self._appended: Dict[int, List[int]] = {}  # term -> positions added since
+
+    @classmethod
+    def from_entries(cls, entries) -> "TfidfIndex":
+        """Index journal entries in chronological order."""
+        index = cls()
+        index.extend(entries)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def append(self, entry) -> None:
+        """Index a newly written journal entry."""
+        counts: Dict[int, int] = {}
+        for token in tokenize(entry_text(entry)):
+            term = self.term_ids.get(token)
+            if term is None:
+                term = self.term_ids[token] = len(self.vocabulary)
+                self.vocabulary.append(token)
+                self.df.append(0)
+            counts[term] = counts.get(term, 0) + 1
+        position = len(self)
+        for term in sorted(counts):
+            self.df[term] += 1
+            self.indices.append(term)
+            self.values.append(1.0 + math.log(counts[term]))
+            if self._inverted is not None:
+                self._appended.setdefault(term, []).append(position)
+        self.indptr.append(len(self.indices))
+        self.last_id = entry.id
+        self._cache = None
+
+    def extend(self, entries) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def catch_up(self, entries: Sequence) -> bool:
+        """Index entries written since this index was saved.
+
+        Returns False when the index does not describe a prefix of the
+        journal and must be rebuilt.
+        """
+        count = len(self)
+        if count > len(entries) or (count and entries[count - 1].id != self.last_id):
+            return False
+        self.extend(entries[count:])
+        return True
+
+    def idf(self, term: int) -> float:
+        """Smoothed inverse document frequency of a term."""
+        return math.log((1 + len(self)) / (1 + self.df[term])) + 1.0
+
+    def vectorize(self, text: str) -> Dict[int, float]:
+        """TF-IDF weights of a text's known terms."""
+        counts: Dict[int, int] = {}
+        for token in tokenize(text):
+            term = self.term_ids.get(token)
+            if term is not None:
+                counts[term] = counts.get(term, 0) + 1
+        return {term: (1.0 + math.log(count)) * self.idf(term) for term, count in counts.items()}
+
+    def row(self, position: int) -> Dict[int, float]:
+        """TF-IDF weights of an indexed entry."""
+        start, end = self.indptr[position], self.indptr[position + 1]
+        return {self.indices[i]: self.values[i] * self.idf(self.indices[i]) for i in range(start, end)}
+
+    def _weights(self):
+        """IDF-weighted values and row norms for the current corpus, cached."""
+        if self._cache is not None:
+            return self._cache
+        if np is not None:
+            indices = np.array(self.indices, dtype=np.int64)
+            indptr = np.array(self.indptr, dtype=np.int64)
+            idf = np.log((1 + len(self)) / (1 + np.array(self.df, dtype=np.float64))) + 1.0
+            weights = np.array(self.values, dtype=np.float64) * idf[indices]
+            rows = np.repeat(np.arange(len(self)), np.diff(indptr))
+            norms = np.sqrt(np.bincount(rows, weights * weights, minlength=len(self)))
+            self._cache = (indices, rows, weights, norms)
+        else:
+            postings: Dict[int, List[Tuple[int, float]]] = {}
+            norms = []
+            for position in range(len(self)):
+                squared = 0.0
+                for term, weight in self.row(position).items():
+                    postings.setdefault(term, []).append((position, weight))
+                    squared += weight * weight
+                norms.append(math.sqrt(squared))
+            self._cache = (postings, norms)
+        return self._cache
+
+    def _invert(self):
+        """Group the positions of every row by term (a counting sort by term id)."""
+        if self._inverted is None:
+            if np is not None:
+                indices = np.array(self.indices, dtype=np.int64)
+                rows = np.repeat(np.arange(len(self)), np.diff(np.array(self.indptr, dtype=np.int64)))
+                order = np.argsort(indices, kind="stable")
+                offsets = np.searchsorted(indices[order], np.arange(len(self.vocabulary) + 1)).tolist()
+                positions = rows[order].tolist()
+            else:
+                offsets = [0] * (len(self.vocabulary) + 1)
+                for term, count in enumerate(self.df):
+                    offsets[term + 1] = offsets[term] + count
+                filled = offsets[:-1]
+                positions = [0] * len(self.indices)
+                for position in range(len(self)):
+                    for i in range(self.indptr[position], self.indptr[position + 1]):
+                        term = self.indices[i]
+                        positions[filled[term]] = position
+                        filled[term] += 1
+            self._inverted = (offsets, positions)
+            self._appended = {}
+        return self._inverted
+
+    def postings(self, term: int) -> List[int]:
+        """Positions of the entries containing a term, in journal order."""
+        offsets, positions = self._invert()
+        inverted = positions[offsets[term]:offsets[term + 1]] if term + 1 < len(offsets) else []
+        return inverted + self._appended.get(term, [])
+
+    def merged_postings(self, terms: Sequence[int]) -> List[int]:
+        """Positions of the entries containing any of the terms, in journal order."""
+        if len(terms) == 1:
+            return self.postings(terms[0])
+        merged = set()
+        for term in terms:
+            merged.update(self.postings(term))
+        return sorted(merged)
+
+    def most_similar(self, vector: Dict[int, float], count: int = 5, exclude: Optional[int] = None) -> List[Tuple[int, float]]:
+        """The count rows most cosine-similar to a vector, as (position, score), best first.
+
+        Rows with no terms in common are never returned.
+        """
+        query_norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if not query_norm or count <= 0 or not len(self):
+            return []
+
+        if np is not None:
+            indices, rows, weights, norms = self._weights()
+            query = np.zeros(len(self.vocabulary))
+            query[list(vector)] = list(vector.values())
+            scores = np.bincount(rows, weights * query[indices], minlength=len(self))
+            scores = np.divide(scores, norms * query_norm, out=np.zeros_like(scores), where=norms > 0)
+            if exclude is not None:
+                scores[exclude] = 0.0
+            candidates = np.flatnonzero(scores > 0)
+            if len(candidates) > count:
+                candidates = candidates[np.argpartition(-scores[candidates], count - 1)[:count]]
+            ranked = sorted(candidates.tolist(), key=lambda position: (-scores[position], -position))
+            return [(position, float(scores[position])) for position in ranked]
+
+        postings, norms = self._weights()
+        scores: Dict[int, float] = {}
+        for term, query_weight in vector.items():
+            for position, weight in postings.get(term, ()):
+                scores[position] = scores.get(position, 0.0) + weight * query_weight
+        scores.pop(exclude, None)
+        best = heapq.nlargest(count, scores.items(), key=lambda item: (item[1], item[0]))
+        return [(position, score / (norms[position] * query_norm)) for position, score in best]
+
+    def to_dict(self) -> Dict:
+        """Serializable form: metadata plus base64-encoded array bytes."""
+        return {
+            "format": FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "count": len(self),
+            "last_id": self.last_id,
+            "vocabulary": self.vocabulary,
+            "arrays": {name: base64.b64encode(getattr(self, name).tobytes()).decode("ascii")
+                       for name in ("df", "indptr", "indices", "values")},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> Optional["TfidfIndex"]:
+        """Rebuild an index from to_dict() output, or None if it is unusable."""
+        if data.get("format") != FORMAT_VERSION or data.get("byteorder") != sys.byteorder:
+            return None
+
+        index = cls()
+        for name in ("df", "indptr", "indices", "values"):
+            column = array(getattr(index, name).typecode)
+            column.frombytes(base64.b64decode(data["arrays"][name]))
+            setattr(index, name, column)
+        index.vocabulary = list(data["vocabulary"])
+        index.term_ids = {term: i for i, term in enumerate(index.vocabulary)}
+        index.last_id = data["last_id"]
+        if (not index.indptr or len(index) != data["count"] or len(index.df) != len(index.vocabulary)
+                or len(index.indices) != len(index.values) or index.indptr[-1] != len(index.indices)):
+            return None
+        return index
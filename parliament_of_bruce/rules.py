@@ -0,0 +1,189 @@
+"""Configurable behavioral warning rules.
+
+Rules compare one seat's share of active responses inside a calendar window
+against a threshold. They are declared as data (the defaults below, or
+``warning_rules.json`` in the data directory) and compiled once into flat
+arrays. Evaluation then computes each distinct window's counts a single time
+from the cached seat activity and checks every rule in one pass, so adding
+rules does not add journal scans.
+
+Example ``warning_rules.json``::
+
+    [
+      {"name": "mid_term_silence", "seat": "mid_term", "op": "<", "threshold": 0.1,
+       "window": "30d", "message": "⚠️  Mid-Term Bruce has been quiet for a month ({ratio:.0%})."}
+    ]
+
+Rules without a ``window`` are evaluated over the window being analyzed
+(``pob status --window``). Messages may use ``{seat}``, ``{ratio}`` and
+``{window}`` placeholders.
+"""
+import operator
+from typing import Dict, List, Optional
+from pydantic import BaseModel, validator
+from . import analytics
+from .analytics import SEAT_FIELDS, SeatActivity
+
+
+OPERATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+NO_ACTIVITY_WARNING = "⚠️  No recent parliament activity detected"
+HEALTHY_MESSAGE = "✓ Parliament balance appears healthy"
+
+
+class RuleError(ValueError):
+    """Raised when a warning rule cannot be compiled."""
+
+
+class WarningRule(BaseModel):
+    """A declared warning rule."""
+    name: str
+    seat: str
+    op: str
+    threshold: float
+    message: str
+    window: Optional[str] = None
+
+    @validator("seat")
+    def _known_seat(cls, v):
+        if v not in SEAT_FIELDS:
+            raise ValueError(f"unknown seat '{v}', expected one of {', '.join(SEAT_FIELDS)}")
+        return v
+
+    @validator("op")
+    def _known_op(cls, v):
+        if v not in OPERATORS:
+            raise ValueError(f"unknown operator '{v}', expected one of {' '.join(OPERATORS)}")
+        return v
+
+    @validator("window")
+    def _valid_window(cls, v):
+        if v is not None:
+            parse_window(v)
+        return v
+
+
+DEFAULT_RULES = [
+    WarningRule(
+        name="short_term_dominance",
+        seat="short_term",
+        op=">",
+        threshold=0.5,
+        message="⚠️  Short-Term Bruce is dominating decisions. Consider long-term consequences.",
+    ),
+    WarningRule(
+        name="purpose_silence",
+        seat="purpose",
+        op="<",
+        threshold=0.1,
+        message="⚠️  Purpose Bruce has been silent. Risk of existential drift.",
+    ),
+    WarningRule(
+        name="ultimate_silence",
+        seat="ultimate",
+        op="<",
+        threshold=0.05,
+        message="⚠️  Ultimate Bruce is not being consulted. Death-aware wisdom is missing.",
+    ),
+]
+
+
+def parse_window(window: str) -> int:
+    """Convert a window label such as '30d' into a number of days."""
+    if not (window.endswith("d") and window[:-1].isdigit() and int(window[:-1]) > 0):
+        raise ValueError(f"invalid window '{window}', expected a day count such as '30d'")
+    return int(window[:-1])
+
+
+class CompiledRules:
+    """Warning rules flattened into parallel arrays for single-pass evaluation."""
+
+    def __init__(self, rules: List[WarningRule]):
+        self.rules = list(rules)
+        # Slot 0 is the analyzed window; explicit windows follow in order of first use
+        self.window_days: List[Optional[int]] = [None]
+        slots: Dict[int, int] = {}
+        self.window_index: List[int] = []
+        self.seat_index: List[int] = []
+        self.thresholds: List[float] = []
+        self.compare = []
+
+        for rule in self.rules:
+            if rule.window is None:
+                slot = 0
+            else:
+                days = parse_window(rule.window)
+                if days not in slots:
+                    slots[days] = len(self.window_days)
+                    self.window_days.append(days)
+                slot = slots[days]
+            try:
+                rule.message.format(seat=rule.seat, ratio=0.0, window=rule.window or "7d")
+            except (KeyError, IndexError, ValueError) as e:
+                raise RuleError(f"Rule '{rule.name}' has an invalid message: {e}")
+            self.window_index.append(slot)
+            self.seat_index.append(SEAT_FIELDS.index(rule.seat))
+            self.thresholds.append(rule.threshold)
+            self.compare.append(OPERATORS[rule.op])
+
+        self._arrays = None
+
+    def _numpy_arrays(self):
+        """Rule columns as NumPy arrays, built on first vectorized evaluation."""
+        if self._arrays is None:
+            np = analytics.np
+            self._arrays = (
+                np.asarray(self.window_index, dtype=np.int64),
+                np.asarray(self.seat_index, dtype=np.int64),
+                np.asarray(self.thresholds, dtype=np.float64),
+                {symbol: np.asarray([rule.op == symbol for rule in self.rules], dtype=bool) for symbol in OPERATORS},
+            )
+        return self._arrays
+
+    def _fired(self, counts: List[List[int]]) -> List[int]:
+        """Indexes of rules whose condition holds for the given window counts."""
+        np = analytics.np
+        if np is not None:
+            windows, seats, thresholds, op_masks = self._numpy_arrays()
+            matrix = np.asarray(counts, dtype=np.float64).reshape(len(counts), len(SEAT_FIELDS))
+            totals = matrix.sum(axis=1)
+            ratios = matrix / np.maximum(totals, 1)[:, None]
+            values = ratios[windows, seats]
+            fired = np.zeros(len(self.rules), dtype=bool)
+            for symbol, mask in op_masks.items():
+                fired |= mask & OPERATORS[symbol](values, thresholds)
+            fired &= totals[windows] > 0
+            return np.flatnonzero(fired).tolist()
+
+        totals = [sum(row) for row in counts]
+        fired = []
+        for i, (slot, seat, threshold, compare) in enumerate(zip(self.window_index, self.seat_index, self.thresholds, self.compare)):
+            if totals[slot] and compare(counts[slot][seat] / totals[slot], threshold):
+                fired.append(i)
+        return fired
+
+    def evaluate(self, activity: SeatActivity, days: int = 7, now: Optional[float] = None) -> List[str]:
+        """Evaluate every rule against the activity arrays."""
+        window_days = [days if d is None else d for d in self.window_days]
+        counts = activity.window_counts(window_days, now)
+        if sum(counts[0]) == 0:
+            return [NO_ACTIVITY_WARNING]
+
+        warnings = []
+        for i in self._fired(counts):
+            rule = self.rules[i]
+            slot = self.window_index[i]
+            ratio = counts[slot][self.seat_index[i]] / sum(counts[slot])
+            warnings.append(rule.message.format(seat=rule.seat, ratio=ratio, window=f"{window_days[slot]}d"))
+
+        return warnings if warnings else [HEALTHY_MESSAGE]
+
+
+def compile_rules(rules: Optional[List[WarningRule]] = None) -> CompiledRules:
+    """Compile declared rules, falling back to the defaults."""
+    return CompiledRules(DEFAULT_RULES if rules is None else rules)
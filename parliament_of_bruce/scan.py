@@ -0,0 +1,94 @@
+"""Regular-expression scans of the whole journal, in parallel.
+
+No index can answer an arbitrary regular expression, so every entry's text
+has to be read. The entries are mirrored into an append-only JSON-lines
+file next to the data file (``journal.jsonl``, one entry per line), which is
+caught up with new entries before each scan and, once it exists, on every
+save (``pob read --follow`` tails it, see follow.py). The file is cut into byte
+ranges and each range is scanned by a worker process that opens the file
+itself, so workers are handed only a path and two offsets, never pickled
+entries, and return only the positions and contexts of their matches. A
+line belongs to the range it starts in.
+
+Ranges are submitted in journal order and their results yielded in that
+order as soon as each is done, so matches stream out oldest first while
+later ranges are still being scanned.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from .query import context_around
+
+# Journals smaller than this are scanned in-process
+MIN_CHUNK_BYTES = 1 << 20
+
+# Ranges per worker, so a slow range does not hold the others up
+CHUNKS_PER_WORKER = 4
+
+Match = Tuple[int, List[Tuple[str, str]]]  # (journal position, [(field label, context)])
+
+
+def journal_record(position: int, entry) -> Dict:
+    """The journal log line for an entry: its position and the entry itself."""
+    record = {"n": position}
+    record.update(entry.dict())
+    return record
+
+
+def scan_range(path: str, start: int, end: int, pattern: str, flags: int,
+               fields: Sequence[Tuple[str, str]]) -> List[Match]:
+    """Matches in the lines of a journal log that start within [start, end)."""
+    regex = re.compile(pattern, flags)
+    matches = []
+    with open(path, "rb") as f:
+        if start:
+            f.seek(start - 1)
+            f.readline()  # finish the line that started before this range
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            record = json.loads(line)
+            found_in = []
+            for label, field in fields:
+                text = record.get(field, "")
+                match = regex.search(text)
+                if match:
+                    found_in.append((label, context_around(text, match.start(), match.end() - match.start())))
+            if found_in:
+                matches.append((record["n"], found_in))
+    return matches
+
+
+def split_ranges(size: int, count: int) -> List[Tuple[int, int]]:
+    """Cut [0, size) into `count` contiguous byte ranges."""
+    count = max(1, min(count, size))
+    step = -(-size // count)
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def parallel_scan(path: Path, pattern: str, flags: int, fields: Sequence[Tuple[str, str]],
+                  workers: Optional[int] = None) -> Iterator[Match]:
+    """Yield (position, [(label, context)]) for every matching line, in file order.
+
+    Raises re.error for an invalid pattern before any work starts.
+    """
+    re.compile(pattern, flags)
+    size = os.path.getsize(path)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or size < MIN_CHUNK_BYTES:
+        yield from scan_range(str(path), 0, size, pattern, flags, fields)
+        return
+
+    ranges = split_ranges(size, min(workers * CHUNKS_PER_WORKER, size // (MIN_CHUNK_BYTES // 4) or 1))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(scan_range, str(path), start, end, pattern, flags, fields) for start, end in ranges]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,187 @@
+"""Non-interactive parliament sessions and votes driven by a JSON script.
+
+A script is a single session object, a list of session objects, or a document
+with ``sessions`` and ``votes`` lists::
+
+    {
+      "sessions": [
+        {
+          "type": "daily",
+          "responses": {"short_term": ["Round one", "Round two"], "purpose": "..."},
+          "temporary": {"Anxiety": "..."},
+          "final_policy": "Walk before work",
+          "votes": [{"topic": "Take the job?", "votes": {"ShortTerm": "yes"}}]
+        }
+      ],
+      "votes": [{"topic": "Move city?", "votes": {"ultimate": "no"}}]
+    }
+
+A response is either a string (round one only) or a list with one item per
+round. Seats accept both ``ShortTerm`` and ``short_term`` spellings, and
+temporary voices may be addressed by ID or by name. Votes left out of a
+script count as "no".
+"""
+import json
+import sys
+from typing import Dict, List, Optional, Union
+from pydantic import BaseModel, Field, ValidationError
+from .models import Decision, JournalEntry
+from .seats import DEFAULT_SEATS, SeatError, SeatRegistry
+
+
+class ScriptError(ValueError):
+    """Raised when a script document cannot be read or applied."""
+
+
+class ScriptedVote(BaseModel):
+    """A pre-decided vote on one topic."""
+    topic: str
+    votes: Dict[str, str] = Field(default_factory=dict)
+    options: List[str] = Field(default_factory=lambda: ["Yes", "No"])
+
+
+class ScriptedSession(BaseModel):
+    """Pre-written responses for one parliament session."""
+    type: Optional[str] = None
+    responses: Dict[str, Union[str, List[str]]] = Field(default_factory=dict)
+    temporary: Dict[str, Union[str, List[str]]] = Field(default_factory=dict)
+    final_policy: str = ""
+    votes: List[ScriptedVote] = Field(default_factory=list)
+
+
+class Script(BaseModel):
+    """A complete script document."""
+    sessions: List[ScriptedSession] = Field(default_factory=list)
+    votes: List[ScriptedVote] = Field(default_factory=list)
+
+
+class ScriptResult(BaseModel):
+    """Records created by running a script."""
+    entries: List[JournalEntry] = Field(default_factory=list)
+    decisions: List[Decision] = Field(default_factory=list)
+
+
+class ScriptedResponder:
+    """collect_callback that replays pre-written responses round by round."""
+
+    def __init__(self, rounds: Dict[str, List[str]]):
+        self.rounds = rounds
+        self.round_count = max((len(answers) for answers in rounds.values()), default=0)
+
+    def __call__(self, seat_key: str, seat_name: str, prompt: str, round_num: int, is_first_round: bool) -> Optional[str]:
+        if round_num > self.round_count:
+            return None
+        answers = self.rounds.get(seat_key, [])
+        return answers[round_num - 1] if round_num <= len(answers) else ""
+
+
+def _read_json(source: str, what: str):
+    try:
+        if source == "-":
+            return json.load(sys.stdin)
+        with open(source, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        raise ScriptError(f"Could not read {what} '{source}': {e}")
+
+
+def load_script(source: str) -> Script:
+    """Read a script document from a file path, or from stdin when source is '-'."""
+    data = _read_json(source, "script")
+    if isinstance(data, list):
+        data = {"sessions": data}
+    elif isinstance(data, dict) and "sessions" not in data and "votes" not in data:
+        data = {"sessions": [data]}
+
+    try:
+        return Script.parse_obj(data)
+    except ValidationError as e:
+        raise ScriptError(f"Invalid script: {e}")
+
+
+def load_votes(source: str) -> List[ScriptedVote]:
+    """Read a list of votes (or a script's top-level votes) from a file or stdin."""
+    data = _read_json(source, "votes")
+    if isinstance(data, dict):
+        data = data.get("votes", [])
+
+    try:
+        return [ScriptedVote.parse_obj(item) for item in data]
+    except (TypeError, ValidationError) as e:
+        raise ScriptError(f"Invalid votes: {e}")
+
+
+def resolve_seat(name: str, seats: SeatRegistry = DEFAULT_SEATS) -> str:
+    """Map a permanent seat spelling to its canonical key."""
+    try:
+        return seats.resolve(name)
+    except SeatError as e:
+        raise ScriptError(str(e))
+
+
+def _as_rounds(value: Union[str, List[str]]) -> List[str]:
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _prepare_session(service, session: ScriptedSession) -> Dict[str, List[str]]:
+    """Resolve seat and voice names in a session to rotation seat keys."""
+    voices = {}
+    for temp_id, temp_bruce in service.get_active_temporary_bruces():
+        voices[temp_id] = temp_id
+        voices[temp_bruce.name.lower()] = temp_id
+
+    rounds = {}
+    for name, value in session.responses.items():
+        rounds[resolve_seat(name, service.seats)] = _as_rounds(value)
+    for name, value in session.temporary.items():
+        temp_id = voices.get(name, voices.get(name.lower()))
+        if temp_id is None:
+            raise ScriptError(f"Unknown or inactive temporary voice '{name}'")
+        rounds[temp_id] = _as_rounds(value)
+    return rounds
+
+
+def prepare_votes(service, vote: ScriptedVote) -> Dict[str, str]:
+    """Resolve seat names in a vote and fill in missing seats as 'no'."""
+    votes = {seat: "no" for seat in service.seats.vote_order}
+    for name, value in vote.votes.items():
+        votes[resolve_seat(name, service.seats)] = value.strip().lower()
+    return votes
+
+
+def run_script(service, script: Script, default_type: str = "daily", sessions: bool = True, votes: bool = True) -> ScriptResult:
+    """Apply a script to the service and persist the result once.
+
+    The whole document is resolved before anything is recorded, so a bad seat
+    or voice name fails the run without writing partial results.
+    """
+    planned_sessions = []
+    if sessions:
+        for session in script.sessions:
+            planned_sessions.append((
+                session.type or default_type,
+                _prepare_session(service, session),
+                session.final_policy,
+                [(v.topic, v.options, prepare_votes(service, v)) for v in session.votes],
+            ))
+    planned_votes = []
+    if votes:
+        planned_votes = [(v.topic, v.options, prepare_votes(service, v)) for v in script.votes]
+
+    result = ScriptResult()
+    with service.batch():
+        for session_type, rounds, final_policy, session_votes in planned_sessions:
+            responder = ScriptedResponder(rounds)
+            permanent, temporary = service.collect_rotating_session_responses(session_type, responder)
+            if not permanent.get("reigning"):
+                permanent["reigning"] = "[Synthesis skipped]"
+            permanent["final_policy"] = final_policy or "[Policy skipped]"
+            entry = service.create_session(session_type, permanent, temporary)
+            result.entries.append(entry)
+            if session_votes:
+                result.decisions.extend(service.decide_batch(session_votes, entry_id=entry.id))
+
+        if planned_votes:
+            result.decisions.extend(service.decide_batch(planned_votes))
+
+    return result
@@ -0,0 +1,223 @@
+"""Seat definitions: the one place seat names, weights and prompts come from.
+
+A SeatRegistry is an immutable, ordered set of SeatDefs together with the
+lookup tables derived from them (vote weights in vote order, seat-name
+aliases, search fields), all computed once when the registry is built. The
+default registry is built at import; a profile may override seat names,
+prompts, descriptions and weights, and the passing threshold, with a
+``seats.json`` file in its data directory::
+
+    {
+      "threshold": 11,
+      "seats": {"Purpose": {"weight": 5, "prompt": "What would make this meaningful?"}}
+    }
+
+Journal entries store one field per seat, so the set of seats itself is
+fixed; overrides change how seats are presented and weighed.
+"""
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
+from .models import Seat
+
+
+class SeatError(ValueError):
+    """Raised for an invalid seat name or seat override."""
+
+
+class _Frozen:
+    """Base for slotted objects that cannot be changed after __init__."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _init(self, **values) -> None:
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+
+class SeatDef(_Frozen):
+    """One voting seat.
+
+    key is the vote key ("ShortTerm"), field the JournalEntry attribute and
+    response key ("short_term"). title is shown when the seat speaks and
+    short_name when it votes.
+    """
+
+    __slots__ = ("key", "field", "emoji", "name", "label", "weight", "prompt", "description",
+                 "title", "short_name", "reigning")
+
+    OVERRIDABLE = ("emoji", "name", "label", "weight", "prompt", "description")
+
+    def __init__(self, key: str, field: str, emoji: str, name: str, label: str, weight: int,
+                 prompt: str, description: str = "", reigning: bool = False):
+        self._init(
+            key=key,
+            field=field,
+            emoji=emoji,
+            name=name,
+            label=label,
+            weight=weight,
+            prompt=prompt,
+            description=description,
+            title=f"{emoji} {name}",
+            short_name=name.split(" — ")[0],
+            reigning=reigning,
+        )
+
+    def replace(self, **changes) -> "SeatDef":
+        """A copy with some attributes overridden."""
+        values = {name: getattr(self, name) for name in ("key", "field", "reigning") + self.OVERRIDABLE}
+        values.update(changes)
+        return SeatDef(**values)
+
+    def __repr__(self) -> str:
+        return f"SeatDef({self.key!r}, weight={self.weight})"
+
+
+class SeatRegistry(_Frozen):
+    """An ordered, immutable set of seats and the lookup tables derived from it."""
+
+    __slots__ = ("seats", "permanent", "reigning", "by_key", "by_field", "aliases", "weights",
+                 "vote_order", "threshold", "max_score", "search_fields", "permanent_fields")
+
+    def __init__(self, seats: Tuple[SeatDef, ...], threshold: int):
+        seats = tuple(seats)
+        aliases = {}
+        for seat in seats:
+            for spelling in (seat.key, seat.field, seat.field.replace("_", "")):
+                aliases[spelling.lower()] = seat.key
+
+        search_fields = {seat.field: (seat.label, seat.field) for seat in seats}
+        search_fields["policy"] = ("Policy", "final_policy")
+
+        self._init(
+            seats=seats,
+            permanent=tuple(seat for seat in seats if not seat.reigning),
+            reigning=next((seat for seat in seats if seat.reigning), None),
+            by_key=MappingProxyType({seat.key: seat for seat in seats}),
+            by_field=MappingProxyType({seat.field: seat for seat in seats}),
+            aliases=MappingProxyType(aliases),
+            weights=MappingProxyType({seat.key: seat.weight for seat in seats}),
+            vote_order=tuple(seat.key for seat in seats),
+            threshold=threshold,
+            max_score=sum(seat.weight for seat in seats),
+            search_fields=MappingProxyType(search_fields),
+            permanent_fields=tuple(seat.field for seat in seats if not seat.reigning),
+        )
+
+    def __iter__(self):
+        return iter(self.seats)
+
+    def __len__(self) -> int:
+        return len(self.seats)
+
+    def resolve(self, name: str) -> str:
+        """Map any accepted spelling of a seat ("ShortTerm", "short_term", "shortterm") to its key."""
+        key = self.aliases.get(name.lower())
+        if key is None:
+            raise SeatError(f"Unknown seat '{name}'")
+        return key
+
+    def with_overrides(self, data: Mapping) -> "SeatRegistry":
+        """A registry with per-seat overrides and an optional new threshold applied."""
+        if not isinstance(data, Mapping):
+            raise SeatError("Seat overrides must be a JSON object")
+        overrides = data.get("seats", {})
+        if not isinstance(overrides, Mapping):
+            raise SeatError("'seats' must map seat names to overrides")
+
+        changes: Dict[str, Dict] = {}
+        for name, values in overrides.items():
+            key = self.resolve(name)
+            if not isinstance(values, Mapping):
+                raise SeatError(f"Overrides for seat '{name}' must be a JSON object")
+            unknown = set(values) - set(SeatDef.OVERRIDABLE)
+            if unknown:
+                raise SeatError(f"Cannot override {', '.join(sorted(unknown))} of seat '{name}'")
+            weight = values.get("weight", 1)
+            if not isinstance(weight, int) or isinstance(weight, bool) or weight < 0:
+                raise SeatError(f"Weight of seat '{name}' must be a non-negative integer")
+            changes[key] = dict(values)
+
+        seats = tuple(seat.replace(**changes[seat.key]) if seat.key in changes else seat for seat in self.seats)
+        threshold = data.get("threshold", self.threshold)
+        max_score = sum(seat.weight for seat in seats)
+        if not isinstance(threshold, int) or isinstance(threshold, bool) or not 0 < threshold <= max_score:
+            raise SeatError(f"Threshold must be an integer from 1 to {max_score}")
+        return SeatRegistry(seats, threshold)
+
+    def seat_states(self) -> Dict[str, Seat]:
+        """Seat records for a new parliament's state."""
+        return {
+            seat.key: Seat(name=seat.name, votes=seat.weight, description=seat.description)
+            for seat in self.permanent
+        }
+
+
+DEFAULT_SEATS = SeatRegistry((
+    SeatDef(
+        key='ShortTerm',
+        field='short_term',
+        emoji='🟥',
+        name='Short-Term Bruce — The Rebel / The Animal',
+        label='Short-Term',
+        weight=1,
+        prompt="Time: now, today, tonight\nBody over mind. Nerves over plans.\n'I want relief, not reasons. Pain feels urgent. Boredom is death. Discipline feels like a cage. I don't care about later. I speak in cravings, anger, fear. If ignored, I sabotage.'\n\nActivation: What hurts right now, and what would make it stop?",
+        description="Time: now, today, tonight\nBody over mind. Nerves over plans.\n\n'I want relief, not reasons. Pain feels urgent and personal. Boredom is death. Discipline feels like a cage. I don't care about later. I speak in cravings, anger, fear. If ignored, I sabotage. I tell the raw truth others hide.'\n\nActivation: What hurts right now, and what would make it stop?",
+    ),
+    SeatDef(
+        key='MidTerm',
+        field='mid_term',
+        emoji='🟨',
+        name='Mid-Term Bruce — The Operator',
+        label='Mid-Term',
+        weight=2,
+        prompt="Time: this week, this month\nExecution over emotion.\n'I care about momentum. Small wins beat grand visions. Systems beat willpower. Burnout is my enemy. Chaos wastes energy. I translate emotion into tasks. Consistency is power.'\n\nActivation: What's the minimum action that moves this forward?",
+        description="Time: this week, this month\nExecution over emotion.\n\n'I care about momentum. Small wins beat grand visions. Systems beat willpower. Burnout is my enemy. Chaos wastes energy. I translate emotion into tasks. I ask: what's doable, not ideal. Consistency is power.'\n\nActivation: What's the minimum action that moves this forward?",
+    ),
+    SeatDef(
+        key='LongTerm',
+        field='long_term',
+        emoji='🟦',
+        name='Long-Term Bruce — The Architect',
+        label='Long-Term',
+        weight=3,
+        prompt="Time: years ahead\nStructure over impulse.\n'I think in systems and leverage. Compounding is sacred. Short-term pleasure is expensive. I care about trajectory, not mood. Emotions are data. I design environments. Waste of potential is the real sin.'\n\nActivation: Does this scale, compound, or rot?",
+        description="Time: years ahead\nStructure over impulse.\n\n'I think in systems and leverage. Compounding is sacred. Short-term pleasure is expensive. I sacrifice now to own later. I care about trajectory, not mood. Emotions are data, not commands. I design environments, not days. Waste of potential is the real sin.'\n\nActivation: Does this scale, compound, or rot?",
+    ),
+    SeatDef(
+        key='Purpose',
+        field='purpose',
+        emoji='🟪',
+        name='Purpose Bruce — The Dharma Bearer',
+        label='Purpose',
+        weight=4,
+        prompt="Time: lifetime\nMeaning over success.\n'I guard the story of your life. Power without meaning is hollow. Pain must become purpose. I ask why before how. Betraying values costs more than failure. I see patterns across incarnations of you. I speak softly but halt everything.'\n\nActivation: Is this worthy of the story we're living?",
+        description="Time: lifetime\nMeaning over success.\n\n'I guard the story of your life. Power without meaning is hollow. Pain must become purpose. I ask why before how. Betraying values costs more than failure. I see patterns across incarnations of you. I don't rush, I judge alignment. I speak softly but halt everything.'\n\nActivation: Is this worthy of the story we're living?",
+    ),
+    SeatDef(
+        key='Ultimate',
+        field='ultimate',
+        emoji='⚫',
+        name='Ultimate Bruce — The Judge',
+        label='Ultimate',
+        weight=5,
+        prompt="Time: deathbed\nLegacy over everything.\n'I am immune to excuses. I don't care how it felt, only what it became. Regret is my metric. I veto actions you'll live with forever. Comfort now can mean shame later. I see your life as one object.'\n\nActivation: When this is over… will we respect this choice?",
+        description="Time: deathbed\nLegacy over everything.\n\n'I am immune to excuses. I don't care how it felt, only what it became. Regret is my metric. I veto actions you'll have to live with forever. Comfort now can mean shame later. I see your entire life as one object. I end arguments.'\n\nActivation: When this is over… will we respect this choice?",
+    ),
+    SeatDef(
+        key="Reigning",
+        field="reigning",
+        emoji="👑",
+        name="Reigning Bruce",
+        label="Reigning",
+        weight=3,
+        prompt="Synthesize the parliament's wisdom and set direction for the realm",
+        reigning=True,
+    ),
+), threshold=10)
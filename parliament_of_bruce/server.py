@@ -0,0 +1,413 @@
+"""Local HTTP/JSON API over one resident ParliamentService.
+
+Dashboards and scripts can query the parliament without starting a new
+process (and reloading the data file) for every request::
+
+    GET  /status?window=7d
+    GET  /read?date=2025-06&full=1&limit=20&offset=0
+    GET  /search?q=walk&seat=policy
+    GET  /stats
+    GET  /timeline?detail=1
+    POST /session   {"type": "daily", "responses": {...}, "final_policy": "..."}
+    POST /vote      {"topic": "...", "votes": {"ShortTerm": "yes"}, "entry_id": "..."}
+
+Request bodies use the same shapes as ``--input`` scripts. Lists are
+paginated newest first with ``limit``/``offset`` and report ``next_offset``.
+
+Every response carries an ETag naming the state generation, which changes
+whenever the parliament is written (by this server or by another process,
+noticed through the data file's size and mtime) and at local midnight, since
+streaks and durations depend on the date. A client that sends the ETag back
+in ``If-None-Match`` gets an empty 304 until something changes. Encoded GET
+responses are cached per generation, so repeated polling does no work.
+
+Connections are kept alive (HTTP/1.1) and each is served by its own thread;
+access to the service is serialized by a lock.
+"""
+from datetime import date, datetime
+import json
+import secrets
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+from pydantic import ValidationError
+from . import __version__
+from .analytics import WINDOWS
+from .cache import file_stamp
+from .models import JournalEntry, ReigningBruce
+from .query import QueryError
+from .scripting import Script, ScriptError, ScriptedSession, ScriptedVote, prepare_votes, run_script
+from .services import ParliamentService
+from .storage import Storage
+from .timeutil import period_bounds
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 200
+
+MAX_BODY_BYTES = 1024 * 1024
+
+# Cached GET responses kept per generation
+MAX_CACHED_RESPONSES = 256
+
+
+class APIError(Exception):
+    """An error reported to the client with an HTTP status."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _int_param(params: Dict[str, str], name: str, default: int, maximum: Optional[int] = None,
+               minimum: int = 0) -> int:
+    value = params.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise APIError(HTTPStatus.BAD_REQUEST, f"'{name}' must be an integer")
+    if number < minimum:
+        raise APIError(HTTPStatus.BAD_REQUEST, f"'{name}' must be at least {minimum}")
+    return min(number, maximum) if maximum is not None else number
+
+
+def _flag_param(params: Dict[str, str], name: str) -> bool:
+    return params.get(name, "").lower() in ("1", "true", "yes")
+
+
+def paginate(items: List, params: Dict[str, str], render: Callable) -> Dict:
+    """One page of `items`, newest first, using the limit/offset parameters."""
+    # A limit of 0 would give a next_offset equal to the offset, forever
+    limit = _int_param(params, "limit", DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, minimum=1)
+    offset = _int_param(params, "offset", 0)
+    end = len(items) - offset
+    page = items[max(0, end - limit):max(0, end)][::-1]
+    next_offset = offset + limit
+    return {
+        "total": len(items),
+        "offset": offset,
+        "limit": limit,
+        "next_offset": next_offset if next_offset < len(items) else None,
+        "items": [render(item) for item in page],
+    }
+
+
+class ParliamentAPI:
+    """JSON views and writes over one parliament, shared by all request threads."""
+
+    def __init__(self, storage: Storage):
+        self.storage = storage
+        self.service = ParliamentService(storage)
+        self.generation = 0
+        self._instance = secrets.token_hex(4)  # keeps ETags from a restarted server distinct
+        self._stamp = file_stamp(storage.data_file)
+        self._today = date.today()
+        self._responses: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def etag(self) -> str:
+        return f'"{self._instance}-{self.generation}-{self._today.toordinal()}"'
+
+    def _changed(self) -> None:
+        """Start a new generation after the state was written."""
+        self._stamp = file_stamp(self.storage.data_file)
+        self.generation += 1
+        self._responses.clear()
+
+    def _refresh(self) -> None:
+        """Reload if another process wrote the data file; roll over at midnight."""
+        if file_stamp(self.storage.data_file) != self._stamp:
+            self.service = ParliamentService(self.storage)
+            self._changed()
+        if date.today() != self._today:
+            self._today = date.today()
+            self._responses.clear()
+
+    def get(self, path: str, params: Dict[str, str], if_none_match: Optional[str] = None) -> Tuple[HTTPStatus, str, bytes]:
+        """Answer a GET: (status, etag, body); the body is empty for a 304."""
+        view = self.GET_ROUTES.get(path)
+        if view is None:
+            raise APIError(HTTPStatus.NOT_FOUND, f"Unknown endpoint '{path}'")
+
+        with self._lock:
+            self._refresh()
+            etag = self.etag
+            if if_none_match is not None and etag in [tag.strip() for tag in if_none_match.split(",")]:
+                return HTTPStatus.NOT_MODIFIED, etag, b""
+
+            key = path + "?" + urlencode(sorted(params.items()))
+            body = self._responses.get(key)
+            if body is None:
+                body = json.dumps(view(self, params)).encode("utf-8")
+                if len(self._responses) >= MAX_CACHED_RESPONSES:
+                    self._responses.clear()
+                self._responses[key] = body
+            return HTTPStatus.OK, etag, body
+
+    def post(self, path: str, data) -> Tuple[HTTPStatus, str, bytes]:
+        """Apply a write and answer with the created records."""
+        action = self.POST_ROUTES.get(path)
+        if action is None:
+            raise APIError(HTTPStatus.NOT_FOUND, f"Unknown endpoint '{path}'")
+        if not isinstance(data, dict):
+            raise APIError(HTTPStatus.BAD_REQUEST, "Request body must be a JSON object")
+
+        with self._lock:
+            self._refresh()
+            try:
+                result = action(self, data)
+            except APIError:
+                raise
+            except (ScriptError, ValueError, ValidationError) as e:
+                # Writes validate before recording anything, so the state is unchanged
+                raise APIError(HTTPStatus.BAD_REQUEST, str(e))
+            except Exception:
+                # Don't keep serving a half-applied in-memory state
+                self.storage.discard_cached()
+                self.service = ParliamentService(self.storage)
+                self._changed()
+                raise
+            self._changed()
+            return HTTPStatus.CREATED, self.etag, json.dumps(result).encode("utf-8")
+
+    # Rendering
+
+    def _entry_summary(self, entry: JournalEntry) -> Dict:
+        return {
+            "id": entry.id,
+            "date": entry.date,
+            "epoch": entry.epoch,
+            "session_type": entry.session_type,
+            "reigning_bruce": entry.reigning_bruce_name,
+            "reigning_bruce_id": entry.reigning_bruce_id,
+            "final_policy": entry.final_policy,
+        }
+
+    def _entry_full(self, entry: JournalEntry) -> Dict:
+        data = entry.dict()
+        voices = self.service.state.temporary_bruces
+        data["temporary_voices"] = {
+            temp_id: {"name": voices[temp_id].name if temp_id in voices else None, "response": response}
+            for temp_id, response in entry.temporary_bruce_entries.items()
+        }
+        data["decisions"] = [decision.dict() for decision in self.service.decisions_for_entry(entry)]
+        return data
+
+    # GET views
+
+    def view_status(self, params: Dict[str, str]) -> Dict:
+        window = params.get("window", "7d")
+        if window not in WINDOWS:
+            raise APIError(HTTPStatus.BAD_REQUEST, f"Invalid window '{window}': use {', '.join(WINDOWS)}")
+
+        service = self.service
+        bruce = service.state.reigning_bruce
+        reigning = None
+        if bruce is not None:
+            reigning = bruce.dict()
+            reigning["duration_days"] = (datetime.now() - datetime.fromisoformat(bruce.start_date)).days
+        return {
+            "reigning_bruce": reigning,
+            "recent": [self._entry_summary(entry) for entry in reversed(service.get_recent_entries(3))],
+            "window": window,
+            "warnings": service.generate_warnings(WINDOWS[window]),
+        }
+
+    def view_read(self, params: Dict[str, str]) -> Dict:
+        entries = self.service.state.journal_entries
+        period = params.get("date")
+        if period:
+            try:
+                start, end = period_bounds(period)
+            except ValueError:
+                raise APIError(HTTPStatus.BAD_REQUEST, f"Invalid date '{period}': use YYYY-MM-DD or YYYY-MM")
+            entries = self.service.entries_between(start, end)
+        render = self._entry_full if _flag_param(params, "full") else self._entry_summary
+        return paginate(entries, params, render)
+
+    def view_search(self, params: Dict[str, str]) -> Dict:
+        query = params.get("q")
+        if not query:
+            raise APIError(HTTPStatus.BAD_REQUEST, "Missing search term 'q'")
+        seat = params.get("seat")
+        if seat and seat not in self.service.SEARCH_FIELDS:
+            raise APIError(HTTPStatus.BAD_REQUEST, f"Invalid seat '{seat}': use {', '.join(self.service.SEARCH_FIELDS)}")
+
+        def render(match):
+            entry, found_in = match
+            return {
+                "entry": self._entry_summary(entry),
+                "matches": [{"field": field, "context": context} for field, context in found_in],
+            }
+
+        try:
+            matches = self.service.search_entries(query, seat)
+        except QueryError as e:
+            raise APIError(HTTPStatus.BAD_REQUEST, str(e))
+        return paginate(matches, params, render)
+
+    def view_stats(self, params: Dict[str, str]) -> Dict:
+        service = self.service
+        stats = service.summary_stats()
+        stats["per_bruce"] = []
+        for bruce in service.all_bruces():
+            record = service.bruce_summary(bruce)
+            stats["per_bruce"].append({
+                "id": bruce.id,
+                "name": bruce.name,
+                "sessions": record.entry_count,
+                "decisions": record.decision_count,
+                "passed": record.passed_count,
+                "longest_streak": service.activity_calendar(bruce).longest,
+            })
+        return stats
+
+    def view_timeline(self, params: Dict[str, str]) -> Dict:
+        detail = _flag_param(params, "detail")
+        bruces = []
+        for bruce in self.service.all_bruces():
+            data = bruce.dict()
+            if detail:
+                data["journal"] = self._bruce_detail(bruce)
+            bruces.append(data)
+        return {"bruces": bruces}
+
+    def _bruce_detail(self, bruce: ReigningBruce) -> Dict:
+        summary = self.service.bruce_summary(bruce)
+        entries = self.service.entries_for_bruce(bruce)
+        return {
+            "entries": summary.entry_count,
+            "first_epoch": summary.first_epoch,
+            "last_epoch": summary.last_epoch,
+            "session_types": summary.session_types,
+            "decisions": summary.decision_count,
+            "passed": summary.passed_count,
+            "last_policy": entries[-1].final_policy if entries else None,
+        }
+
+    # POST actions
+
+    def create_session(self, data: Dict) -> Dict:
+        if not self.service.state.reigning_bruce:
+            raise APIError(HTTPStatus.CONFLICT, "No Reigning Bruce active")
+        session = ScriptedSession.parse_obj(data)
+        result = run_script(self.service, Script(sessions=[session]))
+        return {
+            "entry": self._entry_full(result.entries[0]),
+            "decisions": [decision.dict() for decision in result.decisions],
+        }
+
+    def create_vote(self, data: Dict) -> Dict:
+        if not self.service.state.reigning_bruce:
+            raise APIError(HTTPStatus.CONFLICT, "No Reigning Bruce active")
+        entry_id = data.get("entry_id")
+        vote = ScriptedVote.parse_obj(data)
+        votes = prepare_votes(self.service, vote)
+        decision = self.service.vote_on_decision(vote.topic, vote.options, votes, entry_id)
+        return decision.dict()
+
+    GET_ROUTES = {
+        "/status": view_status,
+        "/read": view_read,
+        "/search": view_search,
+        "/stats": view_stats,
+        "/timeline": view_timeline,
+    }
+
+    POST_ROUTES = {
+        "/session": create_session,
+        "/vote": create_vote,
+    }
+
+
+class APIRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to the server's ParliamentAPI."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+    server_version = f"pob/{__version__}"
+    timeout = 60  # close idle keep-alive connections
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = dict(parse_qsl(url.query))
+        try:
+            status, etag, body = self.server.api.get(url.path.rstrip("/") or "/", params, self.headers.get("If-None-Match"))
+        except APIError as e:
+            self._send_error(e)
+            return
+        except Exception as e:
+            self._send_error(APIError(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)))
+            raise
+        self._send(status, body, etag)
+
+    def do_POST(self):
+        try:
+            data = self._read_json()
+            status, etag, body = self.server.api.post(urlsplit(self.path).path.rstrip("/"), data)
+        except APIError as e:
+            self._send_error(e)
+            return
+        except Exception as e:
+            self._send_error(APIError(HTTPStatus.INTERNAL_SERVER_ERROR, str(e)))
+            raise
+        self._send(status, body, etag)
+
+    def _read_json(self):
+        length = self.headers.get("Content-Length")
+        if length is None:
+            raise APIError(HTTPStatus.LENGTH_REQUIRED, "Content-Length required")
+        try:
+            length = int(length)
+        except ValueError:
+            raise APIError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise APIError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError as e:
+            raise APIError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e}")
+
+    def _send(self, status: HTTPStatus, body: bytes, etag: Optional[str] = None) -> None:
+        self.send_response(status)
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _send_error(self, error: APIError) -> None:
+        self._send(error.status, json.dumps({"error": error.message}).encode("utf-8"))
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ParliamentServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding one ParliamentAPI."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], api: ParliamentAPI, verbose: bool = False):
+        super().__init__(address, APIRequestHandler)
+        self.api = api
+        self.verbose = verbose
+
+
+def make_server(storage: Storage, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, verbose: bool = False) -> ParliamentServer:
+    """Load the parliament and bind a server for it (port 0 picks a free port)."""
+    return ParliamentServer((host, port), ParliamentAPI(storage), verbose)
@@ -1,36 +1,135 @@
+from bisect import bisect_left
+from contextlib import contextmanager
 from datetime import datetime
+import re
 from typing import Dict, List, Tuple, Optional
 import uuid
+from .activity import ActivityCalendar, ActivityLog
+from .analytics import DAY_SECONDS, SeatActivity, WINDOWS
+from .columns import JournalColumns
+from . import events
+from .events import HOOKS, Event, HookRunner
+from .expiry import VoiceSweeper
+from .indexes import BruceIndex, BruceSummary, RecordIndex, SessionTypeIndex, VoiceIndex
+from .query import Predicate, bruce_ids, execute, match_contexts, parse_query, posting_predicate, text_predicate
+from .related import TfidfIndex
+from .scan import journal_record, parallel_scan
+from .rules import CompiledRules, RuleError, compile_rules
+from .voting import OutcomeTable, VoteVector, power_indices, sweep
 from .models import Decision, JournalEntry, ReigningBruce, ParliamentState, TemporaryBruce
+from .seats import DEFAULT_SEATS
 from .storage import Storage
+from .timeutil import local_day, now_epoch
 
 
 class ParliamentService:
     """Core business logic for parliament operations."""
     
-    VOTE_WEIGHTS = {
-        "ShortTerm": 1,
-        "MidTerm": 2,
-        "LongTerm": 3,
-        "Purpose": 4,
-        "Ultimate": 5,
-        "Reigning": 3,
-    }
+    # Defaults; each service uses its profile's seat registry (see seats.py)
+    VOTE_WEIGHTS = DEFAULT_SEATS.weights
+    PASSING_THRESHOLD = DEFAULT_SEATS.threshold
+    MAX_SCORE = DEFAULT_SEATS.max_score
     
-    PASSING_THRESHOLD = 10
-    MAX_SCORE = 18
+    # Searchable seat -> (label, JournalEntry attribute)
+    SEARCH_FIELDS = DEFAULT_SEATS.search_fields
     
-    def __init__(self, storage: Storage):
+    def __init__(self, storage: Storage, hooks: HookRunner = HOOKS):
         self.storage = storage
+        self.hooks = hooks
         self.state = storage.load()
+        self.seats = storage.load_seats()
+        self.VOTE_WEIGHTS = self.seats.weights
+        self.PASSING_THRESHOLD = self.seats.threshold
+        self.MAX_SCORE = self.seats.max_score
+        self.SEARCH_FIELDS = self.seats.search_fields
+        self._batch_depth = 0
+        self._dirty = False
+        self._columns: Optional[JournalColumns] = None
+        self._columns_saved = 0
+        self._activity: Optional[SeatActivity] = None
+        self._calendar: Optional[ActivityLog] = None
+        self._calendar_saved = 0
+        self._rules: Optional[CompiledRules] = None
+        self._outcomes: Optional[OutcomeTable] = None
+        self._records: Optional[RecordIndex] = None
+        self._bruces: Optional[BruceIndex] = None
+        self._voices: Optional[VoiceIndex] = None
+        self._types: Optional[SessionTypeIndex] = None
+        self._sweeper: Optional[VoiceSweeper] = None
+        self._related: Optional[TfidfIndex] = None
+        self._related_saved = 0
+        self._events: List[Event] = []  # changes not saved yet
+        # Expired voices are only dismissed in memory here; the next save
+        # writes that out, so read-only commands never rewrite the data file
+        self._sweep_voices()
+    
+    def _emit(self, event_type: str, **data) -> None:
+        """Record a change for the change feed; it is published when saved."""
+        self._events.append(Event(type=event_type, data=data))
     
     def save(self):
-        """Save current state."""
+        """Save current state (deferred while inside a batch)."""
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._persist()
+    
+    def _persist(self):
+        """Write the state, and the journal columns and calendar if they have grown.
+        
+        The journal log is kept up to date too once something has created it,
+        so followers see new entries as soon as they are saved. The events
+        for the saved changes are then logged and passed to the hooks.
+        Voices that have expired since the last sweep are dismissed first.
+        """
+        self._sweep_voices()
         self.storage.save(self.state)
+        if self.storage.journal_file.exists():
+            self.sync_journal_log()
+        if self._events:
+            saved, self._events = self._events, []
+            self.storage.event_log().append(saved)
+            self.hooks.publish(saved)
+        if self._columns is not None and len(self._columns) != self._columns_saved:
+            self.storage.save_columns(self._columns)
+            self._columns_saved = len(self._columns)
+        if self._calendar is not None and self._calendar.entry_count != self._calendar_saved:
+            self.storage.save_activity(self._calendar)
+            self._calendar_saved = self._calendar.entry_count
+        if self._related is not None and len(self._related) != self._related_saved:
+            self.storage.save_related(self._related)
+            self._related_saved = len(self._related)
+    
+    @contextmanager
+    def batch(self):
+        """Defer saves inside the block and persist once when it completes.
+        
+        Nothing is written if the block raises, so a failed bulk run leaves
+        the data file untouched.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            # The in-memory state no longer matches the file; don't share it
+            self.storage.discard_cached()
+            self._events.clear()
+            raise
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0 and self._dirty:
+            self._dirty = False
+            self._persist()
     
-    def create_session(self, session_type: str, responses: Dict[str, str], temp_bruce_responses: Optional[Dict[str, str]] = None) -> JournalEntry:
-        """Create a new journal entry from session responses."""
+    def create_session(self, session_type: str, responses: Dict[str, str], temp_bruce_responses: Optional[Dict[str, str]] = None,
+                       entry_id: Optional[str] = None) -> JournalEntry:
+        """Create a new journal entry from session responses.
+        
+        entry_id, if given, is used as the new entry's ID (e.g. one reserved
+        by a session draft).
+        """
         entry = JournalEntry(
+            id=entry_id,
             date=datetime.now().isoformat(),
             session_type=session_type,
             short_term=responses.get("short_term", ""),
@@ -41,31 +140,89 @@ class ParliamentService:
             reigning=responses.get("reigning", ""),
             final_policy=responses.get("final_policy", ""),
             reigning_bruce_name=self.state.reigning_bruce.name if self.state.reigning_bruce else "None",
+            reigning_bruce_id=self.state.reigning_bruce.id if self.state.reigning_bruce else None,
             temporary_bruce_entries=temp_bruce_responses or {}
         )
         
         self.state.journal_entries.append(entry)
+        self._index_entry(entry)
+        
+        for temp_id, response in entry.temporary_bruce_entries.items():
+            voice = self.state.temporary_bruces.get(temp_id)
+            if voice is not None:
+                voice.remember(response)
         
         if self.state.reigning_bruce:
             self.state.reigning_bruce.session_count += 1
         
+        self._emit(events.SESSION_CREATED, entry=entry.dict(), position=len(self.state.journal_entries) - 1)
+        self._sweep_voices()
+        
         self.save()
         return entry
     
-    def vote_on_decision(self, topic: str, options: List[str], votes: Dict[str, str]) -> Decision:
-        """Process a vote and return the decision result."""
-        scores_breakdown = {}
-        total_yes = 0
-        total_no = 0
+    def _index_entry(self, entry: JournalEntry) -> None:
+        """Add a newly appended entry to any indexes already built.
         
-        for seat, vote in votes.items():
-            weight = self.VOTE_WEIGHTS.get(seat, 0)
-            scores_breakdown[seat] = weight
-            
-            if vote.lower() in ["yes", "y", "1"]:
-                total_yes += weight
-            else:
-                total_no += weight
+        The journal columns and activity calendar are always kept current so
+        they are saved with the state; loading them catches up on the new
+        entry.
+        """
+        if self._columns is not None:
+            self._columns.append(entry)
+        else:
+            self.journal_columns()
+        if self._calendar is not None:
+            self._calendar.add_entry(entry)
+        else:
+            self.activity_log()
+        if self._records is not None:
+            self._records.add_entry(entry, len(self.state.journal_entries) - 1)
+        if self._bruces is not None:
+            self._bruces.add_entry(entry, len(self.state.journal_entries) - 1)
+        if self._voices is not None:
+            self._voices.add_entry(entry, len(self.state.journal_entries) - 1)
+        if self._types is not None:
+            self._types.add_entry(entry, len(self.state.journal_entries) - 1)
+        if self._related is not None:
+            self._related.append(entry)
+    
+    def _decision_entry(self, entry_id: Optional[str]) -> Optional[JournalEntry]:
+        """Resolve the entry new decisions belong to.
+        
+        Decisions belong to an entry only when the caller names it (as a
+        scripted session does for its own votes); a standalone vote has none.
+        """
+        if entry_id is None:
+            return None
+        entry = self.get_entry(entry_id)
+        if entry is None:
+            raise ValueError(f"Unknown journal entry '{entry_id}'")
+        return entry
+    
+    def _record_decisions(self, decisions: List[Decision], entry: Optional[JournalEntry]) -> None:
+        """Append decisions to the state and link them to their entry."""
+        self.state.decisions.extend(decisions)
+        if entry is not None:
+            entry.decision_ids.extend(d.id for d in decisions)
+        for decision in decisions:
+            self._emit(events.DECISION_RECORDED, decision=decision.dict())
+            if self._records is not None:
+                self._records.add_decision(decision)
+            if self._bruces is not None:
+                self._bruces.add_decision(decision)
+    
+    def _decision_bruce_id(self, entry: Optional[JournalEntry]) -> Optional[str]:
+        """The Bruce new decisions are attributed to."""
+        if entry is not None:
+            return entry.reigning_bruce_id
+        return self.state.reigning_bruce.id if self.state.reigning_bruce else None
+    
+    def vote_on_decision(self, topic: str, options: List[str], votes: Dict[str, str], entry_id: Optional[str] = None) -> Decision:
+        """Process a vote and return the decision result."""
+        entry = self._decision_entry(entry_id)
+        scores_breakdown = {seat: self.VOTE_WEIGHTS.get(seat, 0) for seat in votes}
+        _, passed = self.outcome_table().outcome(votes)
         
         decision = Decision(
             topic=topic,
@@ -73,19 +230,132 @@ class ParliamentService:
             votes=votes,
             total_score=self.MAX_SCORE,
             scores_breakdown=scores_breakdown,
-            passed=total_yes >= self.PASSING_THRESHOLD,
-            timestamp=datetime.now().isoformat()
+            passed=passed,
+            timestamp=datetime.now().isoformat(),
+            entry_id=entry.id if entry else None,
+            reigning_bruce_id=self._decision_bruce_id(entry)
         )
         
-        self.state.decisions.append(decision)
+        self._record_decisions([decision], entry)
         self.save()
         return decision
     
+    def decide_batch(self, items: List[Tuple[str, List[str], Dict[str, str]]], entry_id: Optional[str] = None) -> List[Decision]:
+        """Record many decisions at once and save a single time.
+        
+        Each item is (topic, options, votes), as for vote_on_decision. All
+        votes are tallied in one pass over the outcome table.
+        """
+        entry = self._decision_entry(entry_id)
+        outcomes = self.outcome_table().simulate([votes for _, _, votes in items])
+        timestamp = datetime.now().isoformat()
+        bruce_id = self._decision_bruce_id(entry)
+        
+        decisions = [
+            Decision(
+                topic=topic,
+                options=options,
+                votes=votes,
+                total_score=self.MAX_SCORE,
+                scores_breakdown={seat: self.VOTE_WEIGHTS.get(seat, 0) for seat in votes},
+                passed=passed,
+                timestamp=timestamp,
+                entry_id=entry.id if entry else None,
+                reigning_bruce_id=bruce_id
+            )
+            for (topic, options, votes), (_, _, passed) in zip(items, outcomes)
+        ]
+        
+        self._record_decisions(decisions, entry)
+        self.save()
+        return decisions
+    
+    def record_index(self) -> RecordIndex:
+        """Get the entry/decision ID index, building it on first use."""
+        if self._records is None:
+            self._records = RecordIndex.build(self.state)
+        return self._records
+    
+    def get_entry(self, entry_id: str) -> Optional[JournalEntry]:
+        """Look up a journal entry by ID."""
+        position = self.record_index().entry_positions.get(entry_id)
+        return self.state.journal_entries[position] if position is not None else None
+    
+    def decisions_for_entry(self, entry: JournalEntry) -> List[Decision]:
+        """Decisions voted during an entry's session."""
+        return self.record_index().decisions_for(entry)
+    
+    def entry_for_decision(self, decision: Decision) -> Optional[JournalEntry]:
+        """The journal entry a decision was voted in, if any."""
+        position = self.record_index().entry_position(decision)
+        return self.state.journal_entries[position] if position is not None else None
+    
+    def bruce_index(self) -> BruceIndex:
+        """Get the per-Bruce aggregate index, building it on first use."""
+        if self._bruces is None:
+            self._bruces = BruceIndex.build(self.state)
+        return self._bruces
+    
+    def all_bruces(self) -> List[ReigningBruce]:
+        """Every Bruce in reign order, including the one reigning now."""
+        bruces = self.state.bruce_history.copy()
+        if self.state.reigning_bruce:
+            bruces.append(self.state.reigning_bruce)
+        return bruces
+    
+    def bruce_summary(self, bruce: ReigningBruce) -> BruceSummary:
+        """Session and decision aggregates for one Bruce's reign."""
+        return self.bruce_index().summary(bruce.id)
+    
+    def entries_for_bruce(self, bruce: ReigningBruce) -> List[JournalEntry]:
+        """Journal entries recorded during one Bruce's reign."""
+        return self.bruce_index().entries_for(bruce.id, self.state.journal_entries)
+    
+    def voice_index(self) -> VoiceIndex:
+        """Get the per-voice statement index, building it on first use."""
+        if self._voices is None:
+            self._voices = VoiceIndex.build(self.state)
+        return self._voices
+    
+    def voice_history(self, temp_id: str, count: int = 10) -> List[Tuple[JournalEntry, str]]:
+        """A temporary voice's latest count statements as (entry, response), newest first."""
+        entries = self.state.journal_entries
+        return [
+            (entries[position], entries[position].temporary_bruce_entries[temp_id])
+            for position in self.voice_index().latest(temp_id, count)
+        ]
+    
+    def outcome_table(self) -> OutcomeTable:
+        """Get the precomputed outcome table for the current weights and threshold."""
+        table = self._outcomes
+        if table is None or table.threshold != self.PASSING_THRESHOLD or table.weights != tuple(self.VOTE_WEIGHTS.values()):
+            table = self._outcomes = OutcomeTable(self.VOTE_WEIGHTS, self.PASSING_THRESHOLD)
+        return table
+    
+    def simulate_votes(self, vectors: List[VoteVector]) -> List[Tuple[int, int, bool]]:
+        """Evaluate hypothetical vote vectors without recording decisions.
+        
+        Returns (mask, yes_score, passed) per vector; see OutcomeTable.mask_for
+        for the accepted vector formats.
+        """
+        return self.outcome_table().simulate(vectors)
+    
+    def vote_power(self) -> Dict[str, Dict[str, float]]:
+        """Banzhaf and Shapley-Shubik power of each seat under the current rules."""
+        table = self.outcome_table()
+        return power_indices(table.weights, [table.threshold], table.seats)[0]
+    
+    def sweep_vote_power(self, configs: List[Tuple[Dict[str, int], int]]) -> List[Dict[str, Dict[str, float]]]:
+        """Power indices for many hypothetical (weights, threshold) configurations."""
+        seats = tuple(self.VOTE_WEIGHTS)
+        return sweep([(tuple(weights.get(seat, 0) for seat in seats), threshold) for weights, threshold in configs], seats)
+    
     def create_reigning_bruce(self, name: str, reason: str) -> ReigningBruce:
         """Create a new reigning Bruce identity."""
         # Archive current Bruce if exists
-        if self.state.reigning_bruce:
-            self.state.bruce_history.append(self.state.reigning_bruce)
+        previous = self.state.reigning_bruce
+        if previous:
+            self.state.bruce_history.append(previous)
         
         new_bruce = ReigningBruce(
             name=name,
@@ -94,6 +364,7 @@ class ParliamentService:
         )
         
         self.state.reigning_bruce = new_bruce
+        self._emit(events.BRUCE_BORN, bruce=new_bruce.dict(), previous_id=previous.id if previous else None)
         self.save()
         return new_bruce
     
@@ -103,6 +374,7 @@ class ParliamentService:
             self.state.reigning_bruce.end_date = datetime.now().isoformat()
             self.state.reigning_bruce.exit_report = exit_report
             self.state.bruce_history.append(self.state.reigning_bruce)
+            self._emit(events.BRUCE_ENDED, bruce=self.state.reigning_bruce.dict())
             self.state.reigning_bruce = None
             self.save()
     
@@ -110,78 +382,348 @@ class ParliamentService:
         """Get most recent journal entries."""
         return self.state.journal_entries[-count:] if self.state.journal_entries else []
     
-    def analyze_seat_dominance(self, days: int = 7) -> Dict[str, int]:
-        """Analyze which seats have been most dominant recently."""
-        # Simplified analysis - count non-empty responses
-        recent = self.state.journal_entries[-days:] if len(self.state.journal_entries) >= days else self.state.journal_entries
-        
-        dominance = {
-            "short_term": 0,
-            "mid_term": 0,
-            "long_term": 0,
-            "purpose": 0,
-            "ultimate": 0
-        }
+    def entries_between(self, start: int, end: int) -> List[JournalEntry]:
+        """Journal entries with start <= epoch < end, found by bisecting the epoch column."""
+        lo, hi = self.journal_span(start, end)
+        return self.state.journal_entries[lo:hi]
+    
+    def journal_span(self, start: Optional[int] = None, end: Optional[int] = None) -> Tuple[int, int]:
+        """Journal positions [lo, hi) of the entries with start <= epoch < end."""
+        epochs = self.journal_columns().epochs
+        lo = bisect_left(epochs, start) if start is not None else 0
+        hi = bisect_left(epochs, end) if end is not None else len(epochs)
+        return lo, hi
+    
+    def entry_position(self, entry_id: str) -> int:
+        """Journal position of an entry; raises ValueError for unknown IDs."""
+        position = self.record_index().entry_positions.get(entry_id)
+        if position is None:
+            raise ValueError(f"Unknown journal entry '{entry_id}'")
+        return position
+    
+    def entry_page(self, count: int, page: int = 1, after: Optional[str] = None, before: Optional[str] = None,
+                   span: Optional[Tuple[int, int]] = None) -> Tuple[int, int]:
+        """Journal positions [first, last) of one page of up to `count` entries.
         
-        for entry in recent:
-            if len(entry.short_term) > 50:
-                dominance["short_term"] += 1
-            if len(entry.mid_term) > 50:
-                dominance["mid_term"] += 1
-            if len(entry.long_term) > 50:
-                dominance["long_term"] += 1
-            if len(entry.purpose) > 50:
-                dominance["purpose"] += 1
-            if len(entry.ultimate) > 50:
-                dominance["ultimate"] += 1
-        
-        return dominance
-    
-    def generate_warnings(self) -> List[str]:
-        """Generate behavioral warnings based on recent patterns."""
-        warnings = []
-        dominance = self.analyze_seat_dominance()
+        Pages are numbered back from the newest entry in `span` (default: the
+        whole journal), so page 1 is the latest. The `after` and `before`
+        entry-ID cursors instead start the page just after, or end it just
+        before, that entry. Only positions are computed, so the cost does not
+        depend on the journal's length.
+        """
+        lo, hi = span if span is not None else (0, len(self.state.journal_entries))
+        if after is not None:
+            first = min(max(self.entry_position(after) + 1, lo), hi)
+            return first, min(first + count, hi)
+        if before is not None:
+            last = max(min(self.entry_position(before), hi), lo)
+            return max(last - count, lo), last
+        last = max(hi - (page - 1) * count, lo)
+        return max(last - count, lo), last
+    
+    def search_entries(self, query: str, seat: Optional[str] = None) -> List[Tuple[JournalEntry, List[Tuple[str, str]]]]:
+        """Search entries with the query language (see query.py), in all seats or one.
+        
+        Returns (entry, [(field label, context around a match)]) for each
+        matching entry, oldest first. Raises QueryError for invalid queries.
+        """
+        return self.search_with_plan(query, seat)[0]
+    
+    def search_with_plan(self, query: str, seat: Optional[str] = None):
+        """search_entries() plus the plan it ran: [(predicate, estimate, "index" or "check")]."""
+        parsed = parse_query(query, list(self.SEARCH_FIELDS))
+        if seat:
+            parsed.seats.append(seat)
+        seats = parsed.seats or list(self.SEARCH_FIELDS)
+        fields = [self.SEARCH_FIELDS[key] for key in dict.fromkeys(seats)]
+        entries = self.state.journal_entries
+        
+        def text_of(position: int) -> List[str]:
+            return [getattr(entries[position], attr) for _, attr in fields]
+        
+        predicates = []
+        if parsed.start is not None or parsed.end is not None:
+            lo, hi = self.journal_span(parsed.start, parsed.end)
+            predicates.append(Predicate(
+                "date", lambda p: lo <= p < hi, hi - lo if hi > lo else 0, lambda: range(lo, max(lo, hi)), exact=True))
+        if parsed.bruces:
+            ids = set(bruce_ids(self.all_bruces(), parsed.bruces))
+            lists = [self.bruce_index().positions_for(i, entries) for i in ids]
+            predicates.append(posting_predicate(
+                "bruce:" + "|".join(parsed.bruces), lists, lambda p: entries[p].reigning_bruce_id in ids))
+        if parsed.types:
+            types = set(parsed.types)
+            predicates.append(posting_predicate(
+                "type:" + "|".join(parsed.types), [self.session_type_index().entries_of(t) for t in types],
+                lambda p: entries[p].session_type.lower() in types))
+        
+        text_index = self.related_index() if parsed.terms else None
+        for term in parsed.terms:
+            predicates.append(text_predicate(repr(term), term, text_index, text_of))
+        for term in parsed.excluded:
+            predicates.append(Predicate(f"-{term!r}", lambda p, term=term: not any(term in text.lower() for text in text_of(p))))
+        if parsed.excluded_bruces:
+            excluded = set(bruce_ids(self.all_bruces(), parsed.excluded_bruces))
+            predicates.append(Predicate("-bruce:" + "|".join(parsed.excluded_bruces), lambda p: entries[p].reigning_bruce_id not in excluded))
+        if parsed.excluded_types:
+            excluded_types = set(parsed.excluded_types)
+            predicates.append(Predicate("-type:" + "|".join(parsed.excluded_types), lambda p: entries[p].session_type.lower() not in excluded_types))
         
-        total = sum(dominance.values())
-        if total == 0:
-            return ["⚠️  No recent parliament activity detected"]
+        positions, plan = execute(predicates, len(entries))
+        matches = [(entries[p], match_contexts(entries[p], fields, parsed.terms)) for p in positions]
+        return matches, plan
+    
+    def sync_journal_log(self) -> None:
+        """Bring the append-only journal log (see scan.py) up to date with the journal.
+        
+        Entries written since the last sync are appended; a log that does
+        not end with an entry of this journal is rewritten, as is one
+        written before whole entries were logged.
+        """
+        entries = self.state.journal_entries
+        tail = self.storage.journal_tail() or {}
+        last = tail.get("n")
+        if (isinstance(last, int) and 0 <= last < len(entries) and entries[last].id == tail.get("id")
+                and "epoch" in tail):
+            if last + 1 < len(entries):
+                self.storage.append_journal(journal_record(i, entries[i]) for i in range(last + 1, len(entries)))
+        else:
+            self.storage.append_journal((journal_record(i, entry) for i, entry in enumerate(entries)), rewrite=True)
+    
+    def regex_search(self, pattern: str, seat: Optional[str] = None, ignore_case: bool = True,
+                     workers: Optional[int] = None):
+        """Yield (entry, [(field label, context)]) for entries matching a regular expression, oldest first.
         
-        # Check for Short-Term dominance
-        if dominance["short_term"] / total > 0.5:
-            warnings.append("⚠️  Short-Term Bruce is dominating decisions. Consider long-term consequences.")
+        The whole journal is scanned in parallel (see scan.py). Raises
+        re.error for an invalid pattern.
+        """
+        fields = [self.SEARCH_FIELDS[seat]] if seat else list(self.SEARCH_FIELDS.values())
+        self.sync_journal_log()
+        entries = self.state.journal_entries
+        flags = re.IGNORECASE if ignore_case else 0
+        for position, found_in in parallel_scan(self.storage.journal_file, pattern, flags, fields, workers):
+            yield entries[position], found_in
+    
+    def session_type_index(self) -> SessionTypeIndex:
+        """Get the per-session-type posting lists, building them on first use."""
+        if self._types is None:
+            self._types = SessionTypeIndex.build(self.state)
+        return self._types
+    
+    def journal_columns(self) -> JournalColumns:
+        """Get the columnar journal store, loading or building it on first use.
         
-        # Check for Purpose silence
-        if dominance["purpose"] / total < 0.1:
-            warnings.append("⚠️  Purpose Bruce has been silent. Risk of existential drift.")
+        Saved columns are caught up with entries written since they were
+        saved; they are rebuilt from the journal only if they no longer match.
+        """
+        if self._columns is None:
+            entries = self.state.journal_entries
+            columns = self.storage.load_columns()
+            if columns is not None:
+                self._columns_saved = len(columns)
+                if not columns.catch_up(entries):
+                    columns = None
+            if columns is None:
+                columns = JournalColumns.from_entries(entries)
+                self._columns_saved = -1
+            self._columns = columns
+        return self._columns
+    
+    def activity_log(self) -> ActivityLog:
+        """Get the per-day activity calendars, loading or building them on first use."""
+        if self._calendar is None:
+            entries = self.state.journal_entries
+            log = self.storage.load_activity()
+            if log is not None:
+                self._calendar_saved = log.entry_count
+                if not log.catch_up(entries):
+                    log = None
+            if log is None:
+                log = ActivityLog.from_entries(entries)
+                self._calendar_saved = -1
+            self._calendar = log
+        return self._calendar
+    
+    def related_index(self) -> TfidfIndex:
+        """Get the TF-IDF index of entry text, loading or building it on first use.
         
-        # Check for Ultimate silence
-        if dominance["ultimate"] / total < 0.05:
-            warnings.append("⚠️  Ultimate Bruce is not being consulted. Death-aware wisdom is missing.")
+        Unlike the journal columns it is only kept current once used, so it
+        is saved here when loading had to index new entries.
+        """
+        if self._related is None:
+            entries = self.state.journal_entries
+            index = self.storage.load_related()
+            if index is not None:
+                self._related_saved = len(index)
+                if not index.catch_up(entries):
+                    index = None
+            if index is None:
+                index = TfidfIndex.from_entries(entries)
+                self._related_saved = -1
+            self._related = index
+            if len(index) != self._related_saved and not self._batch_depth:
+                self.storage.save_related(index)
+                self._related_saved = len(index)
+        return self._related
+    
+    def related_entries(self, query: str, count: int = 5) -> List[Tuple[JournalEntry, float]]:
+        """Past entries most similar to an entry (given by ID) or to free text.
         
-        return warnings if warnings else ["✓ Parliament balance appears healthy"]
+        Returns (entry, cosine similarity) pairs, most similar first; an
+        entry is never listed as related to itself.
+        """
+        index = self.related_index()
+        position = self.record_index().entry_positions.get(query)
+        if position is not None:
+            matches = index.most_similar(index.row(position), count, exclude=position)
+        else:
+            matches = index.most_similar(index.vectorize(query), count)
+        return [(self.state.journal_entries[i], score) for i, score in matches]
+    
+    def activity_calendar(self, bruce: Optional[ReigningBruce] = None) -> ActivityCalendar:
+        """Session counts per day and streaks, overall or for one Bruce."""
+        log = self.activity_log()
+        return log.overall if bruce is None else log.for_bruce(bruce.id)
+    
+    def summary_stats(self) -> Dict:
+        """Headline usage numbers: sessions, decisions, identities and streaks."""
+        entries = self.state.journal_entries
+        decisions = self.state.decisions
+        activity = self.activity_calendar()
+        passed = sum(1 for d in decisions if d.passed)
+        days_active = (local_day(entries[-1].epoch) - local_day(entries[0].epoch)).days + 1 if entries else 0
+        return {
+            "sessions": len(entries),
+            "decisions": len(decisions),
+            "passed": passed,
+            "failed": len(decisions) - passed,
+            "sessions_with_decisions": len({d.entry_id for d in decisions if d.entry_id}),
+            "identities": len(self.all_bruces()),
+            "days_active": days_active,
+            "current_streak": activity.current_streak(),
+            "longest_streak": activity.longest,
+            "session_types": self.session_type_counts(),
+        }
+    
+    def seat_activity(self) -> SeatActivity:
+        """Get seat-dominance queries over the journal columns."""
+        if self._activity is None:
+            self._activity = SeatActivity(self.journal_columns())
+        return self._activity
+    
+    def session_type_counts(self) -> Dict[str, int]:
+        """Number of sessions of each type."""
+        return self.journal_columns().session_type_counts()
+    
+    def analyze_seat_dominance(self, days: int = 7) -> Dict[str, int]:
+        """Count entries in the last `days` calendar days where each seat spoke at length."""
+        return self.seat_activity().dominance(days)
+    
+    def analyze_dominance_windows(self) -> Dict[str, Dict[str, int]]:
+        """Seat dominance over the standard 7d/30d/365d windows."""
+        return self.seat_activity().window_dominance(WINDOWS)
     
-    def add_temporary_bruce(self, name: str, description: str) -> TemporaryBruce:
-        """Add a temporary Bruce to the parliament."""
+    def analyze_dominance_by_bruce(self) -> Dict[str, Dict[str, int]]:
+        """Seat dominance over each reigning Bruce's sessions."""
+        return self.seat_activity().by_bruce()
+    
+    def warning_rules(self) -> CompiledRules:
+        """Get the compiled warning rules, compiling them on first use."""
+        if self._rules is None:
+            try:
+                self._rules = compile_rules(self.storage.load_warning_rules())
+            except RuleError as e:
+                print(f"Error compiling warning rules: {e}")
+                self._rules = compile_rules()
+        return self._rules
+    
+    def generate_warnings(self, days: int = 7) -> List[str]:
+        """Generate behavioral warnings based on recent patterns."""
+        return self.warning_rules().evaluate(self.seat_activity(), days)
+    
+    def add_temporary_bruce(self, name: str, description: str, ttl_days: Optional[float] = None,
+                            max_sessions: Optional[int] = None) -> TemporaryBruce:
+        """Add a temporary Bruce to the parliament.
+        
+        With ttl_days or max_sessions the voice is dismissed automatically
+        once that much time has passed or that many sessions have been
+        recorded, whichever comes first.
+        """
+        if ttl_days is not None and ttl_days <= 0:
+            raise ValueError("ttl_days must be positive")
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
         temp_id = str(uuid.uuid4())[:8]
         temp_bruce = TemporaryBruce(
             id=temp_id,
             name=name,
-            description=description
+            description=description,
+            expires_at=now_epoch() + int(ttl_days * DAY_SECONDS) if ttl_days is not None else None,
+            expires_at_session=len(self.state.journal_entries) + max_sessions if max_sessions is not None else None
         )
         self.state.temporary_bruces[temp_id] = temp_bruce
+        self.voice_sweeper().add(temp_bruce)
+        self._note_voice_deadlines()
+        self._emit(events.VOICE_ADDED, voice=temp_bruce.dict())
         self.save()
         return temp_bruce
     
+    def voice_sweeper(self) -> VoiceSweeper:
+        """Get the voice expiry heaps, building them on first use."""
+        if self._sweeper is None:
+            self._sweeper = VoiceSweeper.build(self.state.temporary_bruces)
+        return self._sweeper
+    
+    def _sweep_voices(self, now: Optional[int] = None) -> List[TemporaryBruce]:
+        now = now if now is not None else now_epoch()
+        sessions = len(self.state.journal_entries)
+        if self._sweeper is None:
+            # Only build the heaps when the recorded earliest deadline is due
+            by_time, by_session = self.state.next_voice_expiry, self.state.next_voice_expiry_session
+            if (by_time is None or by_time > now) and (by_session is None or by_session > sessions):
+                return []
+        expired = self.voice_sweeper().sweep(self.state.temporary_bruces, now, sessions)
+        self._note_voice_deadlines()
+        for voice in expired:
+            self._emit(events.VOICE_EXPIRED, voice=voice.dict())
+        return expired
+    
+    def _note_voice_deadlines(self) -> None:
+        self.state.next_voice_expiry, self.state.next_voice_expiry_session = self.voice_sweeper().next_deadlines()
+    
+    def expire_voices(self, now: Optional[int] = None) -> List[TemporaryBruce]:
+        """Dismiss temporary voices past their time or session limit, saving if any were."""
+        expired = self._sweep_voices(now)
+        if expired:
+            self.save()
+        return expired
+    
+    def sessions_left(self, voice: TemporaryBruce) -> Optional[int]:
+        """Sessions before a voice with a session limit is dismissed."""
+        if voice.expires_at_session is None:
+            return None
+        return max(voice.expires_at_session - len(self.state.journal_entries), 0)
+    
     def dismiss_temporary_bruce(self, temp_id: str) -> bool:
-        """Remove a temporary Bruce from parliament."""
-        if temp_id in self.state.temporary_bruces:
-            del self.state.temporary_bruces[temp_id]
+        """Remove a temporary Bruce from parliament.
+        
+        The voice is marked inactive rather than deleted, so entries it spoke
+        in still show its name and its history stays readable.
+        """
+        voice = self.state.temporary_bruces.get(temp_id)
+        if voice is not None and voice.active:
+            voice.active = False
+            self._emit(events.VOICE_DISMISSED, voice=voice.dict())
             self.save()
             return True
         return False
     
     def get_active_temporary_bruces(self) -> List[Tuple[str, TemporaryBruce]]:
-        """Get all active temporary bruces."""
+        """Get all active temporary bruces.
+        
+        Voices past their limits are dismissed in memory first, without saving.
+        """
+        self._sweep_voices()
         return [(temp_id, bruce) for temp_id, bruce in self.state.temporary_bruces.items() if bruce.active]
     
     def get_all_parliament_seats(self) -> Dict[str, Dict]:
@@ -189,28 +731,20 @@ class ParliamentService:
         seats = {}
         
         # Add permanent seats with full descriptions for wearing the mask
-        permanent = [
-            ("ShortTerm", "🟥 Short-Term Bruce — The Rebel / The Animal", "Time: now, today, tonight\nBody over mind. Nerves over plans.\n'I want relief, not reasons. Pain feels urgent. Boredom is death. Discipline feels like a cage. I don't care about later. I speak in cravings, anger, fear. If ignored, I sabotage.'\n\nActivation: What hurts right now, and what would make it stop?"),
-            ("MidTerm", "🟨 Mid-Term Bruce — The Operator", "Time: this week, this month\nExecution over emotion.\n'I care about momentum. Small wins beat grand visions. Systems beat willpower. Burnout is my enemy. Chaos wastes energy. I translate emotion into tasks. Consistency is power.'\n\nActivation: What's the minimum action that moves this forward?"),
-            ("LongTerm", "🟦 Long-Term Bruce — The Architect", "Time: years ahead\nStructure over impulse.\n'I think in systems and leverage. Compounding is sacred. Short-term pleasure is expensive. I care about trajectory, not mood. Emotions are data. I design environments. Waste of potential is the real sin.'\n\nActivation: Does this scale, compound, or rot?"),
-            ("Purpose", "🟪 Purpose Bruce — The Dharma Bearer", "Time: lifetime\nMeaning over success.\n'I guard the story of your life. Power without meaning is hollow. Pain must become purpose. I ask why before how. Betraying values costs more than failure. I see patterns across incarnations of you. I speak softly but halt everything.'\n\nActivation: Is this worthy of the story we're living?"),
-            ("Ultimate", "⚫ Ultimate Bruce — The Judge", "Time: deathbed\nLegacy over everything.\n'I am immune to excuses. I don't care how it felt, only what it became. Regret is my metric. I veto actions you'll live with forever. Comfort now can mean shame later. I see your life as one object.'\n\nActivation: When this is over… will we respect this choice?"),
-        ]
-        
-        for key, name, prompt in permanent:
-            seats[key] = {
+        for seat in self.seats.permanent:
+            seats[seat.key] = {
                 "type": "permanent",
-                "name": name,
-                "prompt": prompt,
+                "name": seat.title,
+                "prompt": seat.prompt,
                 "has_votes": True
             }
         
         # Add reigning bruce
         if self.state.reigning_bruce:
-            seats["Reigning"] = {
+            seats[self.seats.reigning.key] = {
                 "type": "reigning",
                 "name": self.state.reigning_bruce.name,
-                "prompt": f"Synthesize the parliament's wisdom and set direction for the realm",
+                "prompt": self.seats.reigning.prompt,
                 "has_votes": True
             }
         
@@ -229,7 +763,8 @@ class ParliamentService:
     def update_temporary_bruce_statement(self, temp_id: str, statement: str) -> bool:
         """Update the last statement of a temporary bruce."""
         if temp_id in self.state.temporary_bruces:
-            self.state.temporary_bruces[temp_id].last_statement = statement
+            self.state.temporary_bruces[temp_id].remember(statement)
+            self._emit(events.VOICE_UPDATED, voice=self.state.temporary_bruces[temp_id].dict())
             self.save()
             return True
         return False
@@ -240,24 +775,35 @@ class ParliamentService:
         
         Args:
             session_type: Type of session (daily, weekly, etc.)
-            collect_callback: Async callback function that takes (seat_key, seat_name, prompt, round_num) and returns response or None to stop
+            collect_callback: Callback that takes (seat_key, seat_name, prompt, round_num, is_first_round) keyword arguments and returns the response, or None to stop
         
         Returns:
             Tuple of (permanent_responses, temporary_responses)
         """
-        permanent_responses = {
-            "short_term": "",
-            "mid_term": "",
-            "long_term": "",
-            "purpose": "",
-            "ultimate": "",
-            "reigning": ""
-        }
+        rotation = self.rotate_session(session_type)
+        try:
+            prompt = next(rotation)
+            while True:
+                prompt = rotation.send(collect_callback(**prompt))
+        except StopIteration as done:
+            return done.value
+    
+    def rotate_session(self, session_type: str):
+        """
+        Generator driving a rotating discussion, independent of how responses are collected.
+        
+        Yields the keyword arguments for one seat's prompt (seat_key, seat_name,
+        prompt, round_num, is_first_round) and expects that seat's response, or
+        None to stop, to be sent back. Returns (permanent_responses,
+        temporary_responses) when the discussion ends.
+        """
+        permanent_responses = {seat.field: "" for seat in self.seats}
         temporary_responses = {}
         
-        # Get all parliament seats
-        all_seats = self.get_all_parliament_seats()
-        permanent_order = ["ShortTerm", "MidTerm", "LongTerm", "Purpose", "Ultimate", "Reigning"]
+        # Seats speak in registry order; the Reigning seat only while a Bruce reigns
+        bruce = self.state.reigning_bruce
+        speakers = [(seat, bruce.name if seat.reigning else seat.title) for seat in self.seats if bruce or not seat.reigning]
+        temp_seats = [(k, v) for k, v in self.get_all_parliament_seats().items() if v.get("type") == "temporary"]
         
         # Round-based discussion
         round_num = 1
@@ -265,15 +811,11 @@ class ParliamentService:
             round_responses_collected = False
             
             # Go through permanent seats in order
-            for seat_key in permanent_order:
-                if seat_key not in all_seats:
-                    continue
-                
-                seat_info = all_seats[seat_key]
-                response = collect_callback(
-                    seat_key=seat_key,
-                    seat_name=seat_info["name"],
-                    prompt=seat_info["prompt"],
+            for seat, seat_name in speakers:
+                response = yield dict(
+                    seat_key=seat.key,
+                    seat_name=seat_name,
+                    prompt=seat.prompt,
                     round_num=round_num,
                     is_first_round=(round_num == 1)
                 )
@@ -283,22 +825,18 @@ class ParliamentService:
                     break
                 
                 # Empty string is valid response
-                if response is not None:
-                    if seat_key == "Reigning":
-                        permanent_responses["reigning"] = response
-                    else:
-                        perm_key = seat_key[0].lower() + seat_key[1:].replace("Term", "_term")
-                        if perm_key in permanent_responses:
-                            if round_num == 1:
-                                permanent_responses[perm_key] = response
-                            else:
-                                permanent_responses[perm_key] += f"\n\n[Round {round_num}] {response}"
-                    round_responses_collected = True
+                if seat.reigning:
+                    if round_num == 1 or response:
+                        permanent_responses[seat.field] = response
+                elif not permanent_responses.get(seat.field):
+                    permanent_responses[seat.field] = response
+                elif response:
+                    permanent_responses[seat.field] += f"\n\n[Round {round_num}] {response}"
+                round_responses_collected = True
             
             # Go through temporary bruces
-            temp_seats = [(k, v) for k, v in all_seats.items() if v.get("type") == "temporary"]
             for temp_key, temp_info in temp_seats:
-                response = collect_callback(
+                response = yield dict(
                     seat_key=temp_key,
                     seat_name=temp_info["name"],
                     prompt=temp_info["prompt"],
@@ -310,9 +848,9 @@ class ParliamentService:
                     break
                 
                 if response is not None:
-                    if temp_key not in temporary_responses:
+                    if not temporary_responses.get(temp_key):
                         temporary_responses[temp_key] = response
-                    else:
+                    elif response:
                         temporary_responses[temp_key] += f"\n\n[Round {round_num}] {response}"
                     round_responses_collected = True
             
@@ -0,0 +1,133 @@
+"""An interactive prompt that runs pob commands against one warm service.
+
+Every ``pob`` invocation loads and validates the data file and rebuilds
+whatever indexes its command needs. The shell instead loads the profile's
+ParliamentService once and pins it, so each command line is dispatched to
+the same click command group in-process and finds the state, indexes,
+columns and caches already built. Commands still save through the service,
+which only writes when they change something.
+
+Another process may write the data file while the shell is open (a second
+terminal, ``pob serve``); its size and mtime are checked before each command
+and the service is reloaded when they moved.
+"""
+import cmd
+import shlex
+from typing import Callable, Dict, List, Optional
+import typer
+from .cache import STATE_CACHE, file_stamp
+from .services import ParliamentService
+from .storage import Storage
+
+
+class ParliamentShell(cmd.Cmd):
+    """Line-oriented front end dispatching to the pob command group."""
+
+    intro = "Parliament of Bruce shell. Type 'help' for commands, Tab to complete, 'exit' or Ctrl+D to leave."
+
+    def __init__(self, command, profile: Optional[str], warm: Dict, echo: Callable[[str], None] = print,
+                 **kwargs):
+        """`command` is the pob command group (typer.main.get_command(app)); `warm`
+        is the holder its commands take their service from, which the shell keeps filled.
+        """
+        super().__init__(**kwargs)
+        self.command = command
+        self.profile = profile
+        self.warm = warm
+        self.echo = echo
+        self.prompt = f"pob[{profile}]> " if profile else "pob> "
+        self.stamp = None
+        self.storage = Storage.for_profile(profile, cache=STATE_CACHE)
+
+    def warm_service(self) -> ParliamentService:
+        """The pinned service, reloaded if the data file was changed elsewhere."""
+        stamp = file_stamp(self.storage.data_file)
+        if self.warm.get("service") is None or stamp != self.stamp:
+            self.warm["service"] = ParliamentService(self.storage)
+            self.stamp = file_stamp(self.storage.data_file)
+        return self.warm["service"]
+
+    def close(self) -> None:
+        self.warm["service"] = None
+
+    def preloop(self) -> None:
+        try:
+            import readline
+        except ImportError:  # no line editing on this platform
+            return
+        # Complete whole words such as --count and seat:purpose
+        readline.set_completer_delims(" \t\n")
+
+    # Dispatch
+
+    def emptyline(self) -> bool:
+        return False
+
+    def default(self, line: str) -> bool:
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            self.echo(f"✗ {e}")
+            return False
+        if args[0] in ("exit", "quit"):
+            return True
+        if args[0] == "shell":
+            self.echo("✗ Already in the shell")
+            return False
+        self.run(args)
+        return False
+
+    def do_EOF(self, arg: str) -> bool:
+        self.echo("")
+        return True
+
+    def do_help(self, arg: str) -> None:
+        self.run(shlex.split(arg) + ["--help"] if arg else ["--help"])
+        if not arg:
+            self.echo("Shell: exit, quit or Ctrl+D to leave; Tab completes commands, options, seats and voice IDs.")
+
+    def run(self, args: List[str]) -> None:
+        """Run one pob command line in-process against the pinned service."""
+        self.warm_service()  # reload first if another process wrote the file
+        prefix = ["--profile", self.profile] if self.profile else []
+        try:
+            self.command.main(args=prefix + args, prog_name="pob", standalone_mode=False)
+        except typer.Abort:
+            self.echo("Aborted")
+        except (typer.Exit, SystemExit):
+            pass
+        except Exception as e:
+            if hasattr(e, "show"):  # usage errors print themselves
+                e.show()
+            else:
+                # The command may have left the in-memory state half-changed
+                self.storage.discard_cached()
+                self.warm["service"] = None
+                self.echo(f"✗ {type(e).__name__}: {e}")
+        self.stamp = file_stamp(self.storage.data_file)
+
+    # Completion
+
+    def completenames(self, text: str, *ignored) -> List[str]:
+        return sorted(name for name in list(self.command.commands) + ["exit", "quit", "help"] if name.startswith(text))
+
+    def completedefault(self, text: str, line: str, begidx: int, endidx: int) -> List[str]:
+        """Options of the command being typed, seat names, voice IDs, and seat:/type: query filters."""
+        words = line.split()
+        command = self.command.commands.get(words[0]) if words else None
+        if hasattr(command, "commands") and len(words) > 1:
+            command = command.commands.get(words[1], command)
+        return sorted(candidate for candidate in self.candidates(command) if candidate.startswith(text))
+
+    def candidates(self, command) -> List[str]:
+        service = self.warm_service()
+        seats = list(service.SEARCH_FIELDS) + [seat.key for seat in service.seats]
+        candidates = seats + list(service.state.temporary_bruces)
+        candidates += [f"seat:{seat}" for seat in service.SEARCH_FIELDS]
+        candidates += [f"type:{session_type}" for session_type in service.session_type_index().positions]
+        if command is not None:
+            if hasattr(command, "commands"):
+                candidates += list(command.commands)
+            for param in command.params:
+                candidates += [opt for opt in getattr(param, "opts", []) + getattr(param, "secondary_opts", []) if opt.startswith("-")]
+        return list(dict.fromkeys(candidates))
@@ -1,21 +1,118 @@
 import json
+import os
 from pathlib import Path
-from typing import Optional
-from .models import ParliamentState, Seat, ReigningBruce, TemporaryBruce
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+from .activity import ActivityLog
+from .cache import StateCache, file_stamp
+from .columns import JournalColumns
+from .events import EventLog
+from .models import ParliamentState, ReigningBruce, TemporaryBruce, new_record_id
+from .related import TfidfIndex
+from .rules import WarningRule
+from .seats import DEFAULT_SEATS, SeatRegistry
+
+
+DEFAULT_PROFILE = "default"
+
+PROFILE_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+
+
+def default_root() -> Path:
+    """Directory holding the default parliament and the profiles directory."""
+    return Path.home() / ".parliament_of_bruce"
+
+
+def write_json(path: Path, data, **kwargs) -> Optional[Tuple[int, int]]:
+    """Write JSON to a file atomically: readers see the old or the new file, never part of one.
+    
+    Returns the written file's stamp (see cache.file_stamp).
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, **kwargs)
+        f.flush()
+        os.fsync(f.fileno())
+    stamp = file_stamp(tmp_path)
+    os.replace(tmp_path, path)
+    return stamp
 
 
 class Storage:
     """Handles persistence of parliament data."""
     
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(self, data_dir: Optional[Path] = None, cache: Optional[StateCache] = None):
         if data_dir is None:
-            data_dir = Path.home() / ".parliament_of_bruce"
+            data_dir = default_root()
         
         self.data_dir = data_dir
+        self.cache = cache
         self.data_file = data_dir / "parliament_data.json"
+        self.rules_file = data_dir / "warning_rules.json"
+        self.columns_file = data_dir / "journal_columns.json"
+        self.activity_file = data_dir / "activity_calendar.json"
+        self.related_file = data_dir / "related_index.json"
+        self.journal_file = data_dir / "journal.jsonl"
+        self.events_file = data_dir / "events.jsonl"
+        self.events_index_file = data_dir / "events.idx"
+        self.draft_file = data_dir / "session_draft.jsonl"
+        self.seats_file = data_dir / "seats.json"
         self.data_dir.mkdir(parents=True, exist_ok=True)
     
+    @classmethod
+    def for_profile(cls, profile: Optional[str] = None, root: Optional[Path] = None, cache: Optional[StateCache] = None) -> "Storage":
+        """Storage for a named profile.
+        
+        The default profile is the original single-user data directory;
+        other profiles live under its profiles/ directory. Processes that
+        load the profile again and again pass cache=STATE_CACHE.
+        """
+        root = root or default_root()
+        if profile is None or profile == DEFAULT_PROFILE:
+            return cls(root, cache=cache)
+        if not PROFILE_NAME.match(profile):
+            raise ValueError(f"Invalid profile name '{profile}': use letters, digits, '.', '-' and '_'")
+        return cls(root / "profiles" / profile, cache=cache)
+    
+    @staticmethod
+    def list_profiles(root: Optional[Path] = None) -> List[str]:
+        """Names of profiles with saved data, default first."""
+        root = root or default_root()
+        names = [DEFAULT_PROFILE] if (root / "parliament_data.json").exists() else []
+        profiles_dir = root / "profiles"
+        if profiles_dir.is_dir():
+            names.extend(sorted(
+                path.name for path in profiles_dir.iterdir()
+                if PROFILE_NAME.match(path.name) and (path / "parliament_data.json").exists()
+            ))
+        return names
+    
     def load(self) -> ParliamentState:
+        """Load parliament state, from the shared cache when the file is unchanged.
+        
+        The cache keeps a snapshot no service touches and every load gets its
+        own clone, so one service's unsaved changes never reach another.
+        """
+        if self.cache is None:
+            return self._load()
+        
+        key = self.data_file.resolve()
+        snapshot = self.cache.get(key)
+        if snapshot is not None:
+            return snapshot.clone()
+        # Stamped before reading: a write that lands meanwhile leaves the entry stale
+        stamp = file_stamp(self.data_file)
+        state = self._load()
+        if stamp is not None:
+            self.cache.put(key, state.clone(), stamp)
+        return state
+    
+    def discard_cached(self) -> None:
+        """Drop this data file's cached state so the next load reads the file."""
+        if self.cache is not None:
+            self.cache.discard(self.data_file.resolve())
+    
+    def _load(self) -> ParliamentState:
         """Load parliament state from disk."""
         if not self.data_file.exists():
             return self._create_initial_state()
@@ -33,45 +130,183 @@ class Storage:
                 for entry in data["journal_entries"]:
                     if "temporary_bruce_entries" not in entry:
                         entry["temporary_bruce_entries"] = {}
+                    if entry.get("decisions_voted_on"):
+                        self._migrate_embedded_decisions(entry, data.setdefault("decisions", []))
+                    entry.pop("decisions_voted_on", None)
+            
+            # Backward compatibility: give Bruces IDs and link old records to them
+            self._migrate_bruce_ids(data)
             
             return ParliamentState(**data)
         except Exception as e:
             print(f"Error loading data: {e}")
             return self._create_initial_state()
     
+    def _migrate_embedded_decisions(self, entry: dict, decisions: list) -> None:
+        """Move decisions embedded in an old entry into the shared decision list."""
+        entry.setdefault("id", new_record_id())
+        entry_decision_ids = entry.setdefault("decision_ids", [])
+        for payload in entry["decisions_voted_on"]:
+            decision = next(
+                (d for d in decisions if d.get("topic") == payload.get("topic") and d.get("timestamp") == payload.get("timestamp")),
+                None
+            )
+            if decision is None:
+                decision = dict(payload)
+                decisions.append(decision)
+            decision.setdefault("id", new_record_id())
+            decision["entry_id"] = entry["id"]
+            if decision["id"] not in entry_decision_ids:
+                entry_decision_ids.append(decision["id"])
+    
+    def _migrate_bruce_ids(self, data: dict) -> None:
+        """Assign Bruce IDs and link entries/decisions saved before IDs existed.
+        
+        Old records only carry a Bruce name, so each is matched to the Bruce
+        of that name whose reign had begun by the record's date.
+        """
+        bruces = list(data.get("bruce_history", []))
+        if data.get("reigning_bruce"):
+            bruces.append(data["reigning_bruce"])
+        for bruce in bruces:
+            bruce.setdefault("id", new_record_id())
+        bruces.sort(key=lambda b: b["start_date"])
+        
+        def reigning_at(date: str, name: Optional[str] = None) -> Optional[str]:
+            match = None
+            for bruce in bruces:
+                if bruce["start_date"] > date:
+                    break
+                if name is None or bruce["name"] == name:
+                    match = bruce
+            if match is None or (name is None and match.get("end_date") and match["end_date"] < date):
+                return None
+            return match["id"]
+        
+        entry_bruces = {}
+        for entry in data.get("journal_entries", []):
+            if "reigning_bruce_id" not in entry:
+                name = entry.get("reigning_bruce_name")
+                entry["reigning_bruce_id"] = reigning_at(entry["date"], name) if name and name != "None" else None
+            if "id" in entry:
+                entry_bruces[entry["id"]] = entry["reigning_bruce_id"]
+        
+        for decision in data.get("decisions", []):
+            if "reigning_bruce_id" not in decision:
+                if decision.get("entry_id") in entry_bruces:
+                    decision["reigning_bruce_id"] = entry_bruces[decision["entry_id"]]
+                else:
+                    decision["reigning_bruce_id"] = reigning_at(decision["timestamp"])
+    
     def save(self, state: ParliamentState) -> None:
         """Save parliament state to disk."""
-        with open(self.data_file, 'w') as f:
-            json.dump(state.dict(), f, indent=2)
+        stamp = write_json(self.data_file, state.dict(), indent=2)
+        if self.cache is not None:
+            self.cache.put(self.data_file.resolve(), state.clone(), stamp)
+    
+    def load_columns(self) -> Optional[JournalColumns]:
+        """Load the saved journal columns, or None if they must be rebuilt."""
+        if not self.columns_file.exists():
+            return None
+        
+        try:
+            with open(self.columns_file, 'r') as f:
+                return JournalColumns.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def save_columns(self, columns: JournalColumns) -> None:
+        """Save the journal columns next to the data file."""
+        write_json(self.columns_file, columns.to_dict())
+    
+    def load_activity(self) -> Optional[ActivityLog]:
+        """Load the saved activity calendar, or None if it must be rebuilt."""
+        if not self.activity_file.exists():
+            return None
+        
+        try:
+            with open(self.activity_file, 'r') as f:
+                return ActivityLog.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def save_activity(self, log: ActivityLog) -> None:
+        """Save the activity calendar next to the data file."""
+        write_json(self.activity_file, log.to_dict())
+    
+    def load_related(self) -> Optional[TfidfIndex]:
+        """Load the saved TF-IDF index, or None if it must be rebuilt."""
+        if not self.related_file.exists():
+            return None
+        
+        try:
+            with open(self.related_file, 'r') as f:
+                return TfidfIndex.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def save_related(self, index: TfidfIndex) -> None:
+        """Save the TF-IDF index next to the data file."""
+        write_json(self.related_file, index.to_dict())
+    
+    def journal_tail(self) -> Optional[Dict]:
+        """The last record of the journal log, or None if it is missing, empty or torn."""
+        try:
+            with open(self.journal_file, 'rb') as f:
+                end = f.seek(0, os.SEEK_END)
+                block = b""
+                position = end
+                # Read backwards until the start of the last line is in view
+                while position > 0 and block.count(b"\n") < 2:
+                    step = min(65536, position)
+                    position -= step
+                    f.seek(position)
+                    block = f.read(step) + block
+                lines = block.rstrip(b"\n").split(b"\n")
+                return json.loads(lines[-1]) if lines[-1] and block.endswith(b"\n") else None
+        except (OSError, ValueError):
+            return None
+    
+    def append_journal(self, records: Iterable[Dict], rewrite: bool = False) -> None:
+        """Append records to the journal log, or replace it atomically with them."""
+        path = self.journal_file.with_name(self.journal_file.name + ".tmp") if rewrite else self.journal_file
+        with open(path, 'w' if rewrite else 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        if rewrite:
+            os.replace(path, self.journal_file)
+    
+    def event_log(self) -> EventLog:
+        """The change feed of this parliament (see events.py)."""
+        return EventLog(self.events_file, self.events_index_file)
+    
+    def load_warning_rules(self) -> Optional[List[WarningRule]]:
+        """Load custom warning rules, or None to use the defaults."""
+        if not self.rules_file.exists():
+            return None
+        
+        try:
+            with open(self.rules_file, 'r') as f:
+                data = json.load(f)
+            return [WarningRule(**rule) for rule in data]
+        except Exception as e:
+            print(f"Error loading warning rules: {e}")
+            return None
+    
+    def load_seats(self) -> SeatRegistry:
+        """Load this profile's seat overrides, or the default seats."""
+        if not self.seats_file.exists():
+            return DEFAULT_SEATS
+        
+        try:
+            with open(self.seats_file, 'r') as f:
+                return DEFAULT_SEATS.with_overrides(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"Error loading seats: {e}")
+            return DEFAULT_SEATS
     
     def _create_initial_state(self) -> ParliamentState:
         """Create initial parliament state with permanent seats."""
-        seats = {
-            "ShortTerm": Seat(
-                name="Short-Term Bruce — The Rebel / The Animal",
-                votes=1,
-                description="Time: now, today, tonight\nBody over mind. Nerves over plans.\n\n'I want relief, not reasons. Pain feels urgent and personal. Boredom is death. Discipline feels like a cage. I don't care about later. I speak in cravings, anger, fear. If ignored, I sabotage. I tell the raw truth others hide.'\n\nActivation: What hurts right now, and what would make it stop?"
-            ),
-            "MidTerm": Seat(
-                name="Mid-Term Bruce — The Operator",
-                votes=2,
-                description="Time: this week, this month\nExecution over emotion.\n\n'I care about momentum. Small wins beat grand visions. Systems beat willpower. Burnout is my enemy. Chaos wastes energy. I translate emotion into tasks. I ask: what's doable, not ideal. Consistency is power.'\n\nActivation: What's the minimum action that moves this forward?"
-            ),
-            "LongTerm": Seat(
-                name="Long-Term Bruce — The Architect",
-                votes=3,
-                description="Time: years ahead\nStructure over impulse.\n\n'I think in systems and leverage. Compounding is sacred. Short-term pleasure is expensive. I sacrifice now to own later. I care about trajectory, not mood. Emotions are data, not commands. I design environments, not days. Waste of potential is the real sin.'\n\nActivation: Does this scale, compound, or rot?"
-            ),
-            "Purpose": Seat(
-                name="Purpose Bruce — The Dharma Bearer",
-                votes=4,
-                description="Time: lifetime\nMeaning over success.\n\n'I guard the story of your life. Power without meaning is hollow. Pain must become purpose. I ask why before how. Betraying values costs more than failure. I see patterns across incarnations of you. I don't rush, I judge alignment. I speak softly but halt everything.'\n\nActivation: Is this worthy of the story we're living?"
-            ),
-            "Ultimate": Seat(
-                name="Ultimate Bruce — The Judge",
-                votes=5,
-                description="Time: deathbed\nLegacy over everything.\n\n'I am immune to excuses. I don't care how it felt, only what it became. Regret is my metric. I veto actions you'll have to live with forever. Comfort now can mean shame later. I see your entire life as one object. I end arguments.'\n\nActivation: When this is over… will we respect this choice?"
-            ),
-        }
-        
-        return ParliamentState(seats=seats)
+        return ParliamentState(seats=self.load_seats().seat_states())
@@ -0,0 +1,62 @@
+"""Epoch timestamps and time-zone-aware date formatting.
+
+Records keep the ISO string they were written with (naive local time, from
+``datetime.now().isoformat()``) plus an integer epoch computed once, when the
+record is created or first loaded. Sorting, comparisons and range queries use
+the epochs; these helpers turn epochs back into display strings in the local
+time zone, or in any tzinfo passed as ``tz``.
+"""
+from datetime import date, datetime, timedelta, tzinfo
+import time
+from typing import Optional, Tuple
+
+
+DATE_FORMAT = "%Y-%m-%d"
+DATETIME_FORMAT = "%Y-%m-%d %H:%M"
+SECONDS_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def to_epoch(iso: str) -> int:
+    """Epoch seconds for a stored ISO date (naive dates are local time)."""
+    return int(datetime.fromisoformat(iso).timestamp())
+
+
+def now_epoch() -> int:
+    """Current time in epoch seconds."""
+    return int(time.time())
+
+
+def to_datetime(epoch: int, tz: Optional[tzinfo] = None) -> datetime:
+    """Aware datetime for an epoch, in `tz` or the local time zone."""
+    return datetime.fromtimestamp(epoch, tz).astimezone(tz)
+
+
+def format_epoch(epoch: int, fmt: str = DATE_FORMAT, tz: Optional[tzinfo] = None) -> str:
+    """Format an epoch for display in `tz` or the local time zone."""
+    return to_datetime(epoch, tz).strftime(fmt)
+
+
+def local_day(epoch: int, tz: Optional[tzinfo] = None) -> date:
+    """Calendar day an epoch falls on in `tz` or the local time zone."""
+    return to_datetime(epoch, tz).date()
+
+
+def day_start(day: date, tz: Optional[tzinfo] = None) -> int:
+    """Epoch of midnight at the start of `day` in `tz` or the local time zone."""
+    return int(datetime(day.year, day.month, day.day, tzinfo=tz).timestamp())
+
+
+def period_bounds(period: str, tz: Optional[tzinfo] = None) -> Tuple[int, int]:
+    """Half-open epoch range [start, end) covering a YYYY-MM-DD day or YYYY-MM month.
+
+    Raises ValueError for anything else.
+    """
+    if len(period) == 10:
+        first = date.fromisoformat(period)
+        last = first + timedelta(days=1)
+    elif len(period) == 7:
+        first = date.fromisoformat(period + "-01")
+        last = (first + timedelta(days=32)).replace(day=1)
+    else:
+        raise ValueError(f"Invalid date '{period}': use YYYY-MM-DD or YYYY-MM")
+    return day_start(first, tz), day_start(last, tz)
@@ -0,0 +1,162 @@
+"""Weighted vote outcome tables, what-if simulation and power indices.
+
+With six weighted seats there are only 64 yes/no combinations, so every
+combination's yes-score is precomputed once per weight set. A vote vector is
+then a bitmask (bit ``i`` set when ``seats[i]`` votes yes) and its outcome is
+a table lookup. Banzhaf and Shapley-Shubik power indices are read straight
+off the table: a seat is pivotal for a coalition when adding it turns a
+losing coalition into a winning one.
+
+NumPy is used for bulk simulation and weight sweeps when it is installed;
+the pure-Python paths return the same results.
+"""
+from math import factorial
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional speedup
+    np = None
+
+
+YES_VOTES = ("yes", "y", "1")
+
+VoteVector = Union[int, str, Dict[str, str]]
+
+
+def is_yes(vote: str) -> bool:
+    """Whether a recorded vote counts as yes."""
+    return vote.lower() in YES_VOTES
+
+
+class OutcomeTable:
+    """Yes-score and pass/fail for every combination of seat votes."""
+
+    def __init__(self, weights: Dict[str, int], threshold: int):
+        self.seats: Tuple[str, ...] = tuple(weights)
+        self.weights: Tuple[int, ...] = tuple(weights[seat] for seat in self.seats)
+        self.threshold = threshold
+        self.max_score = sum(self.weights)
+
+        size = 1 << len(self.seats)
+        scores = [0] * size
+        for mask in range(1, size):
+            low = mask & -mask
+            scores[mask] = scores[mask ^ low] + self.weights[low.bit_length() - 1]
+        self.scores: List[int] = scores
+        self.passes: List[bool] = [score >= threshold for score in scores]
+        self._bits = {seat: 1 << i for i, seat in enumerate(self.seats)}
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def mask_for(self, vector: VoteVector) -> int:
+        """Convert a vote vector to a bitmask.
+
+        Accepts a bitmask, a string with one y/n (or 1/0) per seat in seat
+        order, or a {seat: vote} mapping where unknown seats carry no weight.
+        """
+        if isinstance(vector, bool):
+            raise TypeError(f"Vote vector {vector} must be a mask, a y/n string or a seat mapping")
+        if isinstance(vector, int):
+            if not 0 <= vector < len(self.scores):
+                raise ValueError(f"Vote mask {vector} out of range")
+            return vector
+        if isinstance(vector, str):
+            if len(vector) != len(self.seats) or any(c not in "yn10" for c in vector.lower()):
+                raise ValueError(f"Vote string '{vector}' must have one y/n per seat ({', '.join(self.seats)})")
+            return sum(1 << i for i, c in enumerate(vector.lower()) if c in "y1")
+        if not isinstance(vector, dict):
+            raise TypeError(f"Vote vector {vector!r} must be a mask, a y/n string or a seat mapping")
+        for seat, vote in vector.items():
+            if not isinstance(vote, str):
+                raise TypeError(f"Vote for seat '{seat}' must be a string like 'yes' or 'no', got {vote!r}")
+        return sum(self._bits[seat] for seat, vote in vector.items() if seat in self._bits and is_yes(vote))
+
+    def outcome(self, vector: VoteVector) -> Tuple[int, bool]:
+        """Yes-score and whether the vote passes."""
+        mask = self.mask_for(vector)
+        return self.scores[mask], self.passes[mask]
+
+    def simulate(self, vectors: Iterable[VoteVector]) -> List[Tuple[int, int, bool]]:
+        """Evaluate many vote vectors, returning (mask, yes_score, passed) for each."""
+        masks = [self.mask_for(vector) for vector in vectors]
+        if np is not None and masks:
+            scores = np.asarray(self.scores, dtype=np.int64)[np.asarray(masks, dtype=np.int64)]
+            return [(mask, score, score >= self.threshold) for mask, score in zip(masks, scores.tolist())]
+        return [(mask, self.scores[mask], self.passes[mask]) for mask in masks]
+
+    def pivotal_seats(self, vector: VoteVector) -> List[str]:
+        """Seats whose switching sides alone would flip this vote's outcome."""
+        mask = self.mask_for(vector)
+        return [seat for i, seat in enumerate(self.seats) if self.passes[mask ^ (1 << i)] != self.passes[mask]]
+
+    def banzhaf(self) -> Dict[str, float]:
+        """Normalized Banzhaf power index for each seat."""
+        return power_indices(self.weights, [self.threshold], self.seats)[0]["banzhaf"]
+
+    def shapley(self) -> Dict[str, float]:
+        """Shapley-Shubik power index for each seat."""
+        return power_indices(self.weights, [self.threshold], self.seats)[0]["shapley"]
+
+
+def _shapley_coefficients(n: int) -> List[float]:
+    """Probability that a seat joins right after a coalition of each size.
+
+    The full coalition (size n) never lacks a seat, so its weight is zero.
+    """
+    return [factorial(size) * factorial(n - size - 1) / factorial(n) for size in range(n)] + [0.0]
+
+
+def power_indices(weights: Sequence[int], thresholds: Sequence[int], seats: Sequence[str]) -> List[Dict[str, Dict[str, float]]]:
+    """Banzhaf and Shapley indices for one weight vector under several thresholds."""
+    return sweep([(weights, threshold) for threshold in thresholds], seats)
+
+
+def sweep(configs: Sequence[Tuple[Sequence[int], int]], seats: Sequence[str]) -> List[Dict[str, Dict[str, float]]]:
+    """Power indices for many (weights, threshold) configurations at once.
+
+    Each configuration's outcome table is built from the same membership
+    matrix, so NumPy evaluates a whole sweep as a few matrix operations.
+    """
+    n = len(seats)
+    size = 1 << n
+    coefficients = _shapley_coefficients(n)
+    popcounts = [bin(mask).count("1") for mask in range(size)]
+    without = [[mask for mask in range(size) if not mask & (1 << i)] for i in range(n)]
+
+    if np is not None and configs:
+        members = ((np.arange(size)[:, None] >> np.arange(n)) & 1).astype(np.int64)
+        weights = np.asarray([list(w) for w, _ in configs], dtype=np.int64)
+        thresholds = np.asarray([t for _, t in configs], dtype=np.int64)
+        passes = (members @ weights.T) >= thresholds
+        coeff = np.asarray(coefficients)[np.asarray(popcounts)]
+        swings = np.empty((n, len(configs)), dtype=np.int64)
+        shapley = np.empty((n, len(configs)))
+        for i in range(n):
+            losing = np.asarray(without[i])
+            swing = passes[losing | (1 << i)] & ~passes[losing]
+            swings[i] = swing.sum(axis=0)
+            shapley[i] = (swing * coeff[losing][:, None]).sum(axis=0)
+        totals = swings.sum(axis=0)
+        banzhaf = swings / np.maximum(totals, 1)
+        return [
+            {"banzhaf": dict(zip(seats, banzhaf[:, k].tolist())), "shapley": dict(zip(seats, shapley[:, k].tolist()))}
+            for k in range(len(configs))
+        ]
+
+    results = []
+    for weights, threshold in configs:
+        table = OutcomeTable(dict(zip(seats, weights)), threshold)
+        swings = []
+        shapley = []
+        for i in range(n):
+            swing = [mask for mask in without[i] if table.passes[mask | (1 << i)] and not table.passes[mask]]
+            swings.append(len(swing))
+            shapley.append(sum(coefficients[popcounts[mask]] for mask in swing))
+        total = max(sum(swings), 1)
+        results.append({
+            "banzhaf": {seat: count / total for seat, count in zip(seats, swings)},
+            "shapley": dict(zip(seats, shapley)),
+        })
+    return results
@@ -9,6 +9,9 @@ setup(
         "rich>=13.0.0",
         "pydantic>=1.10.0,<2.0.0",
     ],
+    extras_require={
+        "fast": ["numpy"],
+    },
     entry_points={
         "console_scripts": [
             "pob=parliament_of_bruce.cli:app",
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Async parliament service testing."""
+
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+from parliament_of_bruce.aio import AsyncParliamentService
+from parliament_of_bruce.services import ParliamentService
+from parliament_of_bruce.storage import Storage
+
+
+def answers(text: str, rounds: int = 1):
+    """Async callback answering every seat with `text` for a number of rounds."""
+    async def callback(seat_key, seat_name, prompt, round_num, is_first_round):
+        await asyncio.sleep(0)
+        return f"{text} {seat_key}" if round_num <= rounds else None
+    return callback
+
+
+class TestAsyncService:
+    """Test AsyncParliamentService."""
+
+    def test_concurrent_sessions(self):
+        """Sessions collected concurrently are all recorded and saved."""
+        async def main(tmpdir):
+            service = await AsyncParliamentService.open(Storage(data_dir=Path(tmpdir)))
+            await service.create_reigning_bruce("Async Bruce", "Testing")
+
+            async def hold(name):
+                permanent, temporary = await service.collect_rotating_session_responses("daily", answers(name, rounds=2))
+                return await service.create_session("daily", permanent, temporary)
+
+            return await asyncio.gather(*(hold(f"task{i}") for i in range(5)))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            entries = asyncio.run(main(tmpdir))
+            assert sorted(e.short_term.split()[0] for e in entries) == [f"task{i}" for i in range(5)]
+            assert "[Round 2] task0 ShortTerm" in next(e for e in entries if e.short_term.startswith("task0 ")).short_term
+
+            reloaded = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            assert len(reloaded.state.journal_entries) == 5
+            assert reloaded.state.reigning_bruce.session_count == 5
+
+    def test_matches_sync_rotation(self):
+        """Async and sync collection produce the same responses, with sync callbacks accepted too."""
+        def sync_callback(seat_key, seat_name, prompt, round_num, is_first_round):
+            return f"r{round_num} {seat_key}" if round_num <= 2 else None
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sync_service = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            sync_service.create_reigning_bruce("Bruce", "Testing")
+            sync_service.add_temporary_bruce("Anxiety", "Worries")
+            expected = sync_service.collect_rotating_session_responses("daily", sync_callback)
+
+            async def main():
+                service = await AsyncParliamentService.open(Storage(data_dir=Path(tmpdir)))
+                return await service.collect_rotating_session_responses("daily", sync_callback)
+
+            assert asyncio.run(main()) == expected
+
+    def test_saves_run_off_the_event_loop(self):
+        """Storage writes happen in a worker thread."""
+        async def main(tmpdir):
+            service = await AsyncParliamentService.open(Storage(data_dir=Path(tmpdir)))
+            loop_thread = threading.get_ident()
+            save_threads = []
+            original = service.service.storage.save
+
+            def save(state):
+                save_threads.append(threading.get_ident())
+                original(state)
+
+            with patch.object(service.service.storage, "save", save):
+                await service.add_temporary_bruce("Body", "Physical needs")
+            return loop_thread, save_threads
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            loop_thread, save_threads = asyncio.run(main(tmpdir))
+            assert save_threads and loop_thread not in save_threads
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
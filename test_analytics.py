@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""Seat-dominance analytics and warning rules testing."""
+
+import tempfile
+import os
+import json
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+from typer.testing import CliRunner
+from parliament_of_bruce import analytics, columns
+from parliament_of_bruce.activity import ActivityCalendar, ActivityLog
+from parliament_of_bruce.analytics import SeatActivity
+from parliament_of_bruce.columns import JournalColumns
+from parliament_of_bruce.cli import app
+from parliament_of_bruce.models import JournalEntry
+from parliament_of_bruce.rules import WarningRule, compile_rules
+from parliament_of_bruce.services import ParliamentService
+from parliament_of_bruce.storage import Storage
+
+runner = CliRunner()
+
+LONG = "x" * 60
+
+
+def make_entry(days_ago: float, bruce: str = "Bruce", session_type: str = "daily", **responses) -> JournalEntry:
+    """Create a journal entry dated `days_ago` days in the past."""
+    fields = {"short_term": "", "mid_term": "", "long_term": "", "purpose": "", "ultimate": ""}
+    fields.update(responses)
+    return JournalEntry(
+        date=(datetime.now() - timedelta(days=days_ago)).isoformat(),
+        session_type=session_type,
+        reigning="",
+        final_policy="",
+        reigning_bruce_name=bruce,
+        **fields
+    )
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    """Run each test against the pure-Python and NumPy code paths."""
+    if request.param == "numpy":
+        numpy = pytest.importorskip("numpy")
+        monkeypatch.setattr(analytics, "np", numpy)
+        monkeypatch.setattr(columns, "np", numpy)
+    else:
+        monkeypatch.setattr(analytics, "np", None)
+        monkeypatch.setattr(columns, "np", None)
+    return request.param
+
+
+class TestSeatActivity:
+    """Test dominance over calendar windows and per Bruce."""
+
+    def test_dominance_uses_calendar_days(self, backend):
+        """Entries older than the window are excluded regardless of count."""
+        entries = [
+            make_entry(40, short_term=LONG),
+            make_entry(20, purpose=LONG),
+            make_entry(2, ultimate=LONG, purpose=LONG),
+        ]
+        activity = SeatActivity.from_entries(entries)
+
+        assert activity.dominance(7)["ultimate"] == 1
+        assert activity.dominance(7)["short_term"] == 0
+        windows = activity.window_dominance()
+        assert windows["30d"]["purpose"] == 2
+        assert windows["365d"]["short_term"] == 1
+
+    def test_short_responses_do_not_count(self, backend):
+        """Responses at or below the active length are ignored."""
+        activity = SeatActivity.from_entries([make_entry(1, short_term="x" * 50)])
+        assert sum(activity.dominance(7).values()) == 0
+
+    def test_by_bruce(self, backend):
+        """Dominance is aggregated per reigning Bruce."""
+        entries = [
+            make_entry(3, bruce="First", short_term=LONG),
+            make_entry(2, bruce="First", short_term=LONG, purpose=LONG),
+            make_entry(1, bruce="Second", ultimate=LONG),
+        ]
+        by_bruce = SeatActivity.from_entries(entries).by_bruce()
+        assert by_bruce["First"]["short_term"] == 2
+        assert by_bruce["First"]["purpose"] == 1
+        assert by_bruce["Second"]["ultimate"] == 1
+
+    def test_rolling_ratios(self, backend):
+        """Rolling ratios cover the trailing window up to each entry."""
+        entries = [
+            make_entry(30, short_term=LONG),
+            make_entry(2, purpose=LONG),
+            make_entry(1, purpose=LONG),
+        ]
+        ratios = SeatActivity.from_entries(entries).rolling_ratios(7)
+        assert ratios[0]["short_term"] == 1.0
+        assert ratios[2]["purpose"] == 1.0
+        assert ratios[2]["short_term"] == 0.0
+
+    def test_append_invalidates_cache(self, backend):
+        """Appending an entry is reflected in the next query."""
+        activity = SeatActivity.from_entries([make_entry(1, purpose=LONG)])
+        assert activity.dominance(7)["purpose"] == 1
+        activity.append(make_entry(0, purpose=LONG))
+        assert activity.dominance(7)["purpose"] == 2
+
+
+class TestWarningRules:
+    """Test the compiled warning rules engine."""
+
+    def test_default_rules(self, backend):
+        """Default rules reproduce the built-in warnings."""
+        rules = compile_rules()
+        dominated = SeatActivity.from_entries([make_entry(1, short_term=LONG), make_entry(2, short_term=LONG)])
+        warnings = rules.evaluate(dominated)
+        assert any("Short-Term Bruce is dominating" in w for w in warnings)
+        assert any("Purpose Bruce has been silent" in w for w in warnings)
+
+        balanced = SeatActivity.from_entries([make_entry(1, purpose=LONG, ultimate=LONG, mid_term=LONG)])
+        assert rules.evaluate(balanced) == ["✓ Parliament balance appears healthy"]
+        assert "No recent parliament activity" in rules.evaluate(SeatActivity())[0]
+
+    def test_rules_across_windows(self, backend):
+        """Rules with explicit windows are evaluated against their own window."""
+        rules = compile_rules([
+            WarningRule(name="quiet_week", seat="purpose", op="<", threshold=0.5, message="week {ratio:.0%}"),
+            WarningRule(name="busy_year", seat="purpose", op=">=", threshold=0.5, window="365d", message="year {window}"),
+        ])
+        activity = SeatActivity.from_entries([make_entry(100, purpose=LONG), make_entry(1, short_term=LONG)])
+        assert rules.evaluate(activity) == ["week 0%", "year 365d"]
+
+    def test_rules_loaded_from_config(self):
+        """Custom rules are read from warning_rules.json in the data directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = Storage(data_dir=Path(tmpdir))
+            with open(storage.rules_file, 'w') as f:
+                json.dump([{"name": "always", "seat": "mid_term", "op": "<=", "threshold": 1.0, "message": "Custom rule fired"}], f)
+
+            service = ParliamentService(storage)
+            service.create_session("daily", {"short_term": LONG})
+            assert service.generate_warnings() == ["Custom rule fired"]
+
+    def test_invalid_config_falls_back_to_defaults(self):
+        """A broken rules file does not break status."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = Storage(data_dir=Path(tmpdir))
+            with open(storage.rules_file, 'w') as f:
+                json.dump([{"name": "bad", "seat": "nobody", "op": "?", "threshold": 1, "message": ""}], f)
+
+            service = ParliamentService(storage)
+            assert service.warning_rules().rules == compile_rules().rules
+
+
+class TestStatusWindow:
+    """Test the status --window option."""
+
+    def test_status_with_window(self):
+        """Test status with each supported window."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                runner.invoke(app, ["reign", "new"], input="Test Bruce\nReason\n")
+                for window in ["7d", "30d", "365d"]:
+                    result = runner.invoke(app, ["status", "--window", window])
+                    assert result.exit_code == 0
+                    assert f"Psychological Analysis ({window})" in result.stdout
+
+    def test_status_invalid_window(self):
+        """Test status with an unsupported window."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                runner.invoke(app, ["reign", "new"], input="Test Bruce\nReason\n")
+                result = runner.invoke(app, ["status", "--window", "2w"])
+                assert "Invalid window" in result.stdout
+
+
+class TestJournalColumns:
+    """Test the columnar journal store."""
+
+    def test_session_type_counts(self, backend):
+        """Session types are dictionary-encoded and counted from codes."""
+        entries = [make_entry(3), make_entry(2, session_type="weekly"), make_entry(1)]
+        store = JournalColumns.from_entries(entries)
+        assert store.session_types == ["daily", "weekly"]
+        assert list(store.columns["type_codes"]) == [0, 1, 0]
+        assert store.session_type_counts() == {"daily": 2, "weekly": 1}
+
+    def test_round_trip(self):
+        """Columns survive serialization unchanged."""
+        store = JournalColumns.from_entries([make_entry(2, purpose=LONG), make_entry(1, bruce="Other")])
+        restored = JournalColumns.from_dict(json.loads(json.dumps(store.to_dict())))
+        assert restored.columns == store.columns
+        assert restored.bruces == store.bruces
+        assert restored.last_id == store.last_id
+
+    def test_catch_up(self):
+        """Saved columns append newer entries, or report that they are stale."""
+        entries = [make_entry(3), make_entry(2), make_entry(1)]
+        store = JournalColumns.from_entries(entries[:2])
+        assert store.catch_up(entries)
+        assert len(store) == 3
+        assert not JournalColumns.from_entries([make_entry(1)]).catch_up(entries)
+
+    def test_by_bruce_id(self, backend):
+        """Dominance is available per Bruce ID as well as per name."""
+        first, second = make_entry(2, short_term=LONG), make_entry(1, short_term=LONG)
+        first.reigning_bruce_id, second.reigning_bruce_id = "a", "b"
+        activity = SeatActivity.from_entries([first, second])
+        assert activity.by_bruce()["Bruce"]["short_term"] == 2
+        assert activity.by_bruce_id()["b"]["short_term"] == 1
+
+    def test_service_maintains_columns_on_write(self):
+        """Sessions are appended to the saved columns as they are recorded."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            service.create_session("daily", {"purpose": LONG})
+            service.create_session("weekly", {})
+
+            storage = Storage(data_dir=Path(tmpdir))
+            saved = storage.load_columns()
+            assert len(saved) == 2
+            assert saved.last_id == service.state.journal_entries[-1].id
+
+            reloaded = ParliamentService(storage)
+            assert reloaded.session_type_counts() == {"daily": 1, "weekly": 1}
+            assert reloaded.analyze_seat_dominance()["purpose"] == 1
+
+    def test_stale_columns_are_rebuilt(self):
+        """Columns that no longer match the journal are rebuilt."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = Storage(data_dir=Path(tmpdir))
+            storage.save_columns(JournalColumns.from_entries([make_entry(1), make_entry(0)]))
+            service = ParliamentService(storage)
+            service.state.journal_entries.append(make_entry(0, session_type="weekly"))
+            assert service.session_type_counts() == {"weekly": 1}
+
+
+class TestActivityCalendar:
+    """Test per-day activity counters and streaks."""
+
+    def test_streaks_update_incrementally(self):
+        """Runs extend, break and record the longest as days are added."""
+        calendar = ActivityCalendar()
+        start = date(2025, 1, 1)
+        for offset in [0, 1, 2, 2, 5, 6]:
+            calendar.record(start + timedelta(days=offset))
+        assert calendar.longest == 3
+        assert calendar.run_length == 2
+        assert calendar.current_streak(start + timedelta(days=6)) == 2
+        assert calendar.current_streak(start + timedelta(days=7)) == 0
+        assert calendar.count(start + timedelta(days=2)) == 2
+
+    def test_backdated_day_joins_runs(self):
+        """A session filling a gap merges the runs on either side."""
+        calendar = ActivityCalendar()
+        start = date(2025, 1, 1)
+        for offset in [1, 2, 4, 5, 6]:
+            calendar.record(start + timedelta(days=offset))
+        calendar.record(start + timedelta(days=3))
+        calendar.record(start)
+        assert calendar.longest == 7
+        assert calendar.counts_between(start - timedelta(days=1), start + timedelta(days=7)) == [0, 1, 1, 1, 1, 1, 1, 1, 0]
+
+    def test_log_tracks_bruces(self):
+        """Each Bruce gets its own calendar."""
+        first, second = make_entry(2), make_entry(1)
+        first.reigning_bruce_id, second.reigning_bruce_id = "a", "b"
+        log = ActivityLog.from_entries([first, second, make_entry(0)])
+        assert log.overall.longest == 3
+        assert log.for_bruce("a").longest == 1
+        assert log.for_bruce("missing").longest == 0
+
+    def test_service_saves_and_catches_up(self):
+        """The calendar is saved on write and caught up on load."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            bruce = service.create_reigning_bruce("Streaker", "Testing")
+            service.create_session("daily", {})
+            assert Storage(data_dir=Path(tmpdir)).load_activity().entry_count == 1
+
+            service.state.journal_entries.append(make_entry(1))
+            reloaded = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            assert reloaded.activity_calendar().current_streak() == 1
+            assert reloaded.activity_calendar(bruce).longest == 1
+
+    def test_calendar_command(self):
+        """Test pob calendar renders the heatmap and streak summary."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                runner.invoke(app, ["reign", "new"], input="Test Bruce\nReason\n")
+                runner.invoke(app, ["session", "--input", "-"], input=json.dumps({"final_policy": "x"}))
+                result = runner.invoke(app, ["calendar"])
+                assert result.exit_code == 0
+                assert "Last 52 Weeks" in result.stdout
+                assert "1 sessions on 1 days" in result.stdout
+                assert "current streak 1 days" in result.stdout
+
+                result = runner.invoke(app, ["calendar", "--year", "2020", "--bruce", "test bruce"])
+                assert "0 sessions on 0 days" in result.stdout
+
+                result = runner.invoke(app, ["stats"])
+                assert "Longest Streak: 1 days" in result.stdout
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
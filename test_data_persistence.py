@@ -5,12 +5,15 @@ import tempfile
 import os
 import json
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typer.testing import CliRunner
 from parliament_of_bruce.cli import app
 from parliament_of_bruce.storage import Storage
 from parliament_of_bruce.services import ParliamentService
-from parliament_of_bruce.models import ReigningBruce, JournalEntry
+from parliament_of_bruce.models import ReigningBruce, JournalEntry, ParliamentState
+import pytest
+from pydantic import ValidationError
+from parliament_of_bruce.timeutil import format_epoch, period_bounds
 
 runner = CliRunner()
 
@@ -373,6 +376,292 @@ class TestDataStateConsistency:
             assert result.exit_code == 0
 
 
+class TestDecisionLinks:
+    """Test decisions linked to journal entries by ID."""
+    
+    def test_vote_links_to_the_named_session(self):
+        """Test a vote is linked to the entry it names, and only to that."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            service.create_reigning_bruce("Linked Bruce", "Testing")
+            entry = service.create_session("daily", {"final_policy": "Decide things"})
+            standalone = service.vote_on_decision("Move?", ["Yes", "No"], {"Purpose": "no"})
+            assert standalone.entry_id is None  # not swept into today's session
+            decision = service.vote_on_decision("Take the job?", ["Yes", "No"], {"Purpose": "yes"}, entry_id=entry.id)
+            
+            reloaded = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            entry = reloaded.get_entry(entry.id)
+            assert entry.decision_ids == [decision.id]
+            assert [d.topic for d in reloaded.decisions_for_entry(entry)] == ["Take the job?"]
+            assert reloaded.entry_for_decision(reloaded.state.decisions[1]).id == entry.id
+            assert reloaded.entry_for_decision(reloaded.state.decisions[0]) is None
+    
+    def test_vote_without_session_is_unlinked(self):
+        """Test a vote with no session stays unlinked."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            decision = service.vote_on_decision("Standalone?", ["Yes", "No"], {})
+            assert decision.entry_id is None
+            assert service.entry_for_decision(decision) is None
+    
+    def test_embedded_decisions_are_migrated(self):
+        """Test old entries with embedded decisions load as ID references."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = Storage(data_dir=Path(tmpdir))
+            decision = {
+                "topic": "Old topic", "options": ["Yes", "No"], "votes": {"Purpose": "yes"},
+                "total_score": 18, "scores_breakdown": {"Purpose": 4}, "passed": False,
+                "timestamp": "2025-01-01T10:00:00"
+            }
+            entry = {
+                "date": "2025-01-01T09:00:00", "session_type": "daily", "short_term": "", "mid_term": "",
+                "long_term": "", "purpose": "", "ultimate": "", "reigning": "", "final_policy": "",
+                "decisions_voted_on": [decision]
+            }
+            initial = storage.load()
+            data = initial.dict()
+            data["journal_entries"] = [entry]
+            data["decisions"] = [dict(decision)]
+            with open(storage.data_file, 'w') as f:
+                json.dump(data, f)
+            
+            service = ParliamentService(storage)
+            assert len(service.state.decisions) == 1
+            entry = service.state.journal_entries[0]
+            assert entry.decision_ids == [service.state.decisions[0].id]
+            assert service.state.decisions[0].entry_id == entry.id
+    
+    def test_read_full_shows_linked_decisions(self):
+        """Test read --full renders decisions voted in the session."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.environ['HOME'] = tmpdir
+            
+            runner.invoke(app, ["reign", "new"], input="Test Bruce\nReason\n")
+            script = [{"responses": {"short_term": "Now"}, "final_policy": "Go", "votes": [{"topic": "Linked topic?", "votes": {}}]}]
+            runner.invoke(app, ["session", "--input", "-"], input=json.dumps(script))
+            
+            result = runner.invoke(app, ["read", "--full"])
+            assert "Decisions Voted" in result.stdout
+            assert "Linked topic?: FAILED" in result.stdout
+
+
+class TestBruceIndex:
+    """Test per-Bruce IDs, ranges and aggregates."""
+    
+    def test_records_carry_bruce_id(self):
+        """Test entries and decisions record the reigning Bruce's ID."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            first = service.create_reigning_bruce("Same Name", "First")
+            service.create_session("daily", {})
+            service.vote_on_decision("Pass?", ["Yes", "No"], {seat: "yes" for seat in service.VOTE_WEIGHTS})
+            second = service.create_reigning_bruce("Same Name", "Second")
+            service.create_session("weekly", {})
+            service.create_session("daily", {})
+            
+            reloaded = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            assert [e.reigning_bruce_id for e in reloaded.state.journal_entries] == [first.id, second.id, second.id]
+            assert reloaded.state.decisions[0].reigning_bruce_id == first.id
+            
+            summary = reloaded.bruce_summary(reloaded.state.bruce_history[0])
+            assert summary.entry_range == (0, 0)
+            assert (summary.decision_count, summary.passed_count) == (1, 1)
+            summary = reloaded.bruce_summary(reloaded.state.reigning_bruce)
+            assert summary.entry_range == (1, 2)
+            assert summary.session_types == {"weekly": 1, "daily": 1}
+            assert len(reloaded.entries_for_bruce(reloaded.state.reigning_bruce)) == 2
+    
+    def test_index_tracks_new_records(self):
+        """Test a built index is kept current as sessions are added."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            bruce = service.create_reigning_bruce("Tracked", "Testing")
+            assert service.bruce_summary(bruce).entry_count == 0
+            service.create_session("daily", {})
+            service.decide_batch([("A?", ["Yes", "No"], {}), ("B?", ["Yes", "No"], {})])
+            summary = service.bruce_summary(bruce)
+            assert summary.entry_count == 1
+            assert summary.decision_count == 2
+    
+    def test_legacy_records_matched_by_name_and_date(self):
+        """Test old data without Bruce IDs is linked to the right reign."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = Storage(data_dir=Path(tmpdir))
+            blank = {"short_term": "", "mid_term": "", "long_term": "", "purpose": "", "ultimate": "", "reigning": "", "final_policy": ""}
+            data = storage.load().dict()
+            data["bruce_history"] = [
+                {"name": "Bruce", "start_date": "2025-01-01T00:00:00", "end_date": "2025-02-01T00:00:00", "reason_born": "a"},
+            ]
+            data["reigning_bruce"] = {"name": "Bruce", "start_date": "2025-02-01T00:00:00", "reason_born": "b"}
+            data["journal_entries"] = [
+                dict(blank, date="2025-01-15T09:00:00", session_type="daily", reigning_bruce_name="Bruce"),
+                dict(blank, date="2025-02-15T09:00:00", session_type="daily", reigning_bruce_name="Bruce"),
+            ]
+            data["decisions"] = [
+                {"topic": "Old?", "options": [], "votes": {}, "total_score": 18, "scores_breakdown": {}, "passed": False, "timestamp": "2025-01-20T10:00:00"},
+            ]
+            with open(storage.data_file, 'w') as f:
+                json.dump(data, f)
+            
+            service = ParliamentService(storage)
+            old, current = service.state.bruce_history[0], service.state.reigning_bruce
+            assert old.id != current.id
+            assert [e.reigning_bruce_id for e in service.state.journal_entries] == [old.id, current.id]
+            assert service.state.decisions[0].reigning_bruce_id == old.id
+    
+    def test_timeline_detail(self):
+        """Test timeline --detail shows each reign's records."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.environ['HOME'] = tmpdir
+            
+            runner.invoke(app, ["reign", "new"], input="Detail Bruce\nReason\n")
+            script = [{"final_policy": "Keep going", "votes": [{"topic": "Rest?", "votes": {}}]}]
+            runner.invoke(app, ["session", "--input", "-"], input=json.dumps(script))
+            
+            result = runner.invoke(app, ["timeline", "--detail"])
+            assert result.exit_code == 0
+            assert "Journal: 1 entries" in result.stdout
+            assert "Decisions: 0 passed, 1 failed" in result.stdout
+            assert "Last Policy: Keep going" in result.stdout
+            
+            result = runner.invoke(app, ["stats"])
+            assert "Per-Bruce Record" in result.stdout
+
+
+class TestCompactEntries:
+    """Test the slotted journal entry representation."""
+    
+    def test_repeated_values_are_shared(self):
+        """Test session types and Bruce names are interned across entries."""
+        blank = {"short_term": "", "mid_term": "", "long_term": "", "purpose": "", "ultimate": "", "reigning": "", "final_policy": ""}
+        first, second = [
+            JournalEntry.parse_obj(json.loads(json.dumps(dict(blank, date="2025-01-01", session_type="daily", reigning_bruce_name="Bruce"))))
+            for _ in range(2)
+        ]
+        assert first.session_type is second.session_type
+        assert first.reigning_bruce_name is second.reigning_bruce_name
+        assert not hasattr(first, "__dict__")
+    
+    def test_state_round_trip(self):
+        """Test entries survive save and load unchanged."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            service.create_reigning_bruce("Compact", "Testing")
+            entry = service.create_session("weekly", {"purpose": "Meaning"}, {"abc123": "Voice"})
+            
+            reloaded = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            assert reloaded.state.journal_entries == [entry]
+            assert reloaded.state.dict()["journal_entries"][0]["temporary_bruce_entries"] == {"abc123": "Voice"}
+    
+    def test_invalid_entry_rejected(self):
+        """Test a malformed entry fails validation like a model field."""
+        with pytest.raises(ValidationError):
+            ParliamentState(seats={}, journal_entries=[{"date": "2025-01-01", "session_type": 3}])
+
+
+class TestTimestamps:
+    """Test stored epochs and the time helpers."""
+    
+    def test_records_store_epoch(self):
+        """Test entries and decisions carry an epoch matching their ISO date."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            entry = service.create_session("daily", {})
+            decision = service.vote_on_decision("Now?", ["Yes", "No"], {})
+            assert entry.epoch == int(datetime.fromisoformat(entry.date).timestamp())
+            assert decision.epoch == int(datetime.fromisoformat(decision.timestamp).timestamp())
+            
+            with open(service.storage.data_file) as f:
+                data = json.load(f)
+            assert data["journal_entries"][0]["epoch"] == entry.epoch
+    
+    def test_period_bounds_and_formatting(self):
+        """Test day/month ranges and formatting in an explicit time zone."""
+        start, end = period_bounds("2025-02", timezone.utc)
+        assert format_epoch(start, tz=timezone.utc) == "2025-02-01"
+        assert format_epoch(end, tz=timezone.utc) == "2025-03-01"
+        start, end = period_bounds("2025-12-31", timezone(timedelta(hours=-5)))
+        assert end - start == 86400
+        assert format_epoch(start, "%H:%M", timezone.utc) == "05:00"
+        with pytest.raises(ValueError):
+            period_bounds("2025")
+    
+    def test_entries_between(self):
+        """Test range queries over stored epochs."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            blank = {"short_term": "", "mid_term": "", "long_term": "", "purpose": "", "ultimate": "", "reigning": "", "final_policy": ""}
+            for day in ["2025-01-31", "2025-02-01", "2025-02-28", "2025-03-01"]:
+                service.state.journal_entries.append(JournalEntry(date=f"{day}T12:00:00", session_type="daily", **blank))
+            
+            entries = service.entries_between(*period_bounds("2025-02"))
+            assert [e.date[:10] for e in entries] == ["2025-02-01", "2025-02-28"]
+    
+    def test_read_invalid_month(self):
+        """Test read rejects a well-formed but impossible date."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.environ['HOME'] = tmpdir
+            
+            runner.invoke(app, ["reign", "new"], input="Test Bruce\nReason\n")
+            runner.invoke(app, ["session", "--input", "-"], input=json.dumps({"final_policy": "x"}))
+            result = runner.invoke(app, ["read", "--date", "2025-13"])
+            assert "Invalid date" in result.stdout
+
+
+
+class TestReadPagination:
+    """Test page and cursor navigation in read."""
+    
+    def make_service(self, tmpdir, count):
+        service = ParliamentService(Storage(data_dir=Path(tmpdir)))
+        service.create_reigning_bruce("Pager Bruce", "Testing")
+        with service.batch():
+            for i in range(count):
+                service.create_session("daily", {"final_policy": f"Policy {i}"})
+        return service
+    
+    def test_entry_page_positions(self):
+        """Test pages count back from the newest and cursors step from an entry."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = self.make_service(tmpdir, 25)
+            ids = [e.id for e in service.state.journal_entries]
+            
+            assert service.entry_page(10) == (15, 25)
+            assert service.entry_page(10, page=3) == (0, 5)
+            assert service.entry_page(10, page=4) == (0, 0)
+            assert service.entry_page(10, before=ids[15]) == (5, 15)
+            assert service.entry_page(10, after=ids[4]) == (5, 15)
+            assert service.entry_page(10, after=ids[24]) == (25, 25)
+            assert service.entry_page(3, span=(5, 12)) == (9, 12)
+            assert service.entry_page(3, before=ids[7], span=(5, 12)) == (5, 7)
+            with pytest.raises(ValueError):
+                service.entry_page(10, after="missing")
+    
+    def test_read_cursors(self):
+        """Test the read footer links pages together."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.environ['HOME'] = tmpdir
+            service = self.make_service(Path(tmpdir) / ".parliament_of_bruce", 5)
+            ids = [e.id for e in service.state.journal_entries]
+            
+            result = runner.invoke(app, ["read", "--count", "2"])
+            assert "Policy 4" in result.stdout and "Policy 2" not in result.stdout
+            assert "page 1 of 3" in result.stdout
+            assert f"--before {ids[3]}" in result.stdout
+            
+            result = runner.invoke(app, ["read", "--count", "2", "--before", ids[3]])
+            assert "Policy 2" in result.stdout and "Policy 1" in result.stdout
+            assert "Policy 3" not in result.stdout
+            assert f"--after {ids[2]}" in result.stdout
+            
+            result = runner.invoke(app, ["read", "--count", "2", "--page", "3", "--full"])
+            assert "Entry 1" in result.stdout and "Entry 2" not in result.stdout
+            
+            result = runner.invoke(app, ["read", "--after", "missing"])
+            assert "Unknown journal entry" in result.stdout
+            result = runner.invoke(app, ["read", "--page", "2", "--after", ids[0]])
+            assert "Use only one of" in result.stdout
+
 if __name__ == "__main__":
     import pytest
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Change feed and hook testing."""
+
+import tempfile
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+from typer.testing import CliRunner
+from parliament_of_bruce import events
+from parliament_of_bruce.cli import app
+from parliament_of_bruce.events import Event, EventLog, HookRunner
+from parliament_of_bruce.services import ParliamentService
+from parliament_of_bruce.storage import Storage
+
+runner = CliRunner()
+
+
+def make_log(tmpdir) -> EventLog:
+    return EventLog(Path(tmpdir) / "events.jsonl", Path(tmpdir) / "events.idx")
+
+
+class TestEventLog:
+    """Test the sequence-numbered log and its offset index."""
+
+    def test_append_and_resume(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log = make_log(tmpdir)
+            assert len(log) == 0 and log.read() == []
+            log.append([Event(type=events.VOICE_ADDED, data={"n": i}) for i in range(3)])
+            log.append([Event(type=events.VOICE_DISMISSED, data={"n": "ünï"})])
+            assert len(log) == 4
+            assert [e.seq for e in log.read()] == [1, 2, 3, 4]
+            assert [e.seq for e in log.read(after=2)] == [3, 4]
+            assert [e.seq for e in log.read(after=1, limit=2)] == [2, 3]
+            assert log.read(after=4) == []
+            assert log.read(after=3)[0].data == {"n": "ünï"}
+
+    def test_recovers_from_a_crashed_append(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log = make_log(tmpdir)
+            log.append([Event(type=events.VOICE_ADDED)])
+            # An event written but never indexed, then half of another
+            with open(log.path, "a") as f:
+                f.write(Event(seq=2, type=events.VOICE_UPDATED).json() + "\n")
+                f.write('{"seq": 3, "type": "voi')
+            with open(log.index_path, "ab") as f:
+                f.write(b"\x01\x02")  # torn index record
+            assert len(log) == 1
+
+            log.append([Event(type=events.VOICE_DISMISSED)])
+            assert [(e.seq, e.type) for e in log.read()] == [
+                (1, events.VOICE_ADDED), (2, events.VOICE_UPDATED), (3, events.VOICE_DISMISSED)]
+            assert [e.seq for e in log.read(after=2)] == [3]
+
+    def test_concurrent_appends_get_distinct_numbers(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            def append(worker):
+                log = make_log(tmpdir)
+                for i in range(20):
+                    log.append([Event(type=events.VOICE_ADDED, data={"worker": worker, "i": i})])
+
+            threads = [threading.Thread(target=append, args=(w,)) for w in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            read = make_log(tmpdir).read()
+            assert [e.seq for e in read] == list(range(1, 81))
+            for worker in range(4):
+                assert [e.data["i"] for e in read if e.data["worker"] == worker] == list(range(20))
+
+
+class TestServiceEvents:
+    """Test the events services emit when they save."""
+
+    def test_mutations_emit_typed_events(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(Path(tmpdir)), hooks=HookRunner())
+            bruce = service.create_reigning_bruce("Phoenix", "Rebirth")
+            voice = service.add_temporary_bruce("Grief", "Mourning", max_sessions=1)
+            entry = service.create_session("daily", {"final_policy": "Walk"}, {voice.id: "Miss them"})
+            service.vote_on_decision("Move?", ["yes", "no"], {"short_term": "yes"})
+            service.create_reigning_bruce("Ember", "Slow burn")
+
+            read = service.storage.event_log().read()
+            assert [e.type for e in read] == [
+                events.BRUCE_BORN, events.VOICE_ADDED, events.SESSION_CREATED, events.VOICE_EXPIRED,
+                events.DECISION_RECORDED, events.BRUCE_BORN]
+            assert read[0].data["bruce"]["id"] == bruce.id
+            assert read[2].data["entry"]["id"] == entry.id and read[2].data["position"] == 0
+            assert read[3].data["voice"]["active"] is False
+            assert read[5].data["previous_id"] == bruce.id
+            json.dumps([e.dict() for e in read])
+
+    def test_batches_publish_only_what_they_save(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(Path(tmpdir)), hooks=HookRunner())
+            with pytest.raises(RuntimeError):
+                with service.batch():
+                    service.create_session("daily", {"final_policy": "Lost"})
+                    raise RuntimeError("abandoned")
+            assert len(service.storage.event_log()) == 0
+
+            service = ParliamentService(Storage(Path(tmpdir)), hooks=HookRunner())
+            with patch.object(service.storage, "event_log", wraps=service.storage.event_log) as event_log:
+                with service.batch():
+                    for i in range(3):
+                        service.create_session("daily", {"final_policy": f"Policy {i}"})
+            assert event_log.call_count == 1
+            assert [e.data["position"] for e in service.storage.event_log().read()] == [0, 1, 2]
+
+
+class TestHooks:
+    """Test hooks run off the calling thread, from a bounded queue."""
+
+    def test_slow_hooks_do_not_block_saves(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            hooks = HookRunner()
+            seen = []
+            release = threading.Event()
+
+            def slow(event):
+                release.wait(5)
+                seen.append((event.seq, threading.current_thread().name))
+
+            def broken(event):
+                raise ValueError("boom")
+
+            hooks.register(slow, types=[events.SESSION_CREATED])
+            hooks.register(broken)
+            service = ParliamentService(Storage(Path(tmpdir)), hooks=hooks)
+            started = time.monotonic()
+            service.create_reigning_bruce("Phoenix", "Rebirth")
+            service.create_session("daily", {"final_policy": "Walk"})
+            assert time.monotonic() - started < 2
+            assert seen == []
+
+            release.set()
+            assert hooks.drain(timeout=5)
+            assert seen == [(2, "pob-hooks")]
+            assert hooks.failures == 2
+
+    def test_full_queue_drops_events_for_hooks_only(self):
+        hooks = HookRunner(maxsize=2)
+        release = threading.Event()
+        hooks.register(lambda event: release.wait(5))
+        hooks.publish([Event(seq=i, type=events.VOICE_ADDED) for i in range(1, 6)])
+        release.set()
+        assert hooks.drain(timeout=5)
+        assert 2 <= hooks.dropped <= 3  # the worker may have taken one off the queue
+
+    def test_plugins_register_through_entry_points(self):
+        hooks = HookRunner()
+
+        class EntryPoint:
+            name = "notify"
+
+            def load(self):
+                return lambda runner: runner.register(print, types=[events.BRUCE_BORN])
+
+        with patch.object(events.metadata, "entry_points", return_value=[EntryPoint()]) as entry_points:
+            hooks.publish([])
+            hooks.publish([])
+        entry_points.assert_called_once_with(group=events.HOOK_ENTRY_POINTS)
+        assert hooks.hooks == [(print, frozenset([events.BRUCE_BORN]))]
+
+
+class TestEventsCommand:
+    """Test the events command."""
+
+    def test_events_command(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                service = ParliamentService(Storage.for_profile(None))
+                service.create_reigning_bruce("Phoenix", "Rebirth")
+                service.create_session("daily", {"final_policy": "Walk at dawn"})
+                service.vote_on_decision("Move?", ["yes", "no"], {"short_term": "yes"})
+
+                result = runner.invoke(app, ["events"])
+                assert result.exit_code == 0
+                assert "bruce.born" in result.stdout and "Walk at dawn" in result.stdout
+                assert "Resume with: pob events --after 3" in result.stdout
+
+                result = runner.invoke(app, ["events", "--after", "1", "--json", "--limit", "1"])
+                lines = result.stdout.splitlines()
+                assert len(lines) == 1 and json.loads(lines[0])["type"] == "session.created"
+
+                result = runner.invoke(app, ["events", "--type", "decision.recorded", "--limit", "1"])
+                assert "Move?: " in result.stdout and "bruce.born" not in result.stdout
+
+                result = runner.invoke(app, ["events", "--type", "nope"])
+                assert result.exit_code == 1
+                assert "Unknown event type" in result.stdout
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Journal follow mode testing."""
+
+import tempfile
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+from typer.testing import CliRunner
+from parliament_of_bruce.cli import app
+from parliament_of_bruce.follow import InotifyWatcher, JournalFollower, StatWatcher
+from parliament_of_bruce.services import ParliamentService
+from parliament_of_bruce.storage import Storage
+
+runner = CliRunner()
+
+
+def make_service(tmpdir, count=3) -> ParliamentService:
+    service = ParliamentService(Storage(Path(tmpdir)))
+    for i in range(count):
+        service.create_session("daily", {"final_policy": f"Policy {i}"})
+    service.sync_journal_log()
+    return service
+
+
+class TestJournalFollower:
+    """Test reading only what was appended to the journal log."""
+
+    def test_reads_appended_records(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = make_service(tmpdir)
+            path = service.storage.journal_file
+            follower = JournalFollower.from_end(path, 2)
+            assert follower.read_new() == []
+
+            # Another process saves two sessions
+            other = ParliamentService(Storage(Path(tmpdir)))
+            other.create_session("weekly", {"final_policy": "Policy 3"})
+            other.create_session("weekly", {"final_policy": "Policy 4"})
+            assert [(r["n"], r["final_policy"]) for r in follower.read_new()] == [(3, "Policy 3"), (4, "Policy 4")]
+            assert follower.offset == os.path.getsize(path)
+
+            # A line is only read once it is complete
+            with open(path, "a") as f:
+                f.write('{"n": 5, "final_policy": "Pol')
+            assert follower.read_new() == []
+            with open(path, "a") as f:
+                f.write('icy 5"}\n')
+            assert [r["n"] for r in follower.read_new()] == [5]
+
+    def test_starts_inside_a_line_and_survives_rewrites(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = make_service(tmpdir, 4)
+            path = service.storage.journal_file
+            # Starting mid-file skips the partial line and records already seen
+            follower = JournalFollower(path, offset=5, last=1)
+            assert [r["n"] for r in follower.read_new()] == [2, 3]
+
+            service.sync_journal_log()
+            path.write_text("")  # stale log, rewritten by the next save
+            service.create_session("daily", {"final_policy": "Policy 4"})
+            assert [r["n"] for r in follower.read_new()] == [4]
+
+
+class TestWatchers:
+    """Test waiting for the journal log to change."""
+
+    def check(self, watcher, path):
+        try:
+            assert watcher.wait(timeout=0.05) is False
+            with open(path, "a") as f:
+                f.write("{}\n")
+            assert watcher.wait(timeout=5) is True
+        finally:
+            watcher.close()
+
+    def test_stat_watcher(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "journal.jsonl"
+            self.check(StatWatcher(path, interval=0.01), path)
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+    def test_inotify_watcher(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "journal.jsonl"
+            try:
+                watcher = InotifyWatcher(path)
+            except OSError as e:
+                pytest.skip(str(e))
+            # Changes to other files in the directory are ignored
+            (Path(tmpdir) / "parliament_data.json").write_text("{}")
+            self.check(watcher, path)
+
+
+class TestFollowCommand:
+    """Test read --follow."""
+
+    def test_follow_prints_new_entries(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                root = Path(tmpdir) / ".parliament_of_bruce"
+                make_service(root)
+                saved = []
+
+                class Watcher:
+                    """Saves a session from elsewhere on the first wait, then stops."""
+
+                    def wait(self, timeout=None):
+                        if saved:
+                            raise KeyboardInterrupt
+                        other = ParliamentService(Storage(root))
+                        voice = other.add_temporary_bruce("Grief", "Mourning")
+                        saved.append(other.create_session("weekly", {"final_policy": "Walk at dawn"},
+                                                          temp_bruce_responses={voice.id: "Miss them"}))
+                        return True
+
+                    def close(self):
+                        pass
+
+                with patch("parliament_of_bruce.cli.make_watcher", return_value=Watcher()):
+                    result = runner.invoke(app, ["read", "--follow", "--count", "1", "--full"])
+                assert result.exit_code == 0
+                assert "Policy 2" in result.stdout and "Policy 1" not in result.stdout
+                assert "Following new entries" in result.stdout
+                assert "Walk at dawn" in result.stdout and "Entry 4" in result.stdout
+                assert "Grief:" in result.stdout  # the new voice's name came from a reload
+
+                result = runner.invoke(app, ["read", "--follow", "--page", "2"])
+                assert "cannot be combined" in result.stdout
@@ -3,9 +3,18 @@
 
 import tempfile
 import os
+import json
+from pathlib import Path
 from unittest.mock import patch
 from typer.testing import CliRunner
+from parliament_of_bruce import events
+from parliament_of_bruce.cache import file_stamp
 from parliament_of_bruce.cli import app
+from parliament_of_bruce.drafts import SessionDraft
+from parliament_of_bruce.models import RECENT_STATEMENTS
+from parliament_of_bruce.services import ParliamentService
+from parliament_of_bruce.storage import Storage
+from parliament_of_bruce.timeutil import DATETIME_FORMAT, format_epoch
 
 
 runner = CliRunner()
@@ -234,6 +243,301 @@ class TestErrorHandling:
                 assert "RESULTS" in result.stdout or "Voting" in result.stdout
 
 
+class TestScriptedInput:
+    """Test non-interactive sessions and votes driven by --input."""
+    
+    def test_session_input_file_multiple_sessions(self):
+        """Test recording several scripted sessions from one file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                runner.invoke(app, ["reign", "new"], input="Scripted Bruce\nAutomation\n")
+                runner.invoke(app, ["add-voice", "Anxiety", "-d", "Worry"])
+                
+                script = {
+                    "sessions": [
+                        {
+                            "type": "daily",
+                            "responses": {"short_term": ["Coffee", "Then a walk"], "mid_term": ["", "Later"], "purpose": "Write the book"},
+                            "temporary": {"Anxiety": "Deadlines"},
+                            "final_policy": "Morning pages first"
+                        },
+                        {"type": "weekly", "responses": {"ultimate": "Stay the course"}, "final_policy": "Rest Sunday"}
+                    ]
+                }
+                script_path = os.path.join(tmpdir, "script.json")
+                with open(script_path, 'w') as f:
+                    json.dump(script, f)
+                
+                result = runner.invoke(app, ["session", "--input", script_path])
+                assert result.exit_code == 0
+                assert "Recorded 2 sessions" in result.stdout
+                
+                result = runner.invoke(app, ["read", "--full"])
+                assert "Morning pages first" in result.stdout
+                assert "[Round 2] Then a walk" in result.stdout
+                assert "Deadlines" in result.stdout
+                assert "Rest Sunday" in result.stdout
+                
+                # A blank first answer takes the later one with no round marker
+                entry = ParliamentService(Storage(Path(tmpdir) / ".parliament_of_bruce")).state.journal_entries[0]
+                assert entry.mid_term == "Later"
+    
+    def test_vote_input_from_stdin(self):
+        """Test scripted votes read from stdin."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                runner.invoke(app, ["reign", "new"], input="Scripted Bruce\nAutomation\n")
+                
+                script = {"votes": [
+                    {"topic": "Learn piano?", "votes": {"Purpose": "yes", "Ultimate": "yes", "Reigning": "yes"}},
+                    {"topic": "Skip the gym?", "votes": {"short_term": "yes"}}
+                ]}
+                result = runner.invoke(app, ["vote", "--input", "-"], input=json.dumps(script))
+                assert result.exit_code == 0
+                assert "Learn piano?: PASSED" in result.stdout
+                assert "Skip the gym?: FAILED" in result.stdout
+    
+    def test_invalid_script_records_nothing(self):
+        """Test that an unknown seat fails the run without partial writes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                runner.invoke(app, ["reign", "new"], input="Scripted Bruce\nAutomation\n")
+                
+                script = [
+                    {"responses": {"short_term": "Fine"}, "final_policy": "Keep going"},
+                    {"responses": {"imaginary_seat": "Hello"}}
+                ]
+                result = runner.invoke(app, ["session", "--input", "-"], input=json.dumps(script))
+                assert result.exit_code == 1
+                assert "Unknown seat" in result.stdout
+                
+                result = runner.invoke(app, ["read"])
+                assert "No journal entries" in result.stdout
+
+
+
+class TestSessionDrafts:
+    """Test session autosave and --resume."""
+    
+    def data_dir(self, tmpdir):
+        return Path(tmpdir) / ".parliament_of_bruce"
+    
+    def test_interrupted_session_resumes(self):
+        """Test answers typed before an interruption are kept and resumed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                runner.invoke(app, ["reign", "new"], input="Draft Bruce\nTesting\n")
+                
+                # Input runs out at the third seat, like a dropped connection
+                result = runner.invoke(app, ["session", "weekly"], input="Coffee\nMeetings\n")
+                assert "saved as a draft" in result.stdout
+                assert (self.data_dir(tmpdir) / "session_draft.jsonl").exists()
+                
+                result = runner.invoke(app, ["session", "--resume"], input="Compound\nMeaning\nLegacy\nSynthesis\ny\nWalk first\nx\nx\nx\nx\nDecided\nn\nShip it\n")
+                assert result.exit_code == 0
+                assert "Resuming weekly session" in result.stdout
+                assert "Session recorded successfully" in result.stdout
+                assert not (self.data_dir(tmpdir) / "session_draft.jsonl").exists()
+                
+                entry = ParliamentService(Storage(self.data_dir(tmpdir))).state.journal_entries[-1]
+                assert entry.session_type == "weekly"
+                assert entry.short_term == "Coffee\n\n[Round 2] Walk first"
+                assert entry.mid_term == "Meetings\n\n[Round 2] x"
+                assert entry.reigning == "Synthesis\n\n[Round 2] Decided"
+                assert entry.final_policy == "Ship it"
+    
+    def test_draft_replay_ignores_torn_line(self):
+        """Test a half-written last record is dropped on replay."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "draft.jsonl"
+            draft = SessionDraft.start(path, "daily")
+            draft.answer("short_term", "One")
+            draft.answer("anxious", "Worry", temporary=True)
+            draft.next_round()
+            draft.answer("short_term", "Two")
+            draft.close()
+            with open(path, "a") as f:
+                f.write('{"kind": "answer", "seat": "mid')
+            
+            replayed = SessionDraft.load(path)
+            assert replayed.entry_id == draft.entry_id
+            assert replayed.round_num == 2
+            assert replayed.answered == {"short_term"}
+            assert replayed.permanent == {"short_term": "One\n\n[Round 2] Two"}
+            assert replayed.temporary == {"anxious": "Worry"}
+    
+    def test_blank_later_round_answers_add_no_marker(self):
+        """Test a draft stores the same text as rotate_session for blank round-2 answers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            draft = SessionDraft.start(Path(tmpdir) / "draft.jsonl", "daily")
+            draft.answer("short_term", "One")
+            draft.answer("mid_term", "")
+            draft.answer("anxious", "Worry", temporary=True)
+            draft.next_round()
+            draft.answer("short_term", "")
+            draft.answer("mid_term", "Later")
+            draft.answer("anxious", "", temporary=True)
+            draft.close()
+            
+            for responses in (draft, SessionDraft.load(draft.path)):
+                assert responses.permanent == {"short_term": "One", "mid_term": "Later"}
+                assert responses.temporary == {"anxious": "Worry"}
+    
+    def test_recorded_draft_is_not_recorded_twice(self):
+        """Test a draft whose entry was saved before a crash is discarded."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                runner.invoke(app, ["reign", "new"], input="Draft Bruce\nTesting\n")
+                service = ParliamentService(Storage(self.data_dir(tmpdir)))
+                draft = SessionDraft.start(service.storage.draft_file, "daily")
+                draft.answer("short_term", "Saved")
+                draft.set_field("final_policy", "Done")
+                service.create_session("daily", draft.permanent, entry_id=draft.entry_id)
+                draft.close()
+                
+                result = runner.invoke(app, ["session", "--resume"])
+                assert "No unfinished session" in result.stdout
+                assert len(ParliamentService(Storage(self.data_dir(tmpdir))).state.journal_entries) == 1
+
 if __name__ == "__main__":
     import pytest
     pytest.main([__file__, "-v", "-s"])
+
+
+class TestVoiceHistory:
+    """Test temporary voice statement history."""
+    
+    def test_history_is_newest_first_and_bounded(self):
+        """Test the per-voice index and the in-model ring of recent statements."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(Path(tmpdir)))
+            voice = service.add_temporary_bruce("Anxiety", "Worries")
+            other = service.add_temporary_bruce("Body", "Needs")
+            service.voice_index()
+            for i in range(RECENT_STATEMENTS + 2):
+                service.create_session("daily", {}, {voice.id: f"Worry {i}"})
+            service.create_session("daily", {}, {other.id: "Rest"})
+            
+            history = service.voice_history(voice.id, 3)
+            assert [response for _, response in history] == [f"Worry {i}" for i in (11, 10, 9)]
+            assert service.voice_index().count(voice.id) == RECENT_STATEMENTS + 2
+            assert service.voice_history(other.id) == [(service.state.journal_entries[-1], "Rest")]
+            
+            reloaded = ParliamentService(Storage(Path(tmpdir)))
+            kept = reloaded.state.temporary_bruces[voice.id]
+            assert kept.last_statement == "Worry 11"
+            assert kept.recent_statements == [f"Worry {i}" for i in range(2, RECENT_STATEMENTS + 2)]
+            assert reloaded.voice_index().positions == service.voice_index().positions
+    
+    def test_dismissed_voice_still_resolves(self):
+        """Test dismissed voices keep their name in read --full and voices --history."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                runner.invoke(app, ["reign", "new"], input="Voice Bruce\nTesting\n")
+                service = ParliamentService(Storage(Path(tmpdir) / ".parliament_of_bruce"))
+                voice = service.add_temporary_bruce("Grief", "Mourning")
+                service.create_session("daily", {"final_policy": "Rest"}, {voice.id: "It still hurts"})
+                
+                result = runner.invoke(app, ["remove-voice", voice.id], input="y\n")
+                assert "dismissed" in result.stdout
+                result = runner.invoke(app, ["remove-voice", voice.id], input="y\n")
+                assert "not found" in result.stdout
+                
+                result = runner.invoke(app, ["read", "--full"])
+                assert "Grief:" in result.stdout
+                assert "It still hurts" in result.stdout
+                
+                result = runner.invoke(app, ["voices", "--history", voice.id])
+                assert result.exit_code == 0
+                assert "(dismissed)" in result.stdout
+                assert "It still hurts" in result.stdout
+                entry = service.state.journal_entries[-1]
+                assert format_epoch(entry.epoch, DATETIME_FORMAT) in result.stdout
+                
+                for count in ("0", "-1"):
+                    result = runner.invoke(app, ["voices", "--history", voice.id, "--count", count])
+                    assert result.exit_code == 1
+                    assert "--count must be at least 1" in result.stdout
+                
+                result = runner.invoke(app, ["voices", "--history", "missing"])
+                assert "not found" in result.stdout
+
+
+class TestVoiceExpiry:
+    """Test temporary voices dismissed by a time or session limit."""
+    
+    def test_max_sessions_expires_after_session(self):
+        """Test a voice leaves the rotation once its sessions are used up."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(Path(tmpdir)))
+            brief = service.add_temporary_bruce("Brief", "Two sessions", max_sessions=2)
+            lasting = service.add_temporary_bruce("Lasting", "No limit")
+            
+            service.create_session("daily", {})
+            assert brief.active
+            assert service.sessions_left(brief) == 1
+            service.create_session("daily", {})
+            assert not brief.active
+            assert [voice.name for _, voice in service.get_active_temporary_bruces()] == ["Lasting"]
+            assert ParliamentService(Storage(Path(tmpdir))).state.temporary_bruces[brief.id].active is False
+            assert lasting.active
+    
+    def test_ttl_expires_on_startup(self):
+        """Test a voice past its TTL is dismissed when the next service starts."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(Path(tmpdir)))
+            soon = service.add_temporary_bruce("Soon", "One day", ttl_days=1)
+            later = service.add_temporary_bruce("Later", "Ten days", ttl_days=10)
+            assert service.state.next_voice_expiry == soon.expires_at
+            assert service.expire_voices(now=soon.expires_at - 1) == []
+            
+            # Dismissing by hand leaves a stale heap item that the sweep skips
+            service.dismiss_temporary_bruce(later.id)
+            assert service.expire_voices(now=later.expires_at) == [soon]
+            assert service.state.next_voice_expiry is None
+            
+            with patch("parliament_of_bruce.services.now_epoch", return_value=soon.expires_at + 1):
+                service = ParliamentService(Storage(Path(tmpdir)))
+            assert service._sweeper is None  # nothing was due, so no heaps were built
+    
+    def test_reads_hide_expired_voices_without_saving(self):
+        """Test read-only commands leave the data file alone; the next change saves the expiry."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                data_dir = Path(tmpdir) / ".parliament_of_bruce"
+                service = ParliamentService(Storage(data_dir))
+                service.create_reigning_bruce("Expiry Bruce", "Testing")
+                soon = service.add_temporary_bruce("Soon", "One day", ttl_days=1)
+                stamp = file_stamp(service.storage.data_file)
+                
+                with patch("parliament_of_bruce.services.now_epoch", return_value=soon.expires_at + 1):
+                    # A service that was already running stops listing the voice too
+                    assert service.get_active_temporary_bruces() == []
+                    for command in (["voices"], ["read"], ["stats"]):
+                        result = runner.invoke(app, command)
+                        assert result.exit_code == 0
+                        assert "Soon" not in result.stdout
+                    assert file_stamp(service.storage.data_file) == stamp
+                    
+                    runner.invoke(app, ["add-voice", "Next", "-d", "A change"])
+                reloaded = ParliamentService(Storage(data_dir))
+                assert reloaded.state.temporary_bruces[soon.id].active is False
+                assert [e.type for e in reloaded.storage.event_log().read(after=2)] == [
+                    events.VOICE_EXPIRED, events.VOICE_ADDED]
+    
+    def test_add_voice_with_limits(self):
+        """Test add-voice --ttl/--max-sessions and how voices shows them."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                runner.invoke(app, ["reign", "new"], input="Expiry Bruce\nTesting\n")
+                result = runner.invoke(app, ["add-voice", "Jetlag", "-d", "Travel fog", "--ttl", "3", "--max-sessions", "2"])
+                assert result.exit_code == 0
+                assert "Expires:" in result.stdout
+                assert "Sessions left: 2" in result.stdout
+                
+                result = runner.invoke(app, ["voices"])
+                assert "Sessions left: 2" in result.stdout
+                
+                result = runner.invoke(app, ["add-voice", "Never", "-d", "Bad limit", "--max-sessions", "0"])
+                assert result.exit_code == 1
+                assert "max_sessions must be at least 1" in result.stdout
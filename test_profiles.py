@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Profile storage, state cache and cross-profile command testing."""
+
+import tempfile
+import os
+import json
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+from typer.testing import CliRunner
+from parliament_of_bruce.cache import StateCache
+from parliament_of_bruce.cli import app
+from parliament_of_bruce.profiles import aggregate_stats, map_profiles, profile_stats
+from parliament_of_bruce.services import ParliamentService
+from parliament_of_bruce.storage import Storage
+
+runner = CliRunner()
+
+
+class TestProfileStorage:
+    """Test Storage.for_profile and the state cache."""
+
+    def test_profile_directories(self):
+        """The default profile is the root; named profiles live under profiles/."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            assert Storage.for_profile(None, root).data_dir == root
+            assert Storage.for_profile("default", root).data_dir == root
+            assert Storage.for_profile("work", root).data_dir == root / "profiles" / "work"
+            with pytest.raises(ValueError):
+                Storage.for_profile("../escape", root)
+
+    def test_list_profiles(self):
+        """Only profiles with saved data are listed, default first."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for name in ["zed", "default", "amy"]:
+                ParliamentService(Storage.for_profile(name, root, cache=None)).create_reigning_bruce("B", "R")
+            Storage.for_profile("empty", root)
+            assert Storage.list_profiles(root) == ["default", "amy", "zed"]
+
+    def test_cache_reuses_unchanged_state(self):
+        """A cached state is returned until its file changes on disk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = StateCache()
+            storage = Storage(Path(tmpdir), cache=cache)
+            ParliamentService(storage).create_reigning_bruce("Cached", "Testing")
+            with patch.object(storage, "_load") as load:
+                assert storage.load().reigning_bruce.name == "Cached"
+            load.assert_not_called()
+
+            other = ParliamentService(Storage(Path(tmpdir)))
+            other.create_reigning_bruce("Elsewhere", "Another process")
+            os.utime(storage.data_file, ns=(0, 1))
+            assert storage.load().reigning_bruce.name == "Elsewhere"
+
+    def test_services_sharing_a_cache_get_their_own_state(self):
+        """Unsaved changes in one service are invisible to another."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = StateCache()
+            first = ParliamentService(Storage(Path(tmpdir), cache=cache))
+            first.create_reigning_bruce("Shared", "Testing")
+            first.create_session("daily", {"final_policy": "Saved"})
+            second = ParliamentService(Storage(Path(tmpdir), cache=cache))
+            assert second.state is not first.state
+
+            first.state.journal_entries[0].final_policy = "MUTATED-UNSAVED"
+            first.state.journal_entries[0].decision_ids.append("unsaved")
+            first.state.reigning_bruce.name = "Renamed"
+            first.state.journal_entries.append(first.state.journal_entries[0])
+
+            third = ParliamentService(Storage(Path(tmpdir), cache=cache))
+            for service in (second, third):
+                assert [e.final_policy for e in service.state.journal_entries] == ["Saved"]
+                assert service.state.journal_entries[0].decision_ids == []
+                assert service.state.reigning_bruce.name == "Shared"
+                assert len(service.search_entries("saved")) == 1
+
+    def test_cache_evicts_least_recently_used(self):
+        """Eviction keeps the estimated size under the budget."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for i in range(3):
+                path = Path(tmpdir) / f"{i}.json"
+                path.write_text("x" * 1000)
+                paths.append(path)
+            cache = StateCache(max_bytes=8000)
+            cache.put(paths[0], "a")
+            cache.put(paths[1], "b")
+            assert cache.get(paths[0]) == "a"
+            cache.put(paths[2], "c")
+            assert paths[1] not in cache
+            assert cache.get(paths[0]) == "a" and cache.get(paths[2]) == "c"
+            assert cache.used_bytes <= cache.max_bytes
+
+    def test_failed_batch_discards_cached_state(self):
+        """Changes abandoned by a failed batch are not served from the cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = Storage(Path(tmpdir), cache=StateCache())
+            service = ParliamentService(storage)
+            service.create_reigning_bruce("Batch", "Testing")
+            with pytest.raises(RuntimeError):
+                with service.batch():
+                    service.create_session("daily", {})
+                    raise RuntimeError("abort")
+            assert storage.load().journal_entries == []
+
+    def test_write_during_a_load_is_not_cached_as_current(self):
+        """A state read just before another process saves is stale once it has."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ParliamentService(Storage(Path(tmpdir))).create_reigning_bruce("Before", "Testing")
+            storage = Storage(Path(tmpdir), cache=StateCache())
+            read = storage._load
+
+            def read_then_other_process_saves():
+                state = read()
+                ParliamentService(Storage(Path(tmpdir))).create_reigning_bruce("After", "Elsewhere")
+                os.utime(storage.data_file, ns=(0, 1))
+                return state
+
+            with patch.object(storage, "_load", side_effect=read_then_other_process_saves):
+                assert storage.load().reigning_bruce.name == "Before"
+            assert storage.load().reigning_bruce.name == "After"
+
+    def test_unshared_storage_skips_the_cache(self):
+        """One-shot storage neither caches nor copies states."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = Storage.for_profile(None, Path(tmpdir))
+            assert storage.cache is None
+            with patch("parliament_of_bruce.models.ParliamentState.clone") as clone:
+                service = ParliamentService(storage)
+                service.create_reigning_bruce("Once", "Testing")
+                service.create_session("daily", {"final_policy": "Saved"})
+                ParliamentService(storage)
+            clone.assert_not_called()
+
+
+class TestCrossProfile:
+    """Test parallel cross-profile operations and the CLI."""
+
+    def test_parallel_stats_match_serial(self):
+        """Stats computed in worker processes match a serial run."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for i, name in enumerate(["a", "b", "c"]):
+                service = ParliamentService(Storage.for_profile(name, root, cache=None))
+                for _ in range(i + 1):
+                    service.create_session("daily", {})
+            serial = map_profiles(profile_stats, root, ["a", "b", "c"], workers=1)
+            parallel = map_profiles(profile_stats, root, ["a", "b", "c"], workers=3)
+            assert parallel == serial
+            assert aggregate_stats(parallel)["sessions"] == 6
+
+    def test_profile_option_isolates_data(self):
+        """Test pob --profile keeps each profile's data separate."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                runner.invoke(app, ["--profile", "alice", "reign", "new"], input="Alice Bruce\nReason\n")
+                runner.invoke(app, ["--profile", "alice", "session", "--input", "-"], input=json.dumps([{"final_policy": "x"}]))
+
+                result = runner.invoke(app, ["--profile", "alice", "status"])
+                assert "Alice Bruce" in result.stdout
+                result = runner.invoke(app, ["status"])
+                assert "No Reigning Bruce" in result.stdout
+
+                result = runner.invoke(app, ["--profile", "../bad", "status"])
+                assert result.exit_code == 1
+                assert "Invalid profile name" in result.stdout
+
+    def test_profiles_command(self, monkeypatch):
+        """Test pob profiles list, stats and export."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                monkeypatch.chdir(tmpdir)
+                for profile in ["default", "work"]:
+                    runner.invoke(app, ["--profile", profile, "reign", "new"], input="Bruce\nReason\n")
+
+                result = runner.invoke(app, ["profiles"])
+                assert "Profiles (2)" in result.stdout
+                result = runner.invoke(app, ["profiles", "stats", "--workers", "1"])
+                assert "Total" in result.stdout
+                result = runner.invoke(app, ["profiles", "export", "--format", "json", "--workers", "1"])
+                assert result.exit_code == 0
+                assert len(list(Path(tmpdir).glob("parliament_export_*.json"))) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Search query language and planner testing."""
+
+import tempfile
+import os
+import random
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+from typer.testing import CliRunner
+from parliament_of_bruce.cli import app
+from parliament_of_bruce.query import QueryError, parse_query
+from parliament_of_bruce.services import ParliamentService
+from parliament_of_bruce.storage import Storage
+
+runner = CliRunner()
+
+# (date, session type, responses); Phoenix reigns for the first three, Ember after
+SESSIONS = [
+    ("2025-01-05", "daily", {"short_term": "Running late, coffee again", "final_policy": "Walk first"}),
+    ("2025-01-12", "weekly", {"purpose": "Write the book", "final_policy": "Bad sleep ruins everything"}),
+    ("2025-02-02", "weekly", {"purpose": "Book chapter two", "short_term": "Excuses, excuses"}),
+    ("2025-03-01", "daily", {"short_term": "Coffee with friends", "final_policy": "Sleep by eleven"}),
+    ("2025-03-20", "weekly", {"purpose": "Finish the book", "final_policy": "Bad sleep again, no more coffee"}),
+]
+
+
+def make_service(tmpdir) -> ParliamentService:
+    service = ParliamentService(Storage(Path(tmpdir)))
+    with patch("parliament_of_bruce.services.datetime") as clock:
+        for i, (day, session_type, responses) in enumerate(SESSIONS):
+            clock.now.return_value = datetime.fromisoformat(day + "T09:00:00")
+            if i == 0:
+                service.create_reigning_bruce("Phoenix", "Rebirth")
+            elif i == 3:
+                service.end_reigning_bruce("Done")
+                service.create_reigning_bruce("Ember", "Slow burn")
+            service.create_session(session_type, responses)
+    return service
+
+
+def positions(service, query, seat=None):
+    index = {entry.id: i for i, entry in enumerate(service.state.journal_entries)}
+    return [index[entry.id] for entry, _ in service.search_entries(query, seat)]
+
+
+class TestQueryParsing:
+    """Test parse_query."""
+
+    def test_parse(self):
+        query = parse_query('Coffee "bad sleep" seat:purpose bruce:Phoenix type:Weekly after:2025-01 before:2025-03-01 -excuses -type:daily')
+        assert query.terms == ["coffee", "bad sleep"]
+        assert query.excluded == ["excuses"]
+        assert query.seats == ["purpose"]
+        assert query.bruces == ["phoenix"]
+        assert query.types == ["weekly"]
+        assert query.excluded_types == ["daily"]
+        assert query.start < query.end
+
+    def test_apostrophes_backslashes_and_unpaired_quotes_are_literal(self):
+        assert parse_query("don't").terms == ["don't"]
+        assert parse_query("I'm tired").terms == ["i'm", "tired"]
+        assert parse_query(r"C:\temp -a\b").terms == ["c:\\temp"]
+        assert parse_query(r"C:\temp -a\b").excluded == ["a\\b"]
+        assert parse_query('"unbalanced sleep').terms == ['"unbalanced', "sleep"]
+        query = parse_query('-"no more" bruce:"Old One" "" it\'s')
+        assert query.excluded == ["no more"] and query.bruces == ["old one"] and query.terms == ["it's"]
+
+    @pytest.mark.parametrize("text", ["after:2025-13", "after:soon", "seat:", "-after:2025-01", "seat:elbow"])
+    def test_invalid(self, text):
+        with pytest.raises(QueryError):
+            parse_query(text, ["short_term", "purpose"])
+
+
+class TestQueryPlanner:
+    """Test query results and the plans that produce them."""
+
+    def test_predicates(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = make_service(tmpdir)
+            assert positions(service, "coffee") == [0, 3, 4]
+            assert positions(service, "run") == [0]  # substrings still match, like plain search
+            assert positions(service, '"bad sleep"') == [1, 4]
+            assert positions(service, "book seat:purpose") == [1, 2, 4]
+            assert positions(service, "coffee", seat="policy") == [4]
+            assert positions(service, "type:weekly") == [1, 2, 4]
+            assert positions(service, "bruce:phoenix") == [0, 1, 2]
+            assert positions(service, "-bruce:Phoenix -type:daily") == [4]
+            assert positions(service, "after:2025-02 before:2025-03-20") == [2, 3]
+            assert positions(service, "book -excuses") == [1, 4]
+            assert positions(service, "") == [0, 1, 2, 3, 4]
+            with pytest.raises(QueryError):
+                positions(service, "bruce:Nobody")
+
+    def test_most_selective_index_first(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = make_service(tmpdir)
+            matches, plan = service.search_with_plan("coffee type:weekly after:2025-03-15 -friends")
+            assert [entry.final_policy for entry, _ in matches] == ["Bad sleep again, no more coffee"]
+            assert [(name, how) for name, _, how in plan] == [
+                ("date", "index"), ("type:weekly", "index"), ("'coffee'", "index"),
+                ("'coffee'", "check"), ("-'friends'", "check")]
+            assert plan[0][1] == 1
+
+    def test_matches_brute_force(self):
+        """Test the planner agrees with checking every entry on random data."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(Path(tmpdir)))
+            words = ["coffee", "sleep", "run", "book", "walk", "the", "a", "i'm"]
+            rng = random.Random(7)
+            with service.batch():
+                for i in range(200):
+                    text = " ".join(rng.choice(words) for _ in range(4))
+                    service.create_session(rng.choice(["daily", "weekly"]), {"short_term": text, "purpose": rng.choice(words)})
+            entries = service.state.journal_entries
+            for query, check in [
+                ("coffee walk", lambda e: "coffee" in e.short_term + e.purpose and "walk" in e.short_term + e.purpose),
+                ("he", lambda e: "he" in (e.short_term + " " + e.purpose)),
+                ("m seat:purpose type:daily", lambda e: "m" in e.purpose and e.session_type == "daily"),
+                ('"sleep run" -book', lambda e: "sleep run" in e.short_term and "book" not in e.short_term + e.purpose),
+            ]:
+                expected = [i for i, e in enumerate(entries) if check(e)]
+                assert positions(service, query) == expected, query
+
+
+class TestLiteralSearches:
+    """Test everyday text that is not query syntax."""
+
+    def test_apostrophes_and_backslashes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(Path(tmpdir)))
+            for policy in ["I don't know yet", "I'm tired of waiting", r"Notes in C:\temp\plans", 'She said "go"']:
+                service.create_session("daily", {"final_policy": policy})
+            assert positions(service, "don't") == [0]
+            assert positions(service, "I'm tired") == [1]
+            assert positions(service, r"C:\temp") == [2]
+            assert positions(service, '"go') == [3]
+
+    def test_command(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                ParliamentService(Storage(Path(tmpdir) / ".parliament_of_bruce")).create_session(
+                    "daily", {"final_policy": "I don't sleep enough"})
+                result = runner.invoke(app, ["search", "don't"])
+                assert result.exit_code == 0
+                assert "Found 1 entries" in result.stdout
+
+
+class TestSearchQueryCommand:
+    """Test the search command with queries."""
+
+    def test_explain_and_errors(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                make_service(Path(tmpdir) / ".parliament_of_bruce")
+
+                result = runner.invoke(app, ["search", "sleep type:weekly", "--explain"])
+                assert result.exit_code == 0
+                assert "index" in result.stdout and "type:weekly" in result.stdout
+                assert "Found 2 entries" in result.stdout
+
+                result = runner.invoke(app, ["search", "after:someday"])
+                assert result.exit_code == 1
+                assert "Invalid date 'someday'" in result.stdout
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""TF-IDF related-entry index testing."""
+
+import tempfile
+import os
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+from typer.testing import CliRunner
+from parliament_of_bruce import related
+from parliament_of_bruce.cli import app
+from parliament_of_bruce.related import TfidfIndex, tokenize
+from parliament_of_bruce.services import ParliamentService
+from parliament_of_bruce.storage import Storage
+
+runner = CliRunner()
+
+SESSIONS = [
+    {"short_term": "Slept badly, coffee all morning", "final_policy": "Sleep before midnight"},
+    {"short_term": "Gym session and a long run", "purpose": "Strength and health", "final_policy": "Train three times a week"},
+    {"short_term": "Tired again, too much coffee", "mid_term": "Fix my sleep schedule", "final_policy": "No coffee after noon"},
+    {"long_term": "Save for a house", "final_policy": "Budget every Sunday"},
+]
+
+
+def make_service(tmpdir) -> ParliamentService:
+    service = ParliamentService(Storage(Path(tmpdir)))
+    for responses in SESSIONS:
+        service.create_session("daily", responses)
+    return service
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request):
+    """Run a test with NumPy and with the pure-Python fallback."""
+    if request.param == "python":
+        with patch.object(related, "np", None):
+            yield request.param
+    else:
+        yield request.param
+
+
+class TestTfidfIndex:
+    """Test the incremental index and nearest-neighbour lookups."""
+
+    def test_tokenize(self):
+        assert tokenize("I'm TIRED of the coffee, again & again!") == ["tired", "coffee"]
+
+    def test_related_to_entry_and_text(self, backend):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = make_service(tmpdir)
+            entries = service.state.journal_entries
+
+            matches = service.related_entries(entries[0].id)
+            assert matches[0][0] is entries[2]
+            assert all(entry is not entries[0] for entry, _ in matches)
+            assert 0 < matches[0][1] <= 1
+
+            matches = service.related_entries("saving for a house", count=1)
+            assert [entry for entry, _ in matches] == [entries[3]]
+            assert service.related_entries("zzz unknown words") == []
+
+    def test_scores_match_between_backends(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            index = make_service(tmpdir).related_index()
+            query = index.vectorize("coffee sleep gym")
+            fast = index.most_similar(query, 3)
+            with patch.object(related, "np", None):
+                index._cache = None
+                slow = index.most_similar(query, 3)
+            assert [p for p, _ in fast] == [p for p, _ in slow]
+            assert [s for _, s in fast] == pytest.approx([s for _, s in slow])
+
+    def test_updated_on_create_session_and_saved(self):
+        """Test new sessions are indexed incrementally and the index persists."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = make_service(tmpdir)
+            index = service.related_index()
+            assert len(index) == len(SESSIONS)
+            assert service.storage.related_file.exists()
+
+            entry = service.create_session("weekly", {"short_term": "Mortgage and house hunting"})
+            assert len(service.related_index()) == len(SESSIONS) + 1
+            assert service.related_entries(entry.id, count=1)[0][0] is service.state.journal_entries[3]
+
+            saved = Storage(Path(tmpdir)).load_related()
+            assert len(saved) == len(SESSIONS) + 1
+            assert saved.vocabulary == index.vocabulary
+            assert list(saved.values) == list(index.values)
+
+    def test_stale_saved_index_is_rebuilt(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = make_service(tmpdir)
+            stale = TfidfIndex.from_entries(service.state.journal_entries[1:])
+            service.storage.save_related(stale)
+
+            fresh = ParliamentService(Storage(Path(tmpdir))).related_index()
+            assert len(fresh) == len(SESSIONS)
+            assert fresh.last_id == service.state.journal_entries[-1].id
+
+
+class TestRelatedCommands:
+    """Test pob related and session --hints."""
+
+    def test_related_command(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                service = make_service(Path(tmpdir) / ".parliament_of_bruce")
+                first = service.state.journal_entries[0]
+
+                result = runner.invoke(app, ["related", first.id, "--count", "1"])
+                assert result.exit_code == 0
+                assert f"Entries related to entry {first.id}" in result.stdout
+                assert "No coffee after noon" in result.stdout
+
+                result = runner.invoke(app, ["related", "quantum chromodynamics"])
+                assert "No related entries found" in result.stdout
+
+    def test_session_hints(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                runner.invoke(app, ["reign", "new"], input="Hint Bruce\nTesting\n")
+                make_service(Path(tmpdir) / ".parliament_of_bruce")
+
+                answers = "Coffee and bad sleep\nx\nx\nx\nx\nx\nn\nRest\n"
+                result = runner.invoke(app, ["session", "daily", "--hints"], input=answers)
+                assert result.exit_code == 0
+                assert "Past sessions that sounded like this one" in result.stdout
+                assert "Sleep before midnight" in result.stdout
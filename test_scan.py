@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Parallel regular-expression scan testing."""
+
+import tempfile
+import os
+import re
+from pathlib import Path
+from unittest.mock import patch
+from typer.testing import CliRunner
+from parliament_of_bruce import scan
+from parliament_of_bruce.cli import app
+from parliament_of_bruce.scan import scan_range, split_ranges
+from parliament_of_bruce.services import ParliamentService
+from parliament_of_bruce.storage import Storage
+
+runner = CliRunner()
+
+
+def make_service(tmpdir, count=40) -> ParliamentService:
+    service = ParliamentService(Storage(Path(tmpdir)))
+    with service.batch():
+        for i in range(count):
+            service.create_session("daily", {
+                "short_term": f"Day {i}: coffee then {'a long walk before' if i % 3 else 'no'} sleep",
+                "final_policy": f"Policy {i}\nsecond line — ünïcode",
+            })
+    return service
+
+
+class TestJournalLog:
+    """Test the append-only journal log the scan reads."""
+
+    def test_sync_appends_and_rewrites(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = make_service(tmpdir, 3)
+            service.sync_journal_log()
+            assert service.storage.journal_tail()["n"] == 2
+
+            # Once the log exists, saves append to it
+            with patch.object(service.storage, "append_journal", wraps=service.storage.append_journal) as append:
+                service.create_session("weekly", {"short_term": "Fourth"})
+            assert append.call_args.kwargs.get("rewrite", False) is False
+            assert service.storage.journal_tail()["short_term"] == "Fourth"
+            assert len(service.storage.journal_file.read_text(encoding="utf-8").splitlines()) == 4
+
+            # A torn last line is not trusted; the log is rebuilt
+            with open(service.storage.journal_file, "a") as f:
+                f.write('{"n": 4, "id": "torn')
+            assert service.storage.journal_tail() is None
+            service.sync_journal_log()
+            assert len(service.storage.journal_file.read_text(encoding="utf-8").splitlines()) == 4
+
+
+class TestParallelScan:
+    """Test byte-range scans and their merge."""
+
+    def test_every_line_scanned_once_whatever_the_ranges(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = make_service(tmpdir)
+            service.sync_journal_log()
+            path = str(service.storage.journal_file)
+            size = os.path.getsize(path)
+            fields = list(service.SEARCH_FIELDS.values())
+
+            whole = scan_range(path, 0, size, "coffee", re.IGNORECASE, fields)
+            assert [n for n, _ in whole] == list(range(40))
+            for count in (2, 7, 64, size):
+                ranges = split_ranges(size, count)
+                assert ranges[0][0] == 0 and ranges[-1][1] == size
+                pieces = [m for start, end in ranges for m in scan_range(path, start, end, "coffee", re.IGNORECASE, fields)]
+                assert pieces == whole
+
+    def test_regex_search_in_a_pool(self):
+        """Test a pooled scan streams the same matches, oldest first."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = make_service(tmpdir)
+            pattern = r"\bcoffee\W+(?:\w+\W+){0,3}?sleep\b"
+            local = [(e.id, found) for e, found in service.regex_search(pattern, workers=1)]
+            with patch.object(scan, "MIN_CHUNK_BYTES", 64):
+                pooled = [(e.id, found) for e, found in service.regex_search(pattern, workers=2)]
+            assert pooled == local
+            expected = [e.id for i, e in enumerate(service.state.journal_entries) if i % 3 == 0]
+            assert [entry_id for entry_id, _ in local] == expected
+            assert local[0][1] == [("Short-Term", "Day 0: coffee then no sleep")]
+
+            matches = list(service.regex_search(r"^second line", seat="policy"))
+            assert matches == []  # ^ anchors to the start of the field, not of a line
+            matches = list(service.regex_search(r"(?m)^second line — ünïcode$", seat="policy"))
+            assert len(matches) == 40
+
+
+class TestRegexCommand:
+    """Test search --regex."""
+
+    def test_regex_command(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                make_service(Path(tmpdir) / ".parliament_of_bruce", 6)
+
+                result = runner.invoke(app, ["search", r"POLICY [45]\b", "--regex", "--seat", "policy"])
+                assert result.exit_code == 0
+                assert "Policy 4" in result.stdout and "Policy 5" in result.stdout
+                assert "2 matching entries" in result.stdout
+
+                result = runner.invoke(app, ["search", "POLICY", "--regex", "--case-sensitive"])
+                assert "No matches found" in result.stdout
+
+                result = runner.invoke(app, ["search", "(unclosed", "--regex"])
+                assert result.exit_code == 1
+                assert "Invalid regular expression" in result.stdout
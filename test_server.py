@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""HTTP/JSON API server testing."""
+
+import http.client
+import json
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+from parliament_of_bruce.cache import StateCache
+from parliament_of_bruce.server import ParliamentAPI, make_server
+from parliament_of_bruce.services import ParliamentService
+from parliament_of_bruce.storage import Storage
+
+
+@pytest.fixture
+def served():
+    """A running server over a fresh parliament, and a client connection to it."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = Storage(data_dir=Path(tmpdir))
+        ParliamentService(storage).create_reigning_bruce("Server Bruce", "Testing")
+        server = make_server(storage, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+        yield server, conn
+        conn.close()
+        server.shutdown()
+        server.server_close()
+
+
+def request(conn, method, path, body=None, headers=None):
+    """Send a request on a kept-alive connection; return (status, headers, json)."""
+    headers = dict(headers or {})
+    data = None
+    if body is not None:
+        data = json.dumps(body).encode("utf-8")
+        headers["Content-Type"] = "application/json"
+    conn.request(method, path, body=data, headers=headers)
+    response = conn.getresponse()
+    raw = response.read()
+    return response.status, response, json.loads(raw) if raw else None
+
+
+class TestServer:
+    """Test the JSON endpoints."""
+
+    def test_session_and_read(self, served):
+        """Sessions posted over HTTP are recorded and readable on the same connection."""
+        server, conn = served
+        for i in range(3):
+            status, _, body = request(conn, "POST", "/session", {"type": "daily", "responses": {"purpose": f"Aim {i}"}, "final_policy": f"Policy {i}"})
+            assert status == 201
+            assert body["entry"]["final_policy"] == f"Policy {i}"
+
+        status, _, page = request(conn, "GET", "/read?limit=2")
+        assert status == 200
+        assert page["total"] == 3
+        assert [item["final_policy"] for item in page["items"]] == ["Policy 2", "Policy 1"]
+        assert page["next_offset"] == 2
+
+        status, _, page = request(conn, "GET", "/read?limit=2&offset=2&full=1")
+        assert [item["purpose"] for item in page["items"]] == ["Aim 0"]
+        assert page["next_offset"] is None
+
+        assert len(ParliamentService(Storage(data_dir=server.api.storage.data_dir)).state.journal_entries) == 3
+
+    def test_conditional_get(self, served):
+        """Polling with the ETag gets 304 until the state changes."""
+        _, conn = served
+        status, response, _ = request(conn, "GET", "/stats")
+        etag = response.getheader("ETag")
+        assert status == 200 and etag
+
+        status, response, body = request(conn, "GET", "/status", headers={"If-None-Match": etag})
+        assert status == 304 and body is None
+
+        request(conn, "POST", "/vote", {"topic": "Move?", "votes": {"ultimate": "yes", "purpose": "yes", "long_term": "yes"}})
+        status, response, body = request(conn, "GET", "/stats", headers={"If-None-Match": etag})
+        assert status == 200
+        assert response.getheader("ETag") != etag
+        assert body["decisions"] == 1 and body["passed"] == 1
+
+    def test_sees_writes_from_other_processes(self, served):
+        """A change to the data file made elsewhere starts a new generation."""
+        server, conn = served
+        _, response, _ = request(conn, "GET", "/timeline")
+        etag = response.getheader("ETag")
+
+        other = ParliamentService(Storage(data_dir=server.api.storage.data_dir))
+        other.create_reigning_bruce("Elsewhere Bruce", "Another process")
+
+        status, _, body = request(conn, "GET", "/timeline", headers={"If-None-Match": etag})
+        assert status == 200
+        assert [bruce["name"] for bruce in body["bruces"]] == ["Server Bruce", "Elsewhere Bruce"]
+
+    def test_search(self, served):
+        """Test GET /search with and without a seat."""
+        _, conn = served
+        request(conn, "POST", "/session", {"responses": {"short_term": "Coffee first"}, "final_policy": "Walk"})
+        request(conn, "POST", "/session", {"responses": {"short_term": "Tea"}, "final_policy": "Coffee later"})
+
+        _, _, body = request(conn, "GET", "/search?q=coffee")
+        assert body["total"] == 2
+        _, _, body = request(conn, "GET", "/search?q=coffee&seat=policy")
+        assert body["total"] == 1
+        assert body["items"][0]["matches"] == [{"field": "Policy", "context": "Coffee later"}]
+
+    def test_errors(self, served):
+        """Bad requests get JSON errors without closing the connection."""
+        _, conn = served
+        assert request(conn, "GET", "/nowhere")[0] == 404
+        assert request(conn, "GET", "/status?window=2d")[0] == 400
+        assert request(conn, "GET", "/read?date=2025-13")[0] == 400
+        assert request(conn, "GET", "/read?limit=many")[0] == 400
+        status, _, body = request(conn, "GET", "/read?limit=0")
+        assert status == 400 and "at least 1" in body["error"]
+        assert request(conn, "GET", "/read?offset=-1")[0] == 400
+        assert request(conn, "GET", "/search?q=x&seat=elbow")[0] == 400
+        status, _, body = request(conn, "POST", "/session", {"responses": {"elbow": "x"}})
+        assert status == 400 and "Unknown seat" in body["error"]
+        assert request(conn, "POST", "/vote", {"topic": "x", "entry_id": "missing"})[0] == 400
+        assert request(conn, "GET", "/stats")[0] == 200
+
+    def test_failed_write_is_not_served(self):
+        """A write that fails halfway is dropped from memory and from the state cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = Storage(data_dir=Path(tmpdir), cache=StateCache())
+            ParliamentService(storage).create_reigning_bruce("Server Bruce", "Testing")
+            api = ParliamentAPI(storage)
+            # The entry is appended in memory, then the write fails before saving
+            with patch.object(ParliamentService, "_index_entry", side_effect=RuntimeError("disk on fire")), \
+                    patch.object(storage, "discard_cached", wraps=storage.discard_cached) as discard:
+                with pytest.raises(RuntimeError):
+                    api.post("/session", {"type": "daily", "final_policy": "Half written"})
+            discard.assert_called()
+            _, _, body = api.get("/read", {})
+            assert json.loads(body)["total"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
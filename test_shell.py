@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Interactive shell testing."""
+
+import tempfile
+import os
+from unittest.mock import patch
+import typer
+from parliament_of_bruce import cli
+from parliament_of_bruce.services import ParliamentService
+from parliament_of_bruce.shell import ParliamentShell
+from parliament_of_bruce.storage import Storage
+
+
+def make_shell(output):
+    return ParliamentShell(typer.main.get_command(cli.app), None, cli.warm_service, echo=output.append)
+
+
+class TestShell:
+    """Test command dispatch and completion in pob shell."""
+
+    def test_commands_share_one_service(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                ParliamentService(Storage.for_profile(None)).create_reigning_bruce("Shell Bruce", "Testing")
+                output = []
+                shell = make_shell(output)
+                try:
+                    shell.onecmd("add-voice Grief -d Mourning")
+                    service = cli.warm_service["service"]
+                    assert len(service.state.temporary_bruces) == 1
+
+                    with patch.object(cli, "ParliamentService") as fresh:
+                        shell.onecmd("voices")
+                        shell.onecmd('search "no such text"')
+                    fresh.assert_not_called()
+                    assert cli.warm_service["service"] is service
+
+                    # A write from another process is picked up before the next command
+                    other = ParliamentService(Storage.for_profile(None))
+                    other.add_temporary_bruce("Hope", "Looking ahead")
+                    shell.onecmd("voices")
+                    assert cli.warm_service["service"] is not service
+                    assert len(cli.warm_service["service"].state.temporary_bruces) == 2
+
+                    assert shell.onecmd("shell") is False
+                    assert "✗ Already in the shell" in output
+                    shell.onecmd("search 'unbalanced")  # reported, not raised
+                    assert shell.onecmd("search --bogus") is False
+                    assert shell.onecmd("exit") is True
+                finally:
+                    shell.close()
+                assert cli.warm_service["service"] is None
+
+    def test_failed_command_leaves_no_half_applied_state(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                ParliamentService(Storage.for_profile(None)).create_reigning_bruce("Shell Bruce", "Testing")
+                output = []
+                shell = make_shell(output)
+                try:
+                    shell.onecmd("voices")
+                    # The voice is added in memory, then the command fails before saving
+                    with patch.object(ParliamentService, "_note_voice_deadlines", side_effect=RuntimeError("disk on fire")), \
+                            patch.object(shell.storage, "discard_cached", wraps=shell.storage.discard_cached) as discard:
+                        shell.onecmd("add-voice Grief -d Mourning")
+                    assert "✗ RuntimeError: disk on fire" in output
+                    discard.assert_called_once()
+                    assert cli.warm_service["service"] is None
+
+                    shell.onecmd("voices")
+                    assert cli.warm_service["service"].state.temporary_bruces == {}
+                    assert ParliamentService(Storage.for_profile(None)).state.temporary_bruces == {}
+                finally:
+                    shell.close()
+
+    def test_completion(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                service = ParliamentService(Storage.for_profile(None))
+                voice = service.add_temporary_bruce("Grief", "Mourning")
+                service.create_session("weekly", {"purpose": "Write"})
+                shell = make_shell([])
+                try:
+                    assert shell.completenames("sea") == ["search"]
+                    assert "exit" in shell.completenames("")
+                    assert shell.completedefault("--hi", "voices --hi", 7, 11) == ["--history"]
+                    assert shell.completedefault(voice.id[:3], f"voices --history {voice.id[:3]}", 17, 20) == [voice.id]
+                    assert shell.completedefault("seat:p", "search seat:p", 7, 13) == ["seat:policy", "seat:purpose"]
+                    assert shell.completedefault("type:", "search type:", 7, 12) == ["type:weekly"]
+                    assert "short_term" in shell.completedefault("sh", "search coffee --seat sh", 21, 23)
+                finally:
+                    shell.close()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""Vote outcome table and simulation testing."""
+
+import tempfile
+import os
+import json
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+from typer.testing import CliRunner
+from parliament_of_bruce import voting
+from parliament_of_bruce.cli import app
+from parliament_of_bruce.seats import DEFAULT_SEATS, SeatError
+from parliament_of_bruce.services import ParliamentService
+from parliament_of_bruce.storage import Storage
+from parliament_of_bruce.voting import OutcomeTable, sweep
+
+runner = CliRunner()
+
+WEIGHTS = {"ShortTerm": 1, "MidTerm": 2, "LongTerm": 3, "Purpose": 4, "Ultimate": 5, "Reigning": 3}
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    """Run each test against the pure-Python and NumPy code paths."""
+    if request.param == "numpy":
+        numpy = pytest.importorskip("numpy")
+        monkeypatch.setattr(voting, "np", numpy)
+    else:
+        monkeypatch.setattr(voting, "np", None)
+    return request.param
+
+
+class TestOutcomeTable:
+    """Test the precomputed outcome table."""
+
+    def test_table_matches_weighted_tally(self):
+        """Every combination's score equals the sum of yes weights."""
+        table = OutcomeTable(WEIGHTS, 10)
+        assert len(table) == 64
+        for mask in range(64):
+            expected = sum(w for i, w in enumerate(WEIGHTS.values()) if mask & (1 << i))
+            assert table.scores[mask] == expected
+            assert table.passes[mask] == (expected >= 10)
+
+    def test_vector_formats(self, backend):
+        """Masks, y/n strings and seat mappings are all accepted."""
+        table = OutcomeTable(WEIGHTS, 10)
+        results = table.simulate([
+            0b010000,
+            "nnnyyn",
+            {"Purpose": "yes", "Ultimate": "y", "ShortTerm": "no"},
+        ])
+        assert [score for _, score, _ in results] == [5, 9, 9]
+        assert [passed for _, _, passed in results] == [False, False, False]
+        with pytest.raises(ValueError):
+            table.mask_for("yyy")
+
+    def test_pivotal_seats(self):
+        """Pivotal seats flip the outcome on their own."""
+        table = OutcomeTable(WEIGHTS, 10)
+        # Purpose + Ultimate + ShortTerm = 10: every yes voter is pivotal
+        assert table.pivotal_seats("ynnyyn") == ["ShortTerm", "Purpose", "Ultimate"]
+
+    def test_power_indices(self, backend):
+        """Power indices are normalized and ordered by weight."""
+        table = OutcomeTable(WEIGHTS, 10)
+        banzhaf = table.banzhaf()
+        shapley = table.shapley()
+        assert sum(banzhaf.values()) == pytest.approx(1.0)
+        assert sum(shapley.values()) == pytest.approx(1.0)
+        assert shapley["Ultimate"] > shapley["Purpose"] > shapley["LongTerm"] > shapley["ShortTerm"]
+        assert shapley["LongTerm"] == pytest.approx(shapley["Reigning"])
+
+    def test_sweep_matches_single_configurations(self, backend):
+        """A sweep gives the same indices as evaluating each configuration alone."""
+        configs = [((1, 1, 1, 1, 1, 1), 4), ((1, 2, 3, 4, 5, 3), 10), ((0, 0, 0, 0, 18, 0), 10)]
+        results = sweep(configs, tuple(WEIGHTS))
+        assert results[0]["shapley"]["ShortTerm"] == pytest.approx(1 / 6)
+        assert results[1]["banzhaf"] == pytest.approx(OutcomeTable(WEIGHTS, 10).banzhaf())
+        assert results[2]["banzhaf"]["Ultimate"] == pytest.approx(1.0)
+
+
+class TestVoteSimulateCommand:
+    """Test pob vote simulate."""
+
+    def test_simulate_power_table(self):
+        """Test simulate without a Reigning Bruce shows power indices."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                result = runner.invoke(app, ["vote", "simulate", "--table"])
+                assert result.exit_code == 0
+                assert "Banzhaf" in result.stdout
+                assert "combinations pass" in result.stdout
+                assert "Outcome Table" in result.stdout
+
+    def test_simulate_vectors_does_not_record(self):
+        """Test simulated votes are evaluated but not stored."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                vectors = ["yyyyyy", {"ShortTerm": "yes"}]
+                result = runner.invoke(app, ["vote", "simulate", "--vectors", "-"], input=json.dumps(vectors))
+                assert result.exit_code == 0
+                assert "18/18" in result.stdout
+                assert "PASS" in result.stdout and "FAIL" in result.stdout
+
+                result = runner.invoke(app, ["stats"])
+                assert "No data yet" in result.stdout
+
+    @pytest.mark.parametrize("vectors", [[[1, 0]], [{"Purpose": 1}], [True], [2.5], {"Purpose": "yes"}])
+    def test_simulate_rejects_malformed_vectors(self, vectors):
+        """Test malformed vote vectors are reported, not raised."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                result = runner.invoke(app, ["vote", "simulate", "--vectors", "-"], input=json.dumps(vectors))
+                assert result.exit_code == 1
+                assert "Invalid vote vector" in result.stdout
+                assert result.exception is None or isinstance(result.exception, SystemExit)
+
+    def test_simulate_sweep(self):
+        """Test sweeping weight/threshold configurations."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                configs = [{"weights": dict(WEIGHTS, Purpose=5, Ultimate=4), "threshold": t} for t in range(1, 19)]
+                sweep_path = os.path.join(tmpdir, "sweep.json")
+                with open(sweep_path, 'w') as f:
+                    json.dump(configs, f)
+                result = runner.invoke(app, ["vote", "simulate", "--sweep", sweep_path])
+                assert result.exit_code == 0
+                assert "18 configurations" in result.stdout
+
+    @pytest.mark.parametrize("config", [
+        {"weights": [3, 2, 5], "threshold": 9},
+        {"weights": 7, "threshold": 9},
+        {"weights": {"Purpose": "five"}, "threshold": 9},
+        {"weights": {"Elbow": 5}, "threshold": 9},
+        {"weights": {"Purpose": 5}},
+    ])
+    def test_simulate_sweep_rejects_bad_configurations(self, config):
+        """Test malformed sweep configurations are reported, not raised."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                result = runner.invoke(app, ["vote", "simulate", "--sweep", "-"], input=json.dumps([config]))
+                assert result.exit_code == 1
+                assert "Invalid sweep configuration" in result.stdout
+                assert result.exception is None or isinstance(result.exception, SystemExit)
+
+
+class TestBatchDecisions:
+    """Test deciding many topics in one call."""
+
+    def test_decide_batch_saves_once(self):
+        """All decisions are appended together with a single save."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            items = [
+                (f"Topic {i}", ["Yes", "No"], {"Purpose": "yes", "Ultimate": "yes", "ShortTerm": "yes" if i % 2 else "no"})
+                for i in range(500)
+            ]
+            with patch.object(service.storage, "save", wraps=service.storage.save) as save:
+                decisions = service.decide_batch(items)
+            assert save.call_count == 1
+            assert len(decisions) == 500
+            assert [d.passed for d in decisions[:2]] == [False, True]
+
+            reloaded = ParliamentService(Storage(data_dir=Path(tmpdir)))
+            assert len(reloaded.state.decisions) == 500
+
+    def test_vote_batch_command(self):
+        """Test pob vote --batch prints a summary table."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                runner.invoke(app, ["reign", "new"], input="Test Bruce\nReason\n")
+                topics = [
+                    {"topic": "Run a marathon?", "votes": {"LongTerm": "yes", "Purpose": "yes", "Ultimate": "yes"}},
+                    {"topic": "Buy a jet ski?", "votes": {"short_term": "yes"}},
+                ]
+                result = runner.invoke(app, ["vote", "--batch", "-"], input=json.dumps(topics))
+                assert result.exit_code == 0
+                assert "Batch Decisions (2)" in result.stdout
+                assert "1 passed, 1 failed" in result.stdout
+
+                result = runner.invoke(app, ["stats"])
+                assert result.exit_code == 0
+
+    def test_vote_batch_unknown_seat(self):
+        """Test a batch with an unknown seat records nothing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(os.environ, {'HOME': tmpdir}):
+                runner.invoke(app, ["reign", "new"], input="Test Bruce\nReason\n")
+                topics = [{"topic": "Anything?", "votes": {"Nobody": "yes"}}]
+                result = runner.invoke(app, ["vote", "--batch", "-"], input=json.dumps(topics))
+                assert result.exit_code == 1
+                assert "Unknown seat" in result.stdout
+
+
+
+class TestSeatRegistry:
+    """Test the seat registry and per-profile seat overrides."""
+    
+    def test_default_registry(self):
+        """Test the default seats drive weights, vote order and aliases."""
+        assert dict(DEFAULT_SEATS.weights) == WEIGHTS
+        assert DEFAULT_SEATS.max_score == 18 and DEFAULT_SEATS.threshold == 10
+        assert DEFAULT_SEATS.resolve("short_term") == DEFAULT_SEATS.resolve("ShortTerm") == "ShortTerm"
+        assert DEFAULT_SEATS.search_fields["policy"] == ("Policy", "final_policy")
+        with pytest.raises(SeatError):
+            DEFAULT_SEATS.resolve("elbow")
+    
+    def test_registry_is_immutable(self):
+        """Test seats and lookup tables cannot be changed in place."""
+        with pytest.raises(AttributeError):
+            DEFAULT_SEATS.seats[0].weight = 9
+        with pytest.raises(AttributeError):
+            DEFAULT_SEATS.threshold = 1
+        with pytest.raises(TypeError):
+            DEFAULT_SEATS.weights["Purpose"] = 9
+    
+    def test_invalid_overrides(self):
+        """Test bad seat overrides are rejected."""
+        for data in [{"seats": {"elbow": {}}}, {"seats": {"purpose": {"field": "x"}}},
+                     {"seats": {"purpose": {"weight": -1}}}, {"threshold": 19}]:
+            with pytest.raises(SeatError):
+                DEFAULT_SEATS.with_overrides(data)
+    
+    def test_profile_seats(self):
+        """Test a profile's seats.json changes weights, threshold and prompts."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = Storage(Path(tmpdir))
+            with open(storage.seats_file, "w") as f:
+                json.dump({"threshold": 12, "seats": {"purpose": {"weight": 8, "prompt": "Why?"}}}, f)
+            service = ParliamentService(storage)
+            service.create_reigning_bruce("Custom Bruce", "Testing")
+            
+            assert service.MAX_SCORE == 22 and service.PASSING_THRESHOLD == 12
+            decision = service.vote_on_decision("Purpose only?", ["Yes", "No"], {"Purpose": "yes", "MidTerm": "yes", "ShortTerm": "yes"})
+            assert not decision.passed
+            decision = service.vote_on_decision("Purpose and more?", ["Yes", "No"], {"Purpose": "yes", "LongTerm": "yes", "ShortTerm": "yes"})
+            assert decision.passed
+            
+            prompts = {}
+            def collect(seat_key, seat_name, prompt, round_num, is_first_round):
+                prompts[seat_key] = prompt
+                return None if round_num > 1 else "x"
+            service.collect_rotating_session_responses("daily", collect)
+            assert prompts["Purpose"] == "Why?"
+            assert prompts["ShortTerm"] == DEFAULT_SEATS.by_key["ShortTerm"].prompt
+            assert service.state.seats["Purpose"].votes == 8
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])